@@ -1,22 +1,12 @@
 import streamlit as st
-import pandas as pd
-from utils.progress_tracker import ProgressTracker
-from utils.db_adapter import DatabaseAdapter
+from utils.tracker_backends import init_progress_tracker
 from utils.auth_manager import AuthManager
-import plotly.express as px
 
 # Initialize auth manager
 auth_manager = AuthManager()
 
-# Initialize session state with database support
-if 'progress_tracker' not in st.session_state:
-    # Try to use database, fallback to session state
-    try:
-        st.session_state.progress_tracker = DatabaseAdapter()
-        st.session_state.using_database = True
-    except Exception as e:
-        st.session_state.progress_tracker = ProgressTracker()
-        st.session_state.using_database = False
+# Pick the first available progress backend (Postgres, local SQLite, session state)
+init_progress_tracker()
 
 if 'current_user' not in st.session_state:
     st.session_state.current_user = "learner"
@@ -66,6 +56,8 @@ def main():
                 stats = st.session_state.progress_tracker.get_user_stats()
                 if stats.get('username'):
                     st.caption(f"User: {stats['username']}")
+        elif st.session_state.get('progress_backend') == 'sqlite':
+            st.info("Local Storage")
         else:
             st.warning("Session Storage")
         
@@ -123,12 +115,20 @@ def main():
             progress_data.append({'Category': category, 'Progress': category_progress})
         
         if progress_data:
-            df = pd.DataFrame(progress_data)
-            fig = px.bar(df, x='Category', y='Progress', 
-                        title='Progress by Topic',
-                        color='Progress',
-                        color_continuous_scale='viridis')
-            fig.update_layout(height=400)
+            # Loaded only when the chart is drawn; graph_objects takes plain lists, so
+            # the landing page never has to load pandas
+            import plotly.graph_objects as go
+            fig = go.Figure(go.Bar(
+                x=[row['Category'] for row in progress_data],
+                y=[row['Progress'] for row in progress_data],
+                marker=dict(
+                    color=[row['Progress'] for row in progress_data],
+                    colorscale='Viridis',
+                    showscale=True,
+                    colorbar=dict(title='Progress')
+                )
+            ))
+            fig.update_layout(title='Progress by Topic', height=400)
             st.plotly_chart(fig, use_container_width=True)
     
     with col3:
@@ -0,0 +1,67 @@
+"""
+Benchmark how long a cold Streamlit worker takes to serve each page.
+
+Every run starts a fresh interpreter, imports streamlit, then renders one page
+once, the way a new worker handles its first request. Prints the median time
+spent on the page itself (streamlit's own import excluded) and which heavy
+libraries the page pulled in.
+
+Usage: python benchmark_imports.py [--runs 5] [--pages app.py,pages/03_progress.py]
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# streamlit.testing loads plotly.graph_objects itself, so it is not listed
+HEAVY_MODULES = ('pandas', 'plotly.express', 'psycopg2')
+
+# Runs in the child interpreter; prints one JSON line with its timings
+_COLD_START = """
+import json, sys, time
+started = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+AppTest.from_file(sys.argv[1], default_timeout=60).run()
+served = time.perf_counter()
+print(json.dumps({
+    'streamlit': imported - started,
+    'page': served - imported,
+    'loaded': [name for name in sys.argv[2:] if name in sys.modules]
+}))
+"""
+
+
+def cold_start(page):
+    """Serve one page in a fresh interpreter, returns its timings"""
+    result = subprocess.run(
+        [sys.executable, '-c', _COLD_START, os.path.abspath(page), *HEAVY_MODULES],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time a cold worker serving each page")
+    parser.add_argument('--runs', type=int, default=5, help="cold starts per page")
+    parser.add_argument('--pages', default=None, help="comma-separated page files (default: app.py and pages/)")
+    args = parser.parse_args(argv)
+
+    pages = args.pages.split(',') if args.pages else ['app.py'] + sorted(glob.glob('pages/[0-9]*.py'))
+
+    for page in pages:
+        runs = [cold_start(page.strip()) for _ in range(args.runs)]
+        page_time = statistics.median(run['page'] for run in runs)
+        streamlit_time = statistics.median(run['streamlit'] for run in runs)
+        loaded = ', '.join(runs[-1]['loaded']) or '-'
+        print(f"{page:26} {page_time * 1000:8.1f} ms page {streamlit_time * 1000:8.1f} ms streamlit   loads: {loaded}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Benchmark the progress tracker backends against each other.
+
+Runs the same workload against every backend that starts here: a page render
+(the reads a page makes on every rerun) repeated many times, after completing
+every tutorial and exercise once. Prints the mean time per render and per
+completion, fastest backend first.
+
+Usage: python benchmark_trackers.py [--renders 200] [--backends postgres,sqlite,memory]
+"""
+import argparse
+import sys
+import tempfile
+import time
+import os
+import streamlit as st
+from data.tutorials import TUTORIALS
+from data.exercises import EXERCISES
+from utils import sqlite_tracker
+from utils.tracker_backends import BACKENDS
+
+
+def render(tracker):
+    """The tracker reads a page makes on every rerun"""
+    tracker.touch()
+    tracker.get_completed_tutorials_count()
+    tracker.get_completed_exercises_count()
+    tracker.get_overall_progress()
+    tracker.get_category_progress('Variables')
+    tracker.get_achievements()
+    tracker.is_tutorial_completed('variables')
+
+
+def run_workload(tracker, renders):
+    """Returns (seconds per render, seconds per completion)"""
+    # Completions first, so renders read a user that has progress stored
+    items = [(tracker.complete_tutorial, item_id, item['category']) for item_id, item in TUTORIALS.items()]
+    items += [(tracker.complete_exercise, item_id, item['category']) for item_id, item in EXERCISES.items()]
+    started = time.perf_counter()
+    for complete, item_id, category in items:
+        complete(item_id, category)
+    per_completion = (time.perf_counter() - started) / len(items)
+
+    started = time.perf_counter()
+    for _ in range(renders):
+        render(tracker)
+    per_render = (time.perf_counter() - started) / renders
+
+    return per_render, per_completion
+
+
+def benchmark(name, renders):
+    """Time one backend in a fresh session, or None if it cannot start here"""
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    factory, _ = BACKENDS[name]
+    try:
+        tracker = factory()
+    except Exception:
+        return None
+
+    try:
+        return run_workload(tracker, renders)
+    finally:
+        tracker.reset_progress()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare progress tracker backends")
+    parser.add_argument('--renders', type=int, default=200, help="page renders per backend")
+    parser.add_argument('--backends', default=','.join(sorted(BACKENDS)), help="comma-separated backend names")
+    args = parser.parse_args(argv)
+
+    # Never touch the real local progress file
+    scratch = tempfile.TemporaryDirectory()
+    sqlite_tracker._store = sqlite_tracker.SQLiteProgressStore(os.path.join(scratch.name, 'progress.sqlite3'))
+
+    results = {}
+    for name in args.backends.split(','):
+        timings = benchmark(name.strip(), args.renders)
+        if timings is None:
+            print(f"{name:10} unavailable")
+        else:
+            results[name] = timings
+
+    for name, (per_render, per_completion) in sorted(results.items(), key=lambda item: item[1][0]):
+        print(f"{name:10} {per_render * 1000:8.3f} ms/render {per_completion * 1000:8.3f} ms/completion")
+
+    scratch.cleanup()
+    return 0 if results else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
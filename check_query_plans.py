@@ -0,0 +1,249 @@
+"""
+Check that the hot tracker and forum queries use indexes.
+
+Seeds a large synthetic dataset inside a transaction, runs EXPLAIN on every
+hot query and rolls everything back. Exits with status 1 if any query plans
+a sequential scan on a table (or partition) of 1000 or more rows.
+
+Usage: python check_query_plans.py [--users 5000]
+"""
+import argparse
+import json
+import os
+import sys
+import psycopg2
+
+# Sequential scans of smaller relations (lookup tables, empty partitions) are fine
+MIN_SCANNED_ROWS = 1000
+
+SEED_SQL = """
+    INSERT INTO users (username, email, password_hash, full_name)
+    SELECT 'plan_user_' || g, 'plan_user_' || g || '@plan.check', '', 'Plan User'
+    FROM generate_series(1, %(users)s) g;
+
+    INSERT INTO user_progress (user_id, item_id, item_type, category, completed_at)
+    SELECT u.id, 'item_' || i, CASE WHEN i %% 2 = 0 THEN 'tutorial' ELSE 'exercise' END,
+           (ARRAY['Variables', 'Loops', 'Functions', 'Lists', 'Conditionals'])[1 + i %% 5],
+           now() - i * interval '1 hour'
+    FROM users u, generate_series(1, 15) i
+    WHERE u.username LIKE 'plan\\_user\\_%%';
+
+    INSERT INTO user_achievements (user_id, achievement_id, achievement_title, earned_at)
+    SELECT u.id, 'achievement_' || i, 'Achievement ' || i, now() - i * interval '1 day'
+    FROM users u, generate_series(1, 8) i
+    WHERE u.username LIKE 'plan\\_user\\_%%';
+
+    INSERT INTO code_submissions (user_id, exercise_id, code_hash, is_correct, attempts)
+    SELECT u.id, 'exercise_' || i, md5(u.id || ':' || i) || md5(i || ':' || u.id),
+           i %% 3 <> 0, 1 + i %% 4
+    FROM users u, generate_series(1, 10) i
+    WHERE u.username LIKE 'plan\\_user\\_%%';
+
+    INSERT INTO forum_posts (user_id, category_id, title, content, created_at)
+    SELECT u.id, (SELECT id FROM forum_categories ORDER BY id LIMIT 1 OFFSET (u.id + i) %% 6),
+           'Post ' || i, 'Content of post ' || i, now() - (u.id + i) * interval '1 minute'
+    FROM users u, generate_series(1, 4) i
+    WHERE u.username LIKE 'plan\\_user\\_%%';
+
+    INSERT INTO forum_replies (post_id, user_id, content, is_solution, created_at)
+    SELECT p.id, p.user_id, 'Reply ' || i, i = 1, p.created_at + i * interval '1 minute'
+    FROM forum_posts p, generate_series(1, 4) i;
+
+    INSERT INTO shared_solutions (user_id, exercise_id, title, code, likes)
+    SELECT u.id, 'exercise_' || i, 'Solution ' || i, 'print(' || i || ')', (u.id * i) %% 50
+    FROM users u, generate_series(1, 2) i
+    WHERE u.username LIKE 'plan\\_user\\_%%';
+
+    ANALYZE users, user_progress, user_achievements, code_submissions,
+            forum_categories, forum_posts, forum_replies, shared_solutions;
+"""
+
+# (name, query) pairs with the same shape as the queries in DatabaseAdapter and
+# ForumManager. %(user_id)s, %(post_id)s and %(category_id)s refer to seeded rows.
+HOT_QUERIES = [
+    ('progress upsert', """
+        INSERT INTO user_progress (user_id, item_id, item_type, category, completed_at)
+        VALUES (%(user_id)s, 'item_1', 'exercise', 'Loops', now())
+        ON CONFLICT (user_id, item_type, item_id) DO NOTHING
+        RETURNING id
+    """),
+    ('is item completed', """
+        SELECT id FROM user_progress
+        WHERE user_id = %(user_id)s AND item_id = 'item_2' AND item_type = 'tutorial'
+    """),
+    ('completed count by type', """
+        SELECT COUNT(*) FROM user_progress
+        WHERE user_id = %(user_id)s AND item_type = 'tutorial'
+    """),
+    ('category progress', """
+        SELECT COUNT(*) FROM user_progress
+        WHERE user_id = %(user_id)s AND category = 'Loops'
+    """),
+    ('overall progress', """
+        SELECT COUNT(*) FROM user_progress WHERE user_id = %(user_id)s
+    """),
+    ('achievement counters', """
+        SELECT COUNT(*) FILTER (WHERE item_type = 'tutorial'),
+               COUNT(*) FILTER (WHERE item_type = 'exercise'),
+               COUNT(*) FILTER (WHERE category = 'Loops'),
+               COUNT(*)
+        FROM user_progress
+        WHERE user_id = %(user_id)s
+    """),
+    ('favorite category', """
+        SELECT category, COUNT(*) as count
+        FROM user_progress
+        WHERE user_id = %(user_id)s
+        GROUP BY category
+        ORDER BY count DESC
+        LIMIT 1
+    """),
+    ('achievement earned check', """
+        SELECT id FROM user_achievements
+        WHERE user_id = %(user_id)s AND achievement_title = 'Achievement 3'
+    """),
+    ('achievement award', """
+        INSERT INTO user_achievements (user_id, achievement_id, achievement_title, earned_at)
+        SELECT %(user_id)s, r.achievement_id, r.title, now()
+        FROM unnest(ARRAY['a', 'b'], ARRAY['Title A', 'Title B']) AS r(achievement_id, title)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM user_achievements a
+            WHERE a.user_id = %(user_id)s AND a.achievement_title = r.title
+        )
+    """),
+    ('recent achievements', """
+        SELECT achievement_title FROM user_achievements
+        WHERE user_id = %(user_id)s ORDER BY earned_at DESC LIMIT 5
+    """),
+    ('submission stats', """
+        SELECT SUM(attempts), SUM(CASE WHEN is_correct THEN attempts ELSE 0 END)
+        FROM code_submissions
+        WHERE user_id = %(user_id)s
+    """),
+    ('submission fold', """
+        UPDATE code_submissions
+        SET attempts = attempts + 1, submitted_at = now()
+        WHERE user_id = %(user_id)s AND exercise_id = 'exercise_1' AND code_hash = repeat('0', 64)
+          AND submitted_at >= date_trunc('month', now())
+        RETURNING id
+    """),
+    ('forum posts', """
+        SELECT p.id, p.title, u.username, c.name,
+               (SELECT COUNT(*) FROM forum_replies r WHERE r.post_id = p.id) as reply_count
+        FROM forum_posts p
+        JOIN users u ON p.user_id = u.id
+        LEFT JOIN forum_categories c ON p.category_id = c.id
+        ORDER BY p.created_at DESC
+        LIMIT 20
+    """),
+    ('forum posts by category', """
+        SELECT p.id, p.title, u.username, c.name,
+               (SELECT COUNT(*) FROM forum_replies r WHERE r.post_id = p.id) as reply_count
+        FROM forum_posts p
+        JOIN users u ON p.user_id = u.id
+        LEFT JOIN forum_categories c ON p.category_id = c.id
+        WHERE p.category_id = %(category_id)s
+        ORDER BY p.created_at DESC
+        LIMIT 20
+    """),
+    ('forum post', """
+        SELECT p.id, p.title, u.username, c.name
+        FROM forum_posts p
+        JOIN users u ON p.user_id = u.id
+        LEFT JOIN forum_categories c ON p.category_id = c.id
+        WHERE p.id = %(post_id)s
+    """),
+    ('forum replies', """
+        SELECT r.id, r.content, u.username
+        FROM forum_replies r
+        JOIN users u ON r.user_id = u.id
+        WHERE r.post_id = %(post_id)s
+        ORDER BY r.is_solution DESC, r.created_at ASC
+    """),
+    ('top solutions page', """
+        SELECT s.id, s.title, u.username, s.likes
+        FROM shared_solutions s
+        JOIN users u ON u.id = s.user_id
+        WHERE s.exercise_id = 'exercise_1' AND s.is_public
+          AND (s.likes, s.id) < (25, 2147483647)
+        ORDER BY s.likes DESC, s.id DESC
+        LIMIT 11
+    """),
+    ('user posts', """
+        SELECT p.id, p.title, c.name
+        FROM forum_posts p
+        LEFT JOIN forum_categories c ON p.category_id = c.id
+        WHERE p.user_id = %(user_id)s
+        ORDER BY p.created_at DESC
+    """),
+]
+
+
+def seq_scans(plan):
+    """Relations read by a Seq Scan anywhere in an EXPLAIN (FORMAT JSON) plan"""
+    found = []
+    if plan.get('Node Type') == 'Seq Scan':
+        found.append(plan.get('Relation Name'))
+    for child in plan.get('Plans', ()):
+        found.extend(seq_scans(child))
+    return found
+
+
+def _row_estimate(cursor, relation):
+    cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", (relation,))
+    return cursor.fetchone()[0]
+
+
+def check_plans(cursor, users):
+    """Seed the dataset and return {query name: [large tables scanned sequentially]}"""
+    cursor.execute(SEED_SQL, {'users': users})
+    cursor.execute("""
+        SELECT u.id, p.id, p.category_id
+        FROM users u JOIN forum_posts p ON p.user_id = u.id
+        WHERE u.username = 'plan_user_1'
+        LIMIT 1
+    """)
+    user_id, post_id, category_id = cursor.fetchone()
+    params = {'user_id': user_id, 'post_id': post_id, 'category_id': category_id}
+
+    failures = {}
+    for name, query in HOT_QUERIES:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + query, params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        scanned = [table for table in seq_scans(plan[0]['Plan']) if _row_estimate(cursor, table) >= MIN_SCANNED_ROWS]
+        if scanned:
+            failures[name] = scanned
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail if a hot query plans a sequential scan")
+    parser.add_argument('--users', type=int, default=5000, help="number of synthetic users to seed")
+    args = parser.parse_args(argv)
+
+    conn = psycopg2.connect(
+        host=os.getenv('PGHOST'),
+        port=os.getenv('PGPORT'),
+        database=os.getenv('PGDATABASE'),
+        user=os.getenv('PGUSER'),
+        password=os.getenv('PGPASSWORD')
+    )
+    try:
+        cursor = conn.cursor()
+        failures = check_plans(cursor, args.users)
+    finally:
+        # The seeded rows are never committed
+        conn.rollback()
+        conn.close()
+
+    for name, _ in HOT_QUERIES:
+        status = "SEQ SCAN on " + ", ".join(failures[name]) if name in failures else "ok"
+        print(f"{name:28} {status}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
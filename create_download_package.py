@@ -18,7 +18,6 @@ def create_project_package():
         'deploy_requirements.txt',
         'Dockerfile', 
         'docker-compose.yml',
-        'init.sql',
         'runtime.txt',
         '.env.example',
         'DEPLOYMENT_GUIDE.md',
@@ -31,6 +30,7 @@ def create_project_package():
         'pages/',
         'utils/', 
         'data/',
+        'migrations/',
         'database/',
         '.streamlit/'
     ]
@@ -172,7 +172,7 @@ def show_package_contents():
         "requirements.txt - Python dependencies", 
         "Dockerfile - Container configuration",
         "docker-compose.yml - Full stack setup",
-        "init.sql - Database initialization",
+        "migrations/ - Versioned database schema migrations",
         "DEPLOYMENT_GUIDE.md - Complete deployment instructions",
         "README.md - Project documentation",
         ".gitignore - Git ignore rules",
@@ -1,4 +1,5 @@
--- Database initialization script for Python Learning Platform
+-- Baseline schema of the Python Learning Platform (the original init.sql).
+-- Safe to apply to databases that were created from init.sql.
 
 -- Create users table
 CREATE TABLE IF NOT EXISTS users (
@@ -117,15 +118,17 @@ CREATE TABLE IF NOT EXISTS forum_replies (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- Insert default forum categories
-INSERT INTO forum_categories (name, description, icon) VALUES 
+-- Insert default forum categories (only into an empty table)
+INSERT INTO forum_categories (name, description, icon)
+SELECT name, description, icon FROM (VALUES
 ('General Help', 'General programming questions and help requests', '❓'),
 ('Exercise Solutions', 'Share and discuss solutions to coding exercises', '💡'),
 ('Bug Reports', 'Report issues and bugs with the platform', '🐛'),
 ('Feature Requests', 'Suggest new features and improvements', '💭'),
 ('Study Groups', 'Form study groups and learning partnerships', '👥'),
 ('Show Your Code', 'Share your projects and get feedback', '🚀')
-ON CONFLICT DO NOTHING;
+) AS defaults(name, description, icon)
+WHERE NOT EXISTS (SELECT 1 FROM forum_categories);
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_user_progress_user_id ON user_progress(user_id);
@@ -133,4 +136,4 @@ CREATE INDEX IF NOT EXISTS idx_user_progress_category ON user_progress(category)
 CREATE INDEX IF NOT EXISTS idx_code_submissions_user_id ON code_submissions(user_id);
 CREATE INDEX IF NOT EXISTS idx_forum_posts_category_id ON forum_posts(category_id);
 CREATE INDEX IF NOT EXISTS idx_forum_posts_created_at ON forum_posts(created_at);
-CREATE INDEX IF NOT EXISTS idx_forum_replies_post_id ON forum_replies(post_id);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_forum_replies_post_id ON forum_replies(post_id);
@@ -0,0 +1,31 @@
+-- migrate: no-transaction
+-- Deduplicated submissions: identical code per (user, exercise) is one row with an attempt count
+
+ALTER TABLE code_submissions ADD COLUMN IF NOT EXISTS code_hash CHAR(64);
+ALTER TABLE code_submissions ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 1;
+
+-- Older rows hold unnormalized code, so their hashes may differ from new ones for the same edit
+UPDATE code_submissions
+SET code_hash = encode(sha256(convert_to(code, 'UTF8')), 'hex')
+WHERE code_hash IS NULL;
+
+-- Fold duplicates into the oldest row in one statement, so a retry never double counts
+WITH ranked AS (
+    SELECT id, attempts, MIN(id) OVER (PARTITION BY user_id, exercise_id, code_hash) AS keep_id
+    FROM code_submissions
+),
+removed AS (
+    DELETE FROM code_submissions s USING ranked r
+    WHERE s.id = r.id AND r.id <> r.keep_id
+    RETURNING r.keep_id, r.attempts
+)
+UPDATE code_submissions k
+SET attempts = k.attempts + folded.attempts
+FROM (SELECT keep_id, SUM(attempts) AS attempts FROM removed GROUP BY keep_id) folded
+WHERE k.id = folded.keep_id;
+
+ALTER TABLE code_submissions ALTER COLUMN code_hash SET NOT NULL;
+
+-- The unique index's user_id prefix replaces the single-column index
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_code_submissions_dedup ON code_submissions(user_id, exercise_id, code_hash);
+DROP INDEX CONCURRENTLY IF EXISTS idx_code_submissions_user_id;
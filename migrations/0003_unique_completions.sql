@@ -0,0 +1,12 @@
+-- migrate: no-transaction
+-- One row per completion and per achievement, so completions can be single-statement upserts
+
+DELETE FROM user_progress a USING user_progress b
+WHERE a.user_id = b.user_id AND a.item_type = b.item_type AND a.item_id = b.item_id AND a.id > b.id;
+-- Completion upserts, is_*_completed and per-type counts
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_user_progress_item ON user_progress(user_id, item_type, item_id);
+
+DELETE FROM user_achievements a USING user_achievements b
+WHERE a.user_id = b.user_id AND a.achievement_title = b.achievement_title AND a.id > b.id;
+-- Also serves the "already earned?" checks
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_user_achievements_title ON user_achievements(user_id, achievement_title);
@@ -0,0 +1,23 @@
+-- migrate: no-transaction
+-- Indexes matched to the queries in DatabaseAdapter and ForumManager
+-- (check with check_query_plans.py)
+
+-- Category progress and favorite category (index-only)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_progress_user_category ON user_progress(user_id, category);
+DROP INDEX CONCURRENTLY IF EXISTS idx_user_progress_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_user_progress_category;
+
+-- Achievement lists, newest first (index-only)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_achievements_recent ON user_achievements(user_id, earned_at DESC) INCLUDE (achievement_title);
+
+-- Inactive guest lookup for the maintenance reaper
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_guest_last_active ON users(last_active) WHERE password_hash = '';
+
+-- Forum listings: newest posts per category and per user
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_forum_posts_category_created ON forum_posts(category_id, created_at DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_forum_posts_user_created ON forum_posts(user_id, created_at DESC);
+DROP INDEX CONCURRENTLY IF EXISTS idx_forum_posts_category_id;
+
+-- Replies of a post in display order, and reply counts
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_forum_replies_post_order ON forum_replies(post_id, is_solution DESC, created_at);
+DROP INDEX CONCURRENTLY IF EXISTS idx_forum_replies_post_id;
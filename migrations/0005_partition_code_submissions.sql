@@ -0,0 +1,115 @@
+-- migrate: no-transaction
+-- Range-partition code_submissions by month, online: the partitioned table is built
+-- beside the old one, a trigger mirrors writes made meanwhile, existing rows are
+-- copied in committed batches, and only the final rename swap takes an ACCESS
+-- EXCLUSIVE lock (bounded by the runner's lock_timeout). Every step can be re-run,
+-- and does nothing once code_submissions is partitioned.
+
+DO $$
+DECLARE
+    start_month DATE;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'code_submissions'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    CREATE TABLE IF NOT EXISTS code_submissions_partitioned (
+        id INTEGER NOT NULL DEFAULT nextval('code_submissions_id_seq'),
+        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+        exercise_id VARCHAR(100) NOT NULL,
+        code TEXT NOT NULL,
+        code_hash CHAR(64) NOT NULL,
+        is_correct BOOLEAN NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 1,
+        submitted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        execution_time FLOAT,
+        error_message TEXT,
+        CONSTRAINT code_submissions_partitioned_pkey PRIMARY KEY (id, submitted_at)
+    ) PARTITION BY RANGE (submitted_at);
+
+    -- One partition per month from the oldest submission to three months ahead;
+    -- utils.maintenance keeps creating new ones and archives old ones
+    start_month := date_trunc('month', COALESCE((SELECT MIN(submitted_at) FROM code_submissions), now()));
+    WHILE start_month <= date_trunc('month', now()) + interval '3 months' LOOP
+        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF code_submissions_partitioned FOR VALUES FROM (%L) TO (%L)',
+                       'code_submissions_' || to_char(start_month, 'YYYY_MM'),
+                       start_month, start_month + interval '1 month');
+        start_month := start_month + interval '1 month';
+    END LOOP;
+
+    -- Catches inserts if partition maintenance falls behind
+    CREATE TABLE IF NOT EXISTS code_submissions_default PARTITION OF code_submissions_partitioned DEFAULT;
+
+    -- Created on every partition; identical code is folded per month, so this is not unique
+    CREATE INDEX IF NOT EXISTS idx_code_submissions_partitioned_dedup
+        ON code_submissions_partitioned(user_id, exercise_id, code_hash);
+END $$;
+
+-- Mirror every write to the old table while the copy runs
+CREATE OR REPLACE FUNCTION mirror_code_submission() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM code_submissions_partitioned WHERE id = OLD.id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO code_submissions_partitioned (id, user_id, exercise_id, code, code_hash, is_correct, attempts,
+                                                  submitted_at, execution_time, error_message)
+        VALUES (NEW.id, NEW.user_id, NEW.exercise_id, NEW.code, NEW.code_hash, NEW.is_correct, NEW.attempts,
+                COALESCE(NEW.submitted_at, CURRENT_TIMESTAMP), NEW.execution_time, NEW.error_message)
+        ON CONFLICT (id, submitted_at) DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF to_regclass('code_submissions_partitioned') IS NOT NULL THEN
+        CREATE OR REPLACE TRIGGER code_submissions_mirror
+        AFTER INSERT OR UPDATE OR DELETE ON code_submissions
+        FOR EACH ROW EXECUTE FUNCTION mirror_code_submission();
+    END IF;
+END $$;
+
+-- Copy existing rows a batch of ids at a time, committing after each batch. FOR SHARE
+-- copies each row's latest version and holds off updates and deletes of the batch
+-- until it commits; the trigger mirrors those that come after.
+DO $$
+DECLARE
+    batch_start INTEGER;
+    last_id INTEGER;
+BEGIN
+    IF to_regclass('code_submissions_partitioned') IS NULL THEN
+        RETURN;
+    END IF;
+    SELECT MIN(id), MAX(id) INTO batch_start, last_id FROM code_submissions;
+    WHILE batch_start <= last_id LOOP
+        INSERT INTO code_submissions_partitioned (id, user_id, exercise_id, code, code_hash, is_correct, attempts,
+                                                  submitted_at, execution_time, error_message)
+        SELECT id, user_id, exercise_id, code, code_hash, is_correct, attempts,
+               COALESCE(submitted_at, CURRENT_TIMESTAMP), execution_time, error_message
+        FROM code_submissions
+        WHERE id >= batch_start AND id < batch_start + 10000
+        FOR SHARE
+        ON CONFLICT (id, submitted_at) DO NOTHING;
+        COMMIT;
+        batch_start := batch_start + 10000;
+    END LOOP;
+END $$;
+
+-- The swap, in one short transaction
+DO $$
+BEGIN
+    IF to_regclass('code_submissions_partitioned') IS NULL THEN
+        RETURN;
+    END IF;
+    LOCK TABLE code_submissions IN ACCESS EXCLUSIVE MODE;
+    DROP TRIGGER code_submissions_mirror ON code_submissions;
+    ALTER SEQUENCE code_submissions_id_seq OWNED BY code_submissions_partitioned.id;
+    DROP TABLE code_submissions;
+    ALTER TABLE code_submissions_partitioned RENAME TO code_submissions;
+    ALTER TABLE code_submissions RENAME CONSTRAINT code_submissions_partitioned_pkey TO code_submissions_pkey;
+    ALTER INDEX idx_code_submissions_partitioned_dedup RENAME TO idx_code_submissions_dedup;
+END $$;
+
+DROP FUNCTION IF EXISTS mirror_code_submission();
@@ -0,0 +1,17 @@
+-- Submission bodies are stored once per distinct (normalized) code, keyed by its hash
+
+CREATE TABLE IF NOT EXISTS code_blobs (
+    code_hash CHAR(64) PRIMARY KEY,
+    body BYTEA NOT NULL,
+    compression VARCHAR(10) NOT NULL DEFAULT 'none',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Existing bodies are copied uncompressed; new ones are zlib-compressed by the app when that helps
+INSERT INTO code_blobs (code_hash, body)
+SELECT DISTINCT ON (code_hash) code_hash, convert_to(code, 'UTF8')
+FROM code_submissions
+ON CONFLICT (code_hash) DO NOTHING;
+
+-- Only the catalog changes; the space is reclaimed as partitions are rewritten or archived
+ALTER TABLE code_submissions DROP COLUMN code;
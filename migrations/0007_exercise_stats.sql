@@ -0,0 +1,40 @@
+-- exercise_stats is maintained by DatabaseAdapter on every submission and completion;
+-- this fills it from the history recorded so far
+
+ALTER TABLE exercise_stats ADD COLUMN IF NOT EXISTS correct_attempts INTEGER NOT NULL DEFAULT 0;
+-- Error kind -> count; the column was never written, so nothing is converted
+ALTER TABLE exercise_stats ALTER COLUMN common_errors TYPE JSONB USING NULL;
+
+INSERT INTO exercise_stats (exercise_id, total_attempts, correct_attempts, last_updated)
+SELECT exercise_id, SUM(attempts), COALESCE(SUM(attempts) FILTER (WHERE is_correct), 0), now()
+FROM code_submissions
+GROUP BY exercise_id
+ON CONFLICT (exercise_id) DO UPDATE
+SET total_attempts = EXCLUDED.total_attempts,
+    correct_attempts = EXCLUDED.correct_attempts,
+    last_updated = EXCLUDED.last_updated;
+
+INSERT INTO exercise_stats (exercise_id, successful_completions, last_updated)
+SELECT item_id, COUNT(*), now()
+FROM user_progress
+WHERE item_type = 'exercise'
+GROUP BY item_id
+ON CONFLICT (exercise_id) DO UPDATE
+SET successful_completions = EXCLUDED.successful_completions;
+
+-- Same error kind as utils.stats_manager.error_kind(): text before the first colon
+UPDATE exercise_stats s
+SET common_errors = e.errors
+FROM (
+    SELECT exercise_id, jsonb_object_agg(kind, failures) AS errors
+    FROM (
+        SELECT exercise_id,
+               left(trim(split_part(split_part(error_message, E'\n', 1), ':', 1)), 50) AS kind,
+               SUM(attempts) AS failures
+        FROM code_submissions
+        WHERE NOT is_correct AND error_message IS NOT NULL
+        GROUP BY 1, 2
+    ) kinds
+    GROUP BY exercise_id
+) e
+WHERE s.exercise_id = e.exercise_id;
@@ -0,0 +1,69 @@
+-- Leaderboard: one precomputed score row per registered user, updated on each completion,
+-- plus a histogram of scores so "my rank" is a sum over distinct scores, not over users
+
+CREATE TABLE IF NOT EXISTS user_scores (
+    user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    exercises INTEGER NOT NULL DEFAULT 0,
+    tutorials INTEGER NOT NULL DEFAULT 0,
+    solution_likes INTEGER NOT NULL DEFAULT 0,
+    -- Point system shown on the community page
+    points INTEGER GENERATED ALWAYS AS (exercises * 10 + tutorials * 5 + solution_likes * 3) STORED,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Top-N in rank order
+CREATE INDEX IF NOT EXISTS idx_user_scores_rank ON user_scores(points DESC, user_id);
+
+CREATE TABLE IF NOT EXISTS score_histogram (
+    points INTEGER PRIMARY KEY,
+    users INTEGER NOT NULL DEFAULT 0
+);
+
+-- Statement-level triggers apply one grouped delta per statement, so batched
+-- score updates touch each distinct score once instead of once per user
+CREATE OR REPLACE FUNCTION update_score_histogram() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO score_histogram (points, users)
+        SELECT points, COUNT(*) FROM new_rows GROUP BY points
+        ON CONFLICT (points) DO UPDATE SET users = score_histogram.users + EXCLUDED.users;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE score_histogram h SET users = h.users - d.users
+        FROM (SELECT points, COUNT(*) AS users FROM old_rows GROUP BY points) d
+        WHERE h.points = d.points;
+    ELSE
+        INSERT INTO score_histogram (points, users)
+        SELECT points, SUM(delta) FROM (
+            SELECT points, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT points, -1 AS delta FROM old_rows
+        ) d
+        GROUP BY points
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (points) DO UPDATE SET users = score_histogram.users + EXCLUDED.users;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER user_scores_histogram_insert
+AFTER INSERT ON user_scores REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION update_score_histogram();
+
+CREATE TRIGGER user_scores_histogram_update
+AFTER UPDATE ON user_scores REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION update_score_histogram();
+
+CREATE TRIGGER user_scores_histogram_delete
+AFTER DELETE ON user_scores REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION update_score_histogram();
+
+-- Backfill registered users (guests have an empty password and are not ranked)
+INSERT INTO user_scores (user_id, exercises, tutorials, solution_likes)
+SELECT u.id,
+       (SELECT COUNT(*) FROM user_progress p WHERE p.user_id = u.id AND p.item_type = 'exercise'),
+       (SELECT COUNT(*) FROM user_progress p WHERE p.user_id = u.id AND p.item_type = 'tutorial'),
+       (SELECT COALESCE(SUM(s.likes), 0) FROM shared_solutions s WHERE s.user_id = u.id)
+FROM users u
+WHERE u.password_hash <> ''
+ON CONFLICT (user_id) DO NOTHING;
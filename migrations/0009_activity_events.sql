@@ -0,0 +1,32 @@
+-- Append-only community activity feed, written in the same transaction as the
+-- completion, achievement or reply it describes. Only registered users appear.
+
+CREATE TABLE IF NOT EXISTS activity_events (
+    id BIGSERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    kind VARCHAR(20) NOT NULL,
+    -- Exercise id, achievement title or forum post title, depending on kind
+    item VARCHAR(200) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Keeps the cascade from deleted users cheap; the feed itself reads by id
+CREATE INDEX IF NOT EXISTS idx_activity_events_user ON activity_events(user_id);
+
+-- Seed the feed with the last week of history, oldest first so ids follow time
+INSERT INTO activity_events (user_id, kind, item, created_at)
+SELECT history.user_id, history.kind, history.item, history.created_at FROM (
+    SELECT p.user_id, 'exercise' AS kind, p.item_id AS item, p.completed_at AS created_at
+    FROM user_progress p
+    WHERE p.item_type = 'exercise'
+    UNION ALL
+    SELECT a.user_id, 'achievement', a.achievement_title, a.earned_at
+    FROM user_achievements a
+    UNION ALL
+    SELECT r.user_id, 'reply', fp.title, r.created_at
+    FROM forum_replies r
+    JOIN forum_posts fp ON fp.id = r.post_id
+) history
+JOIN users u ON u.id = history.user_id
+WHERE u.password_hash <> '' AND history.created_at >= now() - interval '7 days'
+ORDER BY history.created_at;
@@ -0,0 +1,62 @@
+-- Activity trend rollups. Each write bumps the user's row for the current hour;
+-- ActivityRollup folds closed hours into the global hourly and daily tables and
+-- advances the watermark, so charts never aggregate raw submissions.
+
+CREATE TABLE IF NOT EXISTS user_activity_hourly (
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    bucket TIMESTAMP NOT NULL,
+    submissions INTEGER NOT NULL DEFAULT 0,
+    completions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, bucket)
+);
+
+-- Rolling up (and reading the not yet rolled up tail) goes by bucket
+CREATE INDEX IF NOT EXISTS idx_user_activity_hourly_bucket ON user_activity_hourly(bucket);
+
+CREATE TABLE IF NOT EXISTS activity_hourly (
+    bucket TIMESTAMP PRIMARY KEY,
+    submissions INTEGER NOT NULL DEFAULT 0,
+    completions INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS activity_daily (
+    day DATE PRIMARY KEY,
+    submissions INTEGER NOT NULL DEFAULT 0,
+    completions INTEGER NOT NULL DEFAULT 0
+);
+
+-- Hours before rolled_up_to are in activity_hourly/activity_daily, later ones are not
+CREATE TABLE IF NOT EXISTS rollup_state (
+    name VARCHAR(50) PRIMARY KEY,
+    rolled_up_to TIMESTAMP NOT NULL
+);
+
+-- Backfill from history. Repeated identical submissions are folded into one row,
+-- so their attempts count at the time of the latest one.
+INSERT INTO user_activity_hourly (user_id, bucket, submissions, completions)
+SELECT user_id, bucket, SUM(submissions), SUM(completions) FROM (
+    SELECT user_id, date_trunc('hour', submitted_at) AS bucket, attempts AS submissions, 0 AS completions
+    FROM code_submissions
+    UNION ALL
+    SELECT user_id, date_trunc('hour', completed_at), 0, 1
+    FROM user_progress
+) history
+GROUP BY user_id, bucket
+ON CONFLICT (user_id, bucket) DO NOTHING;
+
+INSERT INTO activity_hourly (bucket, submissions, completions)
+SELECT bucket, SUM(submissions), SUM(completions)
+FROM user_activity_hourly
+WHERE bucket < date_trunc('hour', now())
+GROUP BY bucket
+ON CONFLICT (bucket) DO NOTHING;
+
+INSERT INTO activity_daily (day, submissions, completions)
+SELECT bucket::date, SUM(submissions), SUM(completions)
+FROM activity_hourly
+GROUP BY bucket::date
+ON CONFLICT (day) DO NOTHING;
+
+INSERT INTO rollup_state (name, rolled_up_to)
+VALUES ('activity', date_trunc('hour', now()))
+ON CONFLICT (name) DO NOTHING;
@@ -0,0 +1,16 @@
+-- migrate: no-transaction
+-- Shared solutions: one like per user per solution, and the index behind the
+-- per-exercise "top solutions" listing and its keyset pagination
+
+CREATE TABLE IF NOT EXISTS solution_likes (
+    solution_id INTEGER NOT NULL REFERENCES shared_solutions(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (solution_id, user_id)
+);
+
+-- Deleting a user removes their likes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_solution_likes_user ON solution_likes(user_id);
+
+-- Top public solutions of an exercise, continuing after a (likes, id) cursor
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shared_solutions_top ON shared_solutions(exercise_id, likes DESC, id DESC) WHERE is_public;
@@ -0,0 +1,13 @@
+-- migrate: no-transaction
+-- learning_sessions rows are upserted by SessionTracker heartbeats, keyed by the
+-- session id it generates in memory
+
+ALTER TABLE learning_sessions ADD COLUMN IF NOT EXISTS session_key UUID;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_learning_sessions_key ON learning_sessions(session_key);
+
+-- Session analytics read the recent sessions only
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_learning_sessions_start ON learning_sessions(session_start);
+
+-- Deleting a user removes their sessions
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_learning_sessions_user ON learning_sessions(user_id);
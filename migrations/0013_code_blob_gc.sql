@@ -0,0 +1,14 @@
+-- migrate: no-transaction
+-- Lets the code_blobs collector in utils.maintenance check references with index probes.
+-- A partitioned table's index cannot be built CONCURRENTLY, so the parent index is
+-- created empty (ON ONLY), each partition's index is built concurrently, and each is
+-- then attached; the parent index becomes valid once every partition has one.
+-- Partitions created afterwards get the index automatically.
+
+CREATE INDEX IF NOT EXISTS idx_code_submissions_code_hash ON ONLY code_submissions(code_hash);
+
+-- migrate: each partition of code_submissions
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition}_code_hash_idx ON {partition}(code_hash);
+
+-- migrate: each partition of code_submissions
+ALTER INDEX idx_code_submissions_code_hash ATTACH PARTITION {partition}_code_hash_idx;
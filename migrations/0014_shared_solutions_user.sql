@@ -0,0 +1,5 @@
+-- migrate: no-transaction
+-- The like reconciler locks and sums an author's solutions by user_id, and deleting a
+-- user cascades to their solutions; both were sequential scans of shared_solutions
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shared_solutions_user ON shared_solutions(user_id);
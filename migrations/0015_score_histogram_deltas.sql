@@ -0,0 +1,32 @@
+-- Score changes are appended to score_histogram_deltas instead of applied to
+-- score_histogram in place: learners around the same score all updated the same
+-- few histogram rows, so concurrent completions queued on each other's row locks
+-- until commit. LeaderboardManager folds the deltas into the histogram in batches,
+-- and rank queries count both tables until then.
+
+CREATE TABLE IF NOT EXISTS score_histogram_deltas (
+    points INTEGER NOT NULL,
+    users INTEGER NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION update_score_histogram() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO score_histogram_deltas (points, users)
+        SELECT points, COUNT(*) FROM new_rows GROUP BY points;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO score_histogram_deltas (points, users)
+        SELECT points, -COUNT(*) FROM old_rows GROUP BY points;
+    ELSE
+        INSERT INTO score_histogram_deltas (points, users)
+        SELECT points, SUM(delta) FROM (
+            SELECT points, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT points, -1 AS delta FROM old_rows
+        ) d
+        GROUP BY points
+        HAVING SUM(delta) <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -1,19 +1,12 @@
 import streamlit as st
 from data.tutorials import get_tutorial_list, get_tutorial
 from utils.code_executor import CodeExecutor
-from utils.progress_tracker import ProgressTracker
-from utils.db_adapter import DatabaseAdapter
+from utils.tracker_backends import init_progress_tracker
 
 st.set_page_config(page_title="Tutorials", page_icon="📚", layout="wide")
 
-# Initialize progress tracker with database support
-if 'progress_tracker' not in st.session_state:
-    try:
-        st.session_state.progress_tracker = DatabaseAdapter()
-        st.session_state.using_database = True
-    except Exception:
-        st.session_state.progress_tracker = ProgressTracker()
-        st.session_state.using_database = False
+# Pick the first available progress backend (Postgres, local SQLite, session state)
+init_progress_tracker()
 
 # Initialize code executor
 executor = CodeExecutor()
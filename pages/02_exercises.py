@@ -1,22 +1,20 @@
 import streamlit as st
 from data.exercises import get_exercise_list, get_exercise
-from utils.code_executor import CodeExecutor
-from utils.progress_tracker import ProgressTracker
-from utils.db_adapter import DatabaseAdapter
+from utils.code_executor import CodeExecutor, code_hash
+from utils.safety_policy import get_policy
+from utils.execution_profiles import replay_seed
+from utils.tracker_backends import init_progress_tracker
 
 st.set_page_config(page_title="Exercises", page_icon="💪", layout="wide")
 
-# Initialize progress tracker and code executor with database support
-if 'progress_tracker' not in st.session_state:
-    try:
-        st.session_state.progress_tracker = DatabaseAdapter()
-        st.session_state.using_database = True
-    except Exception:
-        st.session_state.progress_tracker = ProgressTracker()
-        st.session_state.using_database = False
+# Pick the first available progress backend (Postgres, local SQLite, session state)
+init_progress_tracker()
 
 executor = CodeExecutor()
 
+# Verdicts remembered per session for repeated "Check Solution" clicks
+SUBMISSION_CACHE_SIZE = 100
+
 def main():
     st.title("💪 Python Exercises")
     st.markdown("Practice your Python skills with these coding challenges!")
@@ -111,10 +109,24 @@ def main():
         # Action buttons
         col_run, col_check, col_hint = st.columns(3)
         
+        # Exercises may tighten or relax the default safety rules and pick a profile
+        policy = get_policy(exercise.get('safety'))
+        profile = exercise.get('profile')
+        
+        # Random-based exercises replay a deterministic seed per (user, exercise, attempt);
+        # the attempt is the stored number of solves, so each solve moves to a new seed
+        seed = None
+        expected_output = exercise.get('expected_output')
+        if exercise.get('seeded'):
+            tracker = st.session_state.progress_tracker
+            attempt = tracker.get_exercise_attempt(selected_exercise_id)
+            seed = replay_seed(tracker.owner_id, selected_exercise_id, attempt)
+            expected_output = executor.replay_expected_output(exercise['solution'], seed, profile)
+        
         with col_run:
             if st.button("🏃 Run Code", type="secondary"):
                 if user_code.strip():
-                    success, message, output = executor.execute_code(user_code)
+                    success, message, output = executor.execute_code(user_code, policy=policy, profile=profile, seed=seed)
                     st.session_state[f"exercise_result_{selected_exercise_id}"] = {
                         'success': success,
                         'message': message,
@@ -127,19 +139,48 @@ def main():
         with col_check:
             if st.button("✅ Check Solution", type="primary"):
                 if user_code.strip():
-                    # Run validation
-                    if 'expected_output' in exercise:
-                        success, message, output = executor.validate_exercise_solution(
-                            user_code, 
-                            expected_output=exercise['expected_output']
-                        )
-                    elif 'test_cases' in exercise:
-                        success, message, output = executor.validate_exercise_solution(
-                            user_code, 
-                            test_cases=exercise['test_cases']
-                        )
+                    # Repeat checks of unchanged code reuse the previous verdict
+                    submission_cache = st.session_state.setdefault('submission_results', {})
+                    cache_key = (selected_exercise_id, code_hash(user_code), seed)
+                    cached_result = submission_cache.get(cache_key)
+                    
+                    if cached_result:
+                        success, message, output = cached_result
                     else:
-                        success, message, output = executor.execute_code(user_code)
+                        # Run validation
+                        if expected_output:
+                            success, message, output = executor.validate_exercise_solution(
+                                user_code, 
+                                expected_output=expected_output,
+                                policy=policy,
+                                profile=profile,
+                                seed=seed,
+                                exercise_id=selected_exercise_id
+                            )
+                        elif 'test_cases' in exercise:
+                            success, message, output = executor.validate_exercise_solution(
+                                user_code, 
+                                test_cases=exercise['test_cases'],
+                                policy=policy,
+                                profile=profile,
+                                seed=seed,
+                                exercise_id=selected_exercise_id
+                            )
+                        else:
+                            success, message, output = executor.execute_code(user_code, policy=policy, profile=profile, seed=seed)
+                        
+                        submission_cache[cache_key] = (success, message, output)
+                        if len(submission_cache) > SUBMISSION_CACHE_SIZE:
+                            submission_cache.pop(next(iter(submission_cache)))
+                        
+                        # Record the new submission when the tracker supports it
+                        if hasattr(st.session_state.progress_tracker, 'record_submission'):
+                            st.session_state.progress_tracker.record_submission(
+                                selected_exercise_id,
+                                user_code,
+                                is_correct=success,
+                                error_message=None if success else message
+                            )
                     
                     st.session_state[f"exercise_result_{selected_exercise_id}"] = {
                         'success': success,
@@ -150,17 +191,12 @@ def main():
                     
                     # Mark as completed if successful
                     if success and 'tested' in st.session_state[f"exercise_result_{selected_exercise_id}"] and st.session_state[f"exercise_result_{selected_exercise_id}"]['tested']:
-                        if not st.session_state.progress_tracker.is_exercise_completed(selected_exercise_id):
-                            # Track code submission with database support
-                            if hasattr(st.session_state.progress_tracker, 'complete_exercise'):
-                                st.session_state.progress_tracker.complete_exercise(
-                                    selected_exercise_id, 
-                                    exercise['category'], 
-                                    code=user_code, 
-                                    is_correct=True
-                                )
-                            else:
-                                st.session_state.progress_tracker.complete_exercise(selected_exercise_id, exercise['category'])
+                        newly_completed = not st.session_state.progress_tracker.is_exercise_completed(selected_exercise_id)
+                        # The submission itself was already recorded above; solving a random-based
+                        # exercise again counts another attempt, which gives it a fresh seed
+                        if newly_completed or exercise.get('seeded'):
+                            st.session_state.progress_tracker.complete_exercise(selected_exercise_id, exercise['category'])
+                        if newly_completed:
                             st.success("🎉 Exercise completed! Excellent work!")
                             st.balloons()
                 else:
@@ -202,9 +238,9 @@ def main():
             st.info("Run your code to see the output here")
         
         # Expected output section
-        if 'expected_output' in exercise:
+        if expected_output:
             st.subheader("🎯 Expected Output")
-            st.code(exercise['expected_output'], language='text')
+            st.code(expected_output, language='text')
         
         # Solution section (only show after completion)
         if st.session_state.progress_tracker.is_exercise_completed(selected_exercise_id):
@@ -1,21 +1,11 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-from utils.progress_tracker import ProgressTracker
-from utils.db_adapter import DatabaseAdapter
+from utils.tracker_backends import init_progress_tracker
+from utils.achievements import ACHIEVEMENT_RULES
 
 st.set_page_config(page_title="Progress", page_icon="📊", layout="wide")
 
-# Initialize progress tracker with database support
-if 'progress_tracker' not in st.session_state:
-    try:
-        st.session_state.progress_tracker = DatabaseAdapter()
-        st.session_state.using_database = True
-    except Exception:
-        st.session_state.progress_tracker = ProgressTracker()
-        st.session_state.using_database = False
+# Pick the first available progress backend (Postgres, local SQLite, session state)
+init_progress_tracker()
 
 def main():
     st.title("📊 Your Learning Progress")
@@ -79,38 +69,36 @@ def main():
                 'Status': 'Mastered' if progress >= 100 else 'In Progress' if progress > 0 else 'Not Started'
             })
         
-        df_categories = pd.DataFrame(category_data)
-        
-        # Create a horizontal bar chart
-        fig_categories = px.bar(
-            df_categories, 
-            x='Progress', 
-            y='Category',
+        # Create a horizontal bar chart; plotly is loaded only once a chart is drawn
+        import plotly.graph_objects as go
+        fig_categories = go.Figure(go.Bar(
+            x=[row['Progress'] for row in category_data],
+            y=[row['Category'] for row in category_data],
             orientation='h',
-            color='Progress',
-            color_continuous_scale='viridis',
-            title='Learning Progress by Topic',
-            range_x=[0, 100]
-        )
+            marker=dict(
+                color=[row['Progress'] for row in category_data],
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title='Progress')
+            ),
+            texttemplate='%{x:.1f}%',
+            textposition='inside'
+        ))
         
         fig_categories.update_layout(
+            title='Learning Progress by Topic',
             height=400,
             showlegend=False,
             xaxis_title="Progress (%)",
-            yaxis_title="Topics"
-        )
-        
-        # Add percentage labels
-        fig_categories.update_traces(
-            texttemplate='%{x:.1f}%',
-            textposition='inside'
+            yaxis_title="Topics",
+            xaxis_range=[0, 100]
         )
         
         st.plotly_chart(fig_categories, use_container_width=True)
         
         # Detailed category breakdown
         st.subheader("📚 Topic Details")
-        for _, row in df_categories.iterrows():
+        for row in category_data:
             with st.expander(f"{row['Category']} - {row['Progress']:.1f}%"):
                 progress_val = row['Progress'] / 100
                 st.progress(progress_val)
@@ -155,11 +143,11 @@ def main():
             
             # Achievement statistics
             st.subheader("📊 Achievement Stats")
-            total_possible = 15  # Approximate total achievements
-            achievement_progress = len(achievements) / total_possible * 100
+            total_possible = len(ACHIEVEMENT_RULES)
+            achievement_progress = min(100, len(achievements) / total_possible * 100)
             
             st.progress(achievement_progress / 100)
-            st.caption(f"Unlocked {len(achievements)} out of ~{total_possible} achievements")
+            st.caption(f"Unlocked {len(achievements)} out of {total_possible} achievements")
             
         else:
             st.info("🎯 No achievements yet! Complete tutorials and exercises to earn your first achievements.")
@@ -171,40 +159,39 @@ def main():
             - 🏃 Complete 5 exercises
             """)
         
-        # Learning streak (simulated)
+        # Learning activity, from the hourly rollups kept with each submission and completion
         st.subheader("🔥 Learning Activity")
         
-        # Create a simple activity chart
-        activity_data = []
-        for i in range(7):
-            date = datetime.now() - timedelta(days=i)
-            # Simulate activity based on completed items
-            activity = min(10, tutorials_completed + exercises_completed - i)
-            activity_data.append({
-                'Date': date.strftime('%m/%d'),
-                'Activity': max(0, activity)
-            })
-        
-        activity_data.reverse()
-        df_activity = pd.DataFrame(activity_data)
-        
-        fig_activity = px.bar(
-            df_activity,
-            x='Date',
-            y='Activity',
-            title='Learning Activity (Last 7 Days)',
-            color='Activity',
-            color_continuous_scale='blues'
-        )
-        
-        fig_activity.update_layout(
-            height=300,
-            showlegend=False,
-            xaxis_title="Date",
-            yaxis_title="Activities"
-        )
-        
-        st.plotly_chart(fig_activity, use_container_width=True)
+        if st.session_state.using_database:
+            activity_data = [
+                {
+                    'Date': day['bucket'].strftime('%m/%d'),
+                    'Activity': day['submissions'] + day['completions']
+                }
+                for day in st.session_state.progress_tracker.get_daily_activity(days=7)
+            ]
+            fig_activity = go.Figure(go.Bar(
+                x=[day['Date'] for day in activity_data],
+                y=[day['Activity'] for day in activity_data],
+                marker=dict(
+                    color=[day['Activity'] for day in activity_data],
+                    colorscale='Blues',
+                    showscale=True,
+                    colorbar=dict(title='Activity')
+                )
+            ))
+            
+            fig_activity.update_layout(
+                title='Learning Activity (Last 7 Days)',
+                height=300,
+                showlegend=False,
+                xaxis_title="Date",
+                yaxis_title="Activities"
+            )
+            
+            st.plotly_chart(fig_activity, use_container_width=True)
+        else:
+            st.info("Daily activity history is recorded when the database is available.")
     
     st.markdown("---")
     
@@ -291,7 +278,13 @@ def main():
                 st.rerun()
         
         with col2:
-            st.session_state.progress_tracker.reset_progress()
+            if st.button("⚠️ Reset All Progress", type="secondary"):
+                st.session_state.confirm_reset = True
+            if st.session_state.get('confirm_reset') and st.button("🔴 Confirm Reset", type="primary"):
+                st.session_state.progress_tracker.reset_progress()
+                st.session_state.confirm_reset = False
+                st.success("Progress reset successfully!")
+                st.rerun()
 
 if __name__ == "__main__":
     main()
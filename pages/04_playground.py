@@ -1,9 +1,14 @@
 import streamlit as st
 import time
 from utils.code_executor import CodeExecutor
+from utils.execution_profiles import replay_seed
+from utils.tracker_backends import init_progress_tracker
 
 st.set_page_config(page_title="Python Playground", page_icon="🎮", layout="wide")
 
+# Playground runs count toward the learning session, which keeps a guest's account active
+init_progress_tracker()
+
 # Initialize code executor
 executor = CodeExecutor()
 
@@ -99,6 +104,14 @@ print(f"The secret number was {secret}")"""
         if user_code != st.session_state.playground_code:
             st.session_state.playground_code = user_code
         
+        # Replay mode gives the same random numbers on every run
+        replay_random = st.checkbox(
+            "🎲 Replayable random numbers",
+            key="playground_replay",
+            help="Seed the random module so each run produces the same numbers"
+        )
+        seed = replay_seed(st.session_state.progress_tracker.owner_id, 'playground') if replay_random else None
+        
         # Action buttons
         col_run, col_clear, col_save = st.columns(3)
         
@@ -106,7 +119,7 @@ print(f"The secret number was {secret}")"""
             if st.button("🏃 Run Code", type="primary", use_container_width=True):
                 if user_code.strip():
                     with st.spinner("Running your code..."):
-                        success, message, output = executor.execute_code(user_code)
+                        success, message, output = executor.execute_code(user_code, seed=seed)
                         
                         st.session_state.playground_result = {
                             'success': success,
@@ -1,13 +1,22 @@
 import streamlit as st
-import pandas as pd
 from utils.db_adapter import DatabaseAdapter
-from datetime import datetime, timedelta
+from utils.stats_manager import StatsManager, get_platform_stats
+from utils.leaderboard_manager import LeaderboardManager
+from utils.activity_rollups import ActivityRollup
+from utils.solutions_manager import SolutionsManager, get_like_counter
+from utils.activity_feed import get_feed, EXERCISE_COMPLETED, SOLUTION_SHARED, ACHIEVEMENT_EARNED, FORUM_REPLY
+from data.exercises import EXERCISES
+from datetime import datetime
 
 st.set_page_config(page_title="Community", page_icon="👥", layout="wide")
 
 # Initialize database adapter
 try:
     db = DatabaseAdapter()
+    stats_manager = StatsManager()
+    leaderboard_manager = LeaderboardManager()
+    activity_rollup = ActivityRollup()
+    solutions_manager = SolutionsManager()
     has_database = True
 except Exception:
     has_database = False
@@ -46,15 +55,17 @@ def show_community_dashboard():
     """Main community dashboard"""
     st.subheader("🌟 Community Dashboard")
     
+    totals = get_platform_stats().snapshot()
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total Learners", "150+", delta="12 new this week")
-        st.metric("Solutions Shared", "89", delta="8 this week")
+        st.metric("Total Learners", f"{totals.get('learners', 0):,}")
+        st.metric("Solutions Shared", f"{totals.get('solutions_shared', 0):,}")
     
     with col2:
-        st.metric("Active Today", "23", delta="5 compared to yesterday")
-        st.metric("Exercises Solved", "1,247", delta="156 this week")
+        st.metric("Active Today", f"{totals.get('active_today', 0):,}")
+        st.metric("Exercises Solved", f"{totals.get('exercises_completed', 0):,}")
     
     with col3:
         st.metric("Community Score", "94%", delta="2% improvement")
@@ -94,52 +105,28 @@ def show_shared_solutions():
     """Show shared code solutions"""
     st.subheader("💡 Shared Solutions")
     
-    # Sample shared solutions (in production, these would come from database)
-    solutions = [
-        {
-            "title": "Elegant Fibonacci Solution",
-            "author": "PythonMaster",
-            "exercise": "Fibonacci Numbers",
-            "likes": 15,
-            "code": """def fibonacci(n):
-    if n <= 1:
-        return n
-    return fibonacci(n-1) + fibonacci(n-2)
-
-# Generate first 10 numbers
-for i in range(10):
-    print(fibonacci(i))""",
-            "description": "Clean recursive approach with clear logic"
-        },
-        {
-            "title": "Efficient Prime Checker",
-            "author": "AlgoExpert",
-            "exercise": "Prime Number Checker", 
-            "likes": 12,
-            "code": """import math
-
-def is_prime(n):
-    if n < 2:
-        return False
-    
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-number = 17
-if is_prime(number):
-    print(f"{number} is prime")
-else:
-    print(f"{number} is not prime")""",
-            "description": "Optimized algorithm checking only up to square root"
-        }
-    ]
+    exercise_id = st.selectbox(
+        "Exercise",
+        list(EXERCISES),
+        format_func=lambda exercise: EXERCISES[exercise]['title']
+    )
+    
+    user_id = st.session_state.get('user_id') if st.session_state.get('is_logged_in', False) else None
+    like_counter = get_like_counter()
+    
+    # Keyset pagination: the cursor of each page shown so far, per exercise
+    cursors = st.session_state.setdefault('solution_cursors', {}).setdefault(exercise_id, [None])
+    solutions, next_cursor = solutions_manager.get_solutions(exercise_id, user_id=user_id, after=cursors[-1])
+    
+    if not solutions:
+        st.info("No solutions shared for this exercise yet. Be the first!")
     
     for solution in solutions:
-        with st.expander(f"{solution['title']} by {solution['author']} ❤️ {solution['likes']}"):
-            st.markdown(f"**Exercise:** {solution['exercise']}")
-            st.markdown(f"**Description:** {solution['description']}")
+        # Likes still queued for the next batched counter update
+        likes = solution['likes'] + like_counter.pending(solution['id'])
+        with st.expander(f"{solution['title']} by {solution['author']} ❤️ {likes}"):
+            if solution['description']:
+                st.markdown(f"**Description:** {solution['description']}")
             
             col1, col2 = st.columns([2, 1])
             
@@ -147,25 +134,45 @@ else:
                 st.code(solution['code'], language='python')
             
             with col2:
-                if st.button(f"👍 Like ({solution['likes']})", key=f"like_{solution['title']}"):
-                    st.success("Liked!")
+                if solution['liked']:
+                    st.button(f"👍 Liked ({likes})", key=f"like_{solution['id']}", disabled=True)
+                elif st.button(f"👍 Like ({likes})", key=f"like_{solution['id']}"):
+                    if not user_id:
+                        st.info("Log in to like solutions.")
+                    elif solutions_manager.like_solution(solution['id'], user_id):
+                        st.rerun()
                 
-                if st.button("💬 Comment", key=f"comment_{solution['title']}"):
+                if st.button("💬 Comment", key=f"comment_{solution['id']}"):
                     st.info("Comment feature coming soon!")
                 
-                if st.button("📋 Copy Code", key=f"copy_{solution['title']}"):
+                if st.button("📋 Copy Code", key=f"copy_{solution['id']}"):
                     st.success("Code copied to clipboard!")
     
+    col1, col2 = st.columns(2)
+    with col1:
+        if len(cursors) > 1 and st.button("⬅️ Previous"):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        if next_cursor and st.button("More solutions ➡️"):
+            cursors.append(next_cursor)
+            st.rerun()
+    
     st.markdown("---")
     
     # Share your own solution
     st.subheader("📤 Share Your Solution")
     
+    if not user_id:
+        st.info("Log in to share your solutions with the community.")
+        return
+    
     with st.form("share_solution"):
-        exercise_id = st.selectbox("Select Exercise", [
-            "fibonacci_sequence", "prime_checker", "palindrome_checker",
-            "calculator_advanced", "word_counter"
-        ])
+        share_exercise_id = st.selectbox(
+            "Select Exercise",
+            list(EXERCISES),
+            format_func=lambda exercise: EXERCISES[exercise]['title']
+        )
         
         solution_title = st.text_input("Solution Title")
         solution_description = st.text_area("Description")
@@ -173,8 +180,14 @@ else:
         
         if st.form_submit_button("Share Solution"):
             if solution_title and solution_code:
-                st.success("Solution shared with the community!")
-                st.balloons()
+                success, message = solutions_manager.share_solution(
+                    user_id, share_exercise_id, solution_title, solution_code, solution_description or None
+                )
+                if success:
+                    st.success("Solution shared with the community!")
+                    st.balloons()
+                else:
+                    st.error(message)
             else:
                 st.error("Please provide title and code")
 
@@ -182,23 +195,37 @@ def show_leaderboard():
     """Show community leaderboard"""
     st.subheader("🏆 Community Leaderboard")
     
-    # Sample leaderboard data
+    # Precomputed scores, so neither query aggregates over users' progress
     leaderboard_data = [
-        {"Rank": 1, "User": "PythonMaster", "Exercises": 40, "Tutorials": 5, "Solutions Shared": 15, "Points": 450},
-        {"Rank": 2, "User": "CodeWiz22", "Exercises": 38, "Tutorials": 5, "Solutions Shared": 12, "Points": 425},
-        {"Rank": 3, "User": "AlgoExpert", "Exercises": 35, "Tutorials": 4, "Solutions Shared": 18, "Points": 405},
-        {"Rank": 4, "User": "DataNinja", "Exercises": 32, "Tutorials": 5, "Solutions Shared": 8, "Points": 380},
-        {"Rank": 5, "User": "PyLearner", "Exercises": 30, "Tutorials": 4, "Solutions Shared": 10, "Points": 350},
+        {
+            "Rank": leader['rank'],
+            "User": leader['username'],
+            "Exercises": leader['exercises'],
+            "Tutorials": leader['tutorials'],
+            "Solution Likes": leader['solution_likes'],
+            "Points": leader['points']
+        }
+        for leader in leaderboard_manager.get_top(limit=10)
     ]
     
-    df = pd.DataFrame(leaderboard_data)
-    
-    # Style the dataframe
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True
-    )
+    if leaderboard_data:
+        # Style the dataframe
+        st.dataframe(
+            leaderboard_data,
+            use_container_width=True,
+            hide_index=True
+        )
+    else:
+        st.info("No ranked learners yet. Complete exercises while logged in to get on the board!")
+    
+    if st.session_state.get('is_logged_in', False) and st.session_state.get('user_id'):
+        my_rank = leaderboard_manager.get_rank(st.session_state.user_id)
+        if my_rank:
+            st.success(f"Your rank: #{my_rank['rank']:,} of {my_rank['ranked_users']:,} with {my_rank['points']} points")
+        else:
+            st.info("Complete a tutorial or exercise to get ranked.")
+    else:
+        st.caption("Log in to see your own rank.")
     
     st.markdown("---")
     
@@ -216,41 +243,70 @@ def show_leaderboard():
     with col3:
         st.info("**Solution Sharing**\n3 points per like")
 
+def time_ago(timestamp):
+    """Human readable age of a timestamp, e.g. '5 minutes ago'"""
+    seconds = max(int((datetime.now() - timestamp).total_seconds()), 0)
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = seconds // size
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+    return "just now"
+
+def describe_activity(activity):
+    """(action, item) phrase for one activity event"""
+    kind, item = activity['kind'], activity['item']
+    if kind == EXERCISE_COMPLETED:
+        return "completed", f"{EXERCISES.get(item, {}).get('title', item)} exercise"
+    if kind == SOLUTION_SHARED:
+        return "shared solution for", EXERCISES.get(item, {}).get('title', item)
+    if kind == ACHIEVEMENT_EARNED:
+        return "earned achievement", item
+    if kind == FORUM_REPLY:
+        return "replied to", item
+    return kind, item
+
 def show_recent_activity():
     """Show recent community activity"""
     st.subheader("📈 Recent Activity")
     
-    # Sample activity feed
-    activities = [
-        {"time": "2 minutes ago", "user": "Alice_Dev", "action": "completed", "item": "Fibonacci Numbers exercise"},
-        {"time": "5 minutes ago", "user": "BobCoder", "action": "shared solution for", "item": "Prime Checker"},
-        {"time": "10 minutes ago", "user": "CharlieCode", "action": "earned achievement", "item": "Speed Coder"},
-        {"time": "15 minutes ago", "user": "DataDave", "action": "started", "item": "Functions tutorial"},
-        {"time": "20 minutes ago", "user": "EvaScript", "action": "helped answer", "item": "question about loops"},
-        {"time": "25 minutes ago", "user": "FrankPy", "action": "completed", "item": "all Variables exercises"},
-    ]
+    # Served from the process-wide ring buffer, so reruns rarely reach Postgres
+    activities = get_feed().recent(limit=20)
+    
+    if not activities:
+        st.info("No community activity yet. Complete an exercise while logged in to start the feed!")
     
     for activity in activities:
         col1, col2 = st.columns([1, 4])
         
         with col1:
-            st.caption(activity["time"])
+            st.caption(time_ago(activity['created_at']))
         
         with col2:
-            st.markdown(f"**{activity['user']}** {activity['action']} *{activity['item']}*")
+            action, item = describe_activity(activity)
+            st.markdown(f"**{activity['username']}** {action} *{item}*")
     
     st.markdown("---")
     
     # Activity chart
     st.subheader("📊 Activity Trends")
     
-    # Sample activity data for the past week
-    dates = [(datetime.now() - timedelta(days=i)).strftime('%m/%d') for i in range(7, 0, -1)]
-    activities_count = [45, 52, 38, 61, 47, 58, 42]
+    trend_range = st.radio("Range", ["Last 24 hours", "Last 7 days", "Last 30 days"], index=1, horizontal=True)
+    
+    # Pre-aggregated buckets, so the cost does not grow with the number of submissions
+    if trend_range == "Last 24 hours":
+        buckets = activity_rollup.get_activity(24, granularity='hour')
+        label_format = '%H:00'
+    else:
+        days = 7 if trend_range == "Last 7 days" else 30
+        buckets = activity_rollup.get_activity(days, granularity='day')
+        label_format = '%m/%d'
     
+    # Only this chart needs a DataFrame, so pandas loads when it is first drawn
+    import pandas as pd
     activity_df = pd.DataFrame({
-        'Date': dates,
-        'Activities': activities_count
+        'Date': [bucket['bucket'].strftime(label_format) for bucket in buckets],
+        'Submissions': [bucket['submissions'] for bucket in buckets],
+        'Completions': [bucket['completions'] for bucket in buckets]
     })
     
     st.line_chart(activity_df.set_index('Date'))
@@ -259,23 +315,27 @@ def show_global_stats():
     """Show global platform statistics"""
     st.subheader("🌍 Global Platform Statistics")
     
+    # Shared snapshot of counters and estimates, refreshed once a minute per process
+    totals = get_platform_stats().snapshot()
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Users", "1,247", delta="47 this week")
-        st.metric("Countries", "23", delta="2 new")
+        st.metric("Registered Learners", f"{totals.get('learners', 0):,}")
+        st.metric("Active Today", f"{totals.get('active_today', 0):,}")
     
     with col2:
-        st.metric("Exercises Completed", "15,890", delta="1,245 this week")
-        st.metric("Success Rate", "87%", delta="3% improvement")
+        st.metric("Exercises Completed", f"{totals.get('exercises_completed', 0):,}")
+        st.metric("Success Rate", f"{totals.get('success_rate', 0)}%")
     
     with col3:
-        st.metric("Code Submissions", "28,456", delta="2,134 this week")
-        st.metric("Community Posts", "342", delta="28 this week")
+        st.metric("Code Submissions", f"{totals.get('submissions', 0):,}")
+        st.metric("Community Posts", f"{totals.get('posts', 0):,}",
+                  delta=f"{totals.get('posts_this_week', 0)} this week")
     
     with col4:
-        st.metric("Average Session", "24 min", delta="2 min longer")
-        st.metric("Return Rate", "73%", delta="5% improvement")
+        st.metric("Average Session", f"{totals.get('average_session_minutes', 0)} min")
+        st.metric("Return Rate", f"{totals.get('return_rate', 0)}%")
     
     st.markdown("---")
     
@@ -283,15 +343,20 @@ def show_global_stats():
     st.subheader("🔥 Most Popular Exercises")
     
     popular_exercises = [
-        {"Exercise": "Hello World", "Completions": 1247, "Success Rate": "98%"},
-        {"Exercise": "Fibonacci Numbers", "Completions": 856, "Success Rate": "76%"},
-        {"Exercise": "Prime Checker", "Completions": 734, "Success Rate": "68%"},
-        {"Exercise": "Calculator", "Completions": 692, "Success Rate": "91%"},
-        {"Exercise": "Palindrome Checker", "Completions": 567, "Success Rate": "82%"},
+        {
+            "Exercise": EXERCISES.get(stat['exercise_id'], {}).get('title', stat['exercise_id']),
+            "Completions": stat['completions'],
+            "Attempts": stat['total_attempts'],
+            "Success Rate": f"{stat['success_rate']}%",
+            "Most Common Error": stat['common_errors'][0][0] if stat['common_errors'] else "-"
+        }
+        for stat in stats_manager.get_exercise_stats(limit=10)
     ]
     
-    df_popular = pd.DataFrame(popular_exercises)
-    st.dataframe(df_popular, use_container_width=True, hide_index=True)
+    if popular_exercises:
+        st.dataframe(popular_exercises, use_container_width=True, hide_index=True)
+    else:
+        st.info("No exercise submissions yet.")
     
     st.markdown("---")
     
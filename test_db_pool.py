@@ -0,0 +1,82 @@
+"""
+Tests that pooled connections survive the server dropping them.
+
+Only run when PGHOST or PGDATABASE is set.
+"""
+import os
+import pytest
+import psycopg2
+from utils.db_pool import ConnectionPool
+
+pytestmark = pytest.mark.skipif(not (os.getenv('PGHOST') or os.getenv('PGDATABASE')),
+                                reason="PostgreSQL is not configured")
+
+
+CONNECTION_PARAMS = {
+    'host': os.getenv('PGHOST'),
+    'port': os.getenv('PGPORT'),
+    'database': os.getenv('PGDATABASE'),
+    'user': os.getenv('PGUSER'),
+    'password': os.getenv('PGPASSWORD')
+}
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(CONNECTION_PARAMS)
+    yield pool
+    pool.close_all()
+
+
+def _terminate(pool, conn):
+    """Kill conn's backend from another connection, as a Postgres restart would"""
+    pid = conn.get_backend_pid()
+    killer = psycopg2.connect(**pool.connection_params)
+    try:
+        killer.cursor().execute("SELECT pg_terminate_backend(%s)", (pid,))
+        killer.commit()
+    finally:
+        killer.close()
+
+
+def test_long_idle_connection_is_validated():
+    pool = ConnectionPool(CONNECTION_PARAMS, validate_after=0)
+    conn = pool.connect()
+    pid = conn.get_backend_pid()
+    conn.close()
+    _terminate(pool, conn)
+
+    conn = pool.connect()
+    assert conn.get_backend_pid() != pid
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1")
+    assert cursor.fetchone() == (1,)
+    conn.close()
+    pool.close_all()
+
+
+def test_recently_used_connection_is_not_validated(pool):
+    conn = pool.connect()
+    pid = conn.get_backend_pid()
+    conn.close()
+    conn = pool.connect()
+    assert conn.get_backend_pid() == pid
+    conn.close()
+
+
+def test_rollback_after_the_server_dropped_the_connection(pool):
+    conn = pool.connect()
+    pid = conn.get_backend_pid()
+    _terminate(pool, conn)
+
+    with pytest.raises(psycopg2.OperationalError):
+        conn.cursor().execute("SELECT 1")
+    conn.rollback()
+
+    # Other idle connections are dropped along with the broken one
+    other = pool.connect()
+    other_pid = other.get_backend_pid()
+    other.close()
+    conn.close()
+    assert other.closed
+    assert pool.connect().get_backend_pid() not in (pid, other_pid)
@@ -0,0 +1,50 @@
+"""
+Tests that runs sharing an execution profile cannot affect each other.
+"""
+import math
+from utils.code_executor import CodeExecutor
+from utils.execution_profiles import get_profile
+from utils.safety_policy import SafetyPolicy
+
+# Lets test code reach its builtins directly, as a policy escape would
+PERMISSIVE = SafetyPolicy(allowed_dunders={'__name__', '__globals__', '__builtins__'})
+
+
+def test_builtins_are_copied_per_run():
+    executor = CodeExecutor(policy=PERMISSIVE)
+    tampered = (
+        "def f():\n    pass\n"
+        "f.__globals__['__builtins__']['len'] = lambda items: 42\n"
+        "print(len([1, 2]))"
+    )
+    assert executor.execute_code(tampered)[2].strip() == '42'
+
+    assert CodeExecutor().execute_code("print(len([1, 2]))")[2].strip() == '2'
+    assert executor.execute_code("print(len([1, 2]))")[2].strip() == '2'
+
+
+def test_namespaces_do_not_share_builtins():
+    profile = get_profile('standard')
+    first = profile.namespace()
+    first['__builtins__']['print'] = None
+    assert profile.namespace()['__builtins__']['print'] is print
+    assert profile.namespace(seed=7)['__builtins__']['print'] is print
+
+
+def test_modules_are_read_only_views():
+    executor = CodeExecutor()
+    success, message, _ = executor.execute_code("import math\nmath.pi = 3")
+    assert not success
+    assert math.pi != 3
+
+    success, message, _ = executor.execute_code("import random\nprint(random._os)")
+    assert not success
+
+    assert executor.execute_code("import math\nprint(math.sqrt(16))")[2].strip() == '4.0'
+    assert executor.execute_code("from random import randint\nprint(randint(1, 1))")[2].strip() == '1'
+
+
+def test_seeded_runs_replay():
+    executor = CodeExecutor()
+    code = "import random\nprint(random.randint(1, 1000000))"
+    assert executor.execute_code(code, seed=3)[2] == executor.execute_code(code, seed=3)[2]
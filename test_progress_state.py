@@ -0,0 +1,90 @@
+"""
+Tests for the compact per-session progress state.
+"""
+import pytest
+from utils.achievements import ACHIEVEMENT_TITLES
+from utils.progress_state import ProgressState, TUTORIAL_IDS, EXERCISE_IDS
+
+
+def test_round_trip():
+    state = ProgressState()
+    state.complete_tutorial(TUTORIAL_IDS[0])
+    state.complete_tutorial(TUTORIAL_IDS[-1])
+    state.complete_exercise(EXERCISE_IDS[-1])
+    state.add_category_item('Variables')
+    state.add_category_item('Variables')
+    state.add_achievement(ACHIEVEMENT_TITLES[1], earned_at=200)
+    state.add_achievement(ACHIEVEMENT_TITLES[0], earned_at=100)
+    state.add_achievement('Beta tester', earned_at=300)
+
+    restored = ProgressState.from_bytes(state.to_bytes())
+    assert restored.completed_tutorials() == {TUTORIAL_IDS[0], TUTORIAL_IDS[-1]}
+    assert restored.completed_exercises() == {EXERCISE_IDS[-1]}
+    assert restored.category_count('Variables') == 2
+    assert restored.category_count('Loops') == 0
+    assert sorted(restored.achievement_items()) == sorted([
+        (ACHIEVEMENT_TITLES[0], 100), (ACHIEVEMENT_TITLES[1], 200), ('Beta tester', 300)
+    ])
+    assert (restored.start_time, restored.last_activity) == (state.start_time, state.last_activity)
+    assert restored.to_bytes() == state.to_bytes()
+
+
+def test_empty_round_trip():
+    state = ProgressState()
+    restored = ProgressState.from_bytes(state.to_bytes())
+    assert restored.tutorial_count() == restored.exercise_count() == 0
+    assert restored.achievement_items() == []
+
+
+def test_exercise_attempts_round_trip():
+    state = ProgressState()
+    state.add_exercise_attempt(EXERCISE_IDS[0])
+    state.add_exercise_attempt(EXERCISE_IDS[-1])
+    state.add_exercise_attempt(EXERCISE_IDS[-1])
+    state.add_exercise_attempt('no_such_exercise')
+    state.add_achievement('Beta tester', earned_at=300)
+
+    restored = ProgressState.from_bytes(state.to_bytes())
+    assert restored.exercise_attempt(EXERCISE_IDS[0]) == 1
+    assert restored.exercise_attempt(EXERCISE_IDS[-1]) == 2
+    assert restored.exercise_attempt(EXERCISE_IDS[1]) == 0
+    assert restored.achievement_items() == [('Beta tester', 300)]
+
+
+def test_version_1_state_is_read():
+    state = ProgressState()
+    state.complete_exercise(EXERCISE_IDS[0])
+    # Version 1 ends where version 2's (here empty) attempt section starts
+    data = bytearray(state.to_bytes()[:-2])
+    data[0] = 1
+
+    restored = ProgressState.from_bytes(bytes(data))
+    assert restored.completed_exercises() == {EXERCISE_IDS[0]}
+    assert restored.exercise_attempt(EXERCISE_IDS[0]) == 0
+
+
+def test_unsupported_version_is_rejected():
+    data = bytearray(ProgressState().to_bytes())
+    data[0] = 99
+    with pytest.raises(ValueError):
+        ProgressState.from_bytes(bytes(data))
+
+
+def test_completing_twice():
+    state = ProgressState()
+    assert state.complete_exercise(EXERCISE_IDS[0])
+    assert not state.complete_exercise(EXERCISE_IDS[0])
+    assert state.exercise_count() == 1
+    assert state.add_achievement(ACHIEVEMENT_TITLES[0])
+    assert not state.add_achievement(ACHIEVEMENT_TITLES[0])
+
+
+def test_unknown_ids_are_ignored():
+    state = ProgressState()
+    assert not state.complete_tutorial('no_such_tutorial')
+    assert not state.complete_exercise('no_such_exercise')
+    assert not state.is_tutorial_completed('no_such_tutorial')
+    assert not state.is_exercise_completed('no_such_exercise')
+    state.add_category_item('No such category')
+    assert state.category_count('No such category') == 0
+    assert state.tutorial_count() == state.exercise_count() == 0
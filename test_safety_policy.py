@@ -0,0 +1,58 @@
+"""
+Tests for the sandbox's AST safety policy.
+"""
+import pytest
+from utils.safety_policy import SafetyPolicy
+
+
+@pytest.mark.parametrize('code', [
+    "d = '_' * 2\nprint(getattr(print, d + 'self' + d).open('/etc/hostname').read())",
+    "name = 'x'\ngetattr(print, name)",
+    "getattr(*[print, '__self__'])",
+    "g = getattr\ng(print, '__self__')",
+    "getattr(print, '__self__')",
+    "import math\ngetattr(math, 'open')",
+    "import math\nmath.open('/etc/hostname')",
+    "open('/etc/hostname')",
+    "f = open\nf('/etc/passwd')",
+    "x = eval",
+    "print(list(map(eval, ['1'])))",
+    "f = open\nopen = 1",
+    "open = open",
+    "if False:\n    open = 1\nopen('/etc/hostname')",
+    "def g():\n    open = 1\nf = open",
+    "def g():\n    return open\nopen = 1",
+    "def g(open=open):\n    return open",
+    "class A:\n    open = 1\n    f = open",
+    "open = 1\ndel open\nopen('/etc/hostname')",
+    "def g():\n    global open\n    return open\nopen = 1",
+    "[open for x in [1]]",
+    "print.__self__",
+    "__builtins__['len']",
+    "(x for x in []).gi_frame.f_back.f_globals",
+    "import os",
+])
+def test_rejects_escapes(code):
+    is_safe, message = SafetyPolicy().check(code)
+    assert not is_safe, message
+
+
+@pytest.mark.parametrize('code', [
+    "file = 'notes.txt'\nprint(file)",
+    "vars = [1, 2]\ninput = 'typed'\nprint(vars, input)",
+    "def greet(input):\n    return input",
+    "class Note:\n    def __init__(self):\n        self.file = 1\n        self.input = 2\n"
+    "    def show(self):\n        return self.file, self.input, self.vars",
+    "def f():\n    def input():\n        return 1\n    return input()",
+    "def outer():\n    file = 1\n    def inner():\n        return file\n    return inner",
+    "print([file for file in ['a.txt']])",
+    "print(getattr([], 'count')(1), hasattr(object(), 'file'))",
+    "class Base:\n    def __init__(self):\n        self.input = 1\n"
+    "class Child(Base):\n    def __init__(self):\n        super().__init__()",
+    "print(type(3).__name__)",
+    "print(hasattr([], 'append'), getattr([], 'count')(1))",
+    "import math\nprint(math.sqrt(16))",
+])
+def test_accepts_ordinary_code(code):
+    is_safe, message = SafetyPolicy().check(code)
+    assert is_safe, message
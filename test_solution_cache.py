@@ -0,0 +1,82 @@
+"""
+Tests for the shared cache of exercise validation verdicts.
+"""
+import pytest
+from utils.code_executor import CodeExecutor
+from utils.solution_cache import SHARED_SOLUTION_CACHE, SolutionCache, fingerprint, is_deterministic
+
+RANDOM_CODE = "import random\nprint(random.randint(1, 1000000))"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    SHARED_SOLUTION_CACHE.clear()
+    yield
+    SHARED_SOLUTION_CACHE.clear()
+
+
+def test_verdicts_are_kept_apart_by_seed():
+    executor = CodeExecutor()
+    expected = executor.execute_code(RANDOM_CODE, seed=1)[2].strip()
+
+    assert executor.validate_exercise_solution(RANDOM_CODE, expected_output=expected, seed=1, exercise_id='dice')[0]
+    assert not executor.validate_exercise_solution(RANDOM_CODE, expected_output=expected, seed=2, exercise_id='dice')[0]
+    assert executor.validate_exercise_solution(RANDOM_CODE, expected_output=expected, seed=1, exercise_id='dice')[0]
+    assert len(SHARED_SOLUTION_CACHE) == 2
+
+
+def test_unseeded_random_code_is_not_cached():
+    CodeExecutor().validate_exercise_solution(RANDOM_CODE, expected_output='1', exercise_id='dice')
+    assert len(SHARED_SOLUTION_CACHE) == 0
+
+
+def test_code_that_only_mentions_random_is_cached():
+    code = "# no random here\nprint('random')"
+    assert CodeExecutor().validate_exercise_solution(code, expected_output='random', exercise_id='echo')[0]
+    assert len(SHARED_SOLUTION_CACHE) == 1
+
+
+@pytest.mark.parametrize('code', [
+    "import random",
+    "import random as r",
+    "import math, random.x",
+    "from random import randint as roll",
+    "def roll():\n    import random\n    return random.random()",
+    "r = __import__('random')",
+    "load = __import__\nr = load('ran' + 'dom')",
+    "import builtins\nr = builtins.__import__('random')",
+])
+def test_nondeterministic_imports(code):
+    assert not is_deterministic(code)
+
+
+@pytest.mark.parametrize('code', [
+    "import math\nprint(math.pi)",
+    "from math import sqrt\nprint(sqrt(4))",
+    "randomness = 'random'  # import random\nprint(randomness)",
+])
+def test_deterministic_code(code):
+    assert is_deterministic(code)
+
+
+def test_verdicts_are_kept_apart_by_exercise():
+    executor = CodeExecutor()
+    code = "print('Hello, World!')"
+    assert executor.validate_exercise_solution(code, expected_output='Hello, World!', exercise_id='hello')[0]
+    assert not executor.validate_exercise_solution(code, expected_output='Hi', exercise_id='greeting')[0]
+
+
+def test_fingerprint_ignores_formatting():
+    assert fingerprint("x = 1  # one\nprint( x )") == fingerprint("x=1\nprint(x)")
+    assert fingerprint("x = 1") != fingerprint("x = 2")
+    assert fingerprint("x = (") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SolutionCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
@@ -0,0 +1,44 @@
+"""
+Tests for how the SQLite tracker picks the owner of the stored progress.
+"""
+import pytest
+import streamlit as st
+from utils import sqlite_tracker
+from utils.sqlite_tracker import SQLiteProgressTracker
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    store = sqlite_tracker.SQLiteProgressStore(str(tmp_path / 'progress.sqlite3'))
+    monkeypatch.setattr(sqlite_tracker, '_store', store)
+    yield store
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+
+def test_guest_token_is_kept_out_of_the_url(store):
+    tracker = SQLiteProgressTracker()
+    assert tracker.owner_id == f"guest:{st.session_state.guest_token}"
+    assert 'guest' not in st.query_params
+
+
+def test_login_switches_owner_and_keeps_guest_progress(store):
+    tracker = SQLiteProgressTracker()
+    tracker.complete_tutorial('variables', 'Variables')
+    guest_id = tracker.owner_id
+
+    st.session_state.is_logged_in = True
+    st.session_state.user_id = 7
+    assert tracker.owner_id == 'user:7'
+    assert tracker.is_tutorial_completed('variables')
+
+    tracker.complete_exercise('hello_world', 'Variables')
+    store.flush()
+    assert store.load('user:7').is_exercise_completed('hello_world')
+    assert not store.load(guest_id).is_exercise_completed('hello_world')
+
+    st.session_state.is_logged_in = False
+    assert tracker.owner_id == guest_id
+    assert not tracker.is_exercise_completed('hello_world')
@@ -0,0 +1,107 @@
+"""
+Conformance tests run against every progress tracker backend.
+
+The postgres backend is only tested when PGHOST or PGDATABASE is set.
+"""
+import os
+import pytest
+import streamlit as st
+from utils import sqlite_tracker
+from utils.tracker_backends import BACKENDS, ProgressTrackerBackend, create_tracker
+
+
+def _clear_session():
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def tracker(request, tmp_path, monkeypatch):
+    name = request.param
+    if name == 'postgres' and not (os.getenv('PGHOST') or os.getenv('PGDATABASE')):
+        pytest.skip("PostgreSQL is not configured")
+    if name == 'sqlite':
+        monkeypatch.setattr(sqlite_tracker, '_store', sqlite_tracker.SQLiteProgressStore(str(tmp_path / 'progress.sqlite3')))
+
+    _clear_session()
+    factory, _ = BACKENDS[name]
+    tracker = factory()
+    yield tracker
+    tracker.reset_progress()
+    _clear_session()
+
+
+def test_implements_protocol(tracker):
+    assert isinstance(tracker, ProgressTrackerBackend)
+
+
+def test_completions(tracker):
+    assert not tracker.is_tutorial_completed('variables')
+
+    tracker.complete_tutorial('variables', 'Variables')
+    tracker.complete_tutorial('variables', 'Variables')
+    tracker.complete_exercise('hello_world', 'Variables')
+
+    assert tracker.is_tutorial_completed('variables')
+    assert tracker.is_exercise_completed('hello_world')
+    assert not tracker.is_exercise_completed('dice_roller')
+    assert tracker.get_completed_tutorials_count() == 1
+    assert tracker.get_completed_exercises_count() == 1
+    assert tracker.get_category_progress('Variables') > 0
+    assert tracker.get_category_progress('Loops') == 0
+    assert 0 < tracker.get_overall_progress() < 100
+
+    data = tracker.get_progress_data()
+    assert data['completed_tutorials'] == {'variables'}
+    assert data['completed_exercises'] == {'hello_world'}
+    assert data['category_progress']['Variables'] == tracker.get_category_progress('Variables')
+
+
+def test_exercise_attempts(tracker):
+    owner_id = tracker.owner_id
+    assert tracker.get_exercise_attempt('dice_roller') == 0
+
+    tracker.complete_exercise('dice_roller', 'Loops')
+    tracker.complete_exercise('dice_roller', 'Loops')
+    assert tracker.get_exercise_attempt('dice_roller') == 2
+    assert tracker.get_exercise_attempt('hello_world') == 0
+    assert tracker.get_completed_exercises_count() == 1
+    assert tracker.owner_id == owner_id
+
+    tracker.reset_progress()
+    assert tracker.get_exercise_attempt('dice_roller') == 0
+
+
+def test_achievements(tracker):
+    tracker.complete_exercise('hello_world', 'Variables')
+    earned = tracker.get_achievements()
+    assert earned
+
+    assert tracker.add_achievement('Custom Badge')
+    assert not tracker.add_achievement('Custom Badge')
+    assert 'Custom Badge' in tracker.get_achievements()
+    assert len(tracker.get_recent_achievements(limit=1)) == 1
+    assert [achievement['title'] for achievement in tracker.get_progress_data()['achievements']].count('Custom Badge') == 1
+
+
+def test_reset_progress(tracker):
+    tracker.complete_tutorial('variables', 'Variables')
+    tracker.complete_exercise('hello_world', 'Variables')
+    tracker.reset_progress()
+
+    assert not tracker.is_tutorial_completed('variables')
+    assert tracker.get_completed_exercises_count() == 0
+    assert tracker.get_achievements() == []
+    assert tracker.get_overall_progress() == 0
+
+
+def test_unreachable_database_falls_back(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv('PGHOST', '127.0.0.1')
+    monkeypatch.setenv('PGPORT', '1')
+    monkeypatch.setattr(sqlite_tracker, '_store', sqlite_tracker.SQLiteProgressStore(str(tmp_path / 'progress.sqlite3')))
+    _clear_session()
+
+    name, _ = create_tracker(['postgres', 'sqlite'])
+    assert name == 'sqlite'
+    assert 'postgres unavailable' in caplog.text
+    _clear_session()
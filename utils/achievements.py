@@ -0,0 +1,81 @@
+from data.tutorials import TUTORIALS
+from data.exercises import EXERCISES
+
+CATEGORIES = ('Variables', 'Loops', 'Functions', 'Lists', 'Conditionals')
+
+# Completable items per category, derived from the catalogs
+CATEGORY_TOTALS = {
+    category: sum(1 for item in list(TUTORIALS.values()) + list(EXERCISES.values())
+                  if item['category'] == category)
+    for category in CATEGORIES
+}
+TOTAL_ITEMS = len(TUTORIALS) + len(EXERCISES)
+
+# Declarative rule table: (achievement_id, counter, threshold, title).
+# Counters are 'tutorials' and 'exercises' (completed counts), a category
+# name (percent of that category) or 'overall' (percent of everything).
+ACHIEVEMENT_RULES = (
+    ('first_tutorial', 'tutorials', 1, "🎓 First Steps - Completed your first tutorial!"),
+    ('bookworm', 'tutorials', 3, "📚 Bookworm - Completed 3 tutorials!"),
+    ('knowledge_seeker', 'tutorials', len(TUTORIALS), "🧠 Knowledge Seeker - Completed all tutorials!"),
+    ('first_exercise', 'exercises', 1, "💪 Problem Solver - Completed your first exercise!"),
+    ('code_runner', 'exercises', 5, "🏃 Code Runner - Completed 5 exercises!"),
+    ('speed_coder', 'exercises', 10, "⚡ Speed Coder - Completed 10 exercises!"),
+    ('exercise_master', 'exercises', 20, "🔥 Exercise Master - Completed 20 exercises!"),
+    ('python_champion', 'exercises', len(EXERCISES), "👑 Python Champion - Completed all exercises!"),
+) + tuple(
+    rule
+    for category in CATEGORIES
+    for rule in (
+        (f'{category.lower()}_apprentice', category, 50, f"🎯 {category} Apprentice - 50% progress in {category}!"),
+        (f'{category.lower()}_master', category, 100, f"🏆 {category} Master - Mastered {category}!"),
+    )
+) + (
+    ('quarter_way', 'overall', 25, "🌟 Quarter Way - 25% overall progress!"),
+    ('halfway_hero', 'overall', 50, "🚀 Halfway Hero - 50% overall progress!"),
+    ('almost_there', 'overall', 75, "🔥 Almost There - 75% overall progress!"),
+    ('python_master', 'overall', 100, "👑 Python Master - 100% completion!"),
+)
+
+ACHIEVEMENT_TITLES = tuple(title for _, _, _, title in ACHIEVEMENT_RULES)
+
+
+def _index_rules(rules):
+    """Group rules by the counter they depend on, sorted by threshold"""
+    index = {}
+    for rule in sorted(rules, key=lambda rule: rule[2]):
+        index.setdefault(rule[1], []).append(rule)
+    return index
+
+
+RULES_BY_COUNTER = _index_rules(ACHIEVEMENT_RULES)
+
+
+def category_percent(completed, category):
+    """Percent of a category's items that are completed"""
+    total = CATEGORY_TOTALS.get(category)
+    return min(100, (completed / total) * 100) if total else 0
+
+
+def overall_percent(completed):
+    """Percent of all tutorials and exercises that are completed"""
+    return min(100, (completed / TOTAL_ITEMS) * 100) if TOTAL_ITEMS else 0
+
+
+def changed_counters(item_type, category=None):
+    """Counters affected by completing one tutorial or exercise"""
+    counters = ['tutorials' if item_type == 'tutorial' else 'exercises', 'overall']
+    if category in CATEGORY_TOTALS:
+        counters.append(category)
+    return counters
+
+
+def earned_rules(counter_values):
+    """Rules reached by the given {counter: value} mapping"""
+    earned = []
+    for counter, value in counter_values.items():
+        for rule in RULES_BY_COUNTER.get(counter, ()):
+            if value < rule[2]:
+                break
+            earned.append(rule)
+    return earned
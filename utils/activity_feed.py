@@ -0,0 +1,127 @@
+import streamlit as st
+import psycopg2
+import threading
+import time
+import os
+from utils.db_pool import get_pool
+
+# Event kinds stored in activity_events.kind
+EXERCISE_COMPLETED = 'exercise'
+SOLUTION_SHARED = 'solution'
+ACHIEVEMENT_EARNED = 'achievement'
+FORUM_REPLY = 'reply'
+
+# Seconds a feed refresh may take before the previous events are served instead
+REFRESH_TIMEOUT = 2
+
+
+def record_event(cursor, user_id, kind, item):
+    """Append an activity event inside the caller's transaction"""
+    cursor.execute("""
+        INSERT INTO activity_events (user_id, kind, item, created_at)
+        VALUES (%s, %s, %s, now())
+    """, (user_id, kind, item))
+
+
+class ActivityFeed:
+    """Process-wide copy of the latest activity events, refreshed by one reader at a time"""
+
+    def __init__(self, capacity=50, refresh_interval=5.0):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.capacity = capacity
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        # Newest first; replaced whole by each refresh, never modified in place
+        self._events = []
+        self._refreshing = False
+        self._next_refresh = 0.0
+
+    def _get_connection(self):
+        """Get database connection, giving up after REFRESH_TIMEOUT"""
+        try:
+            return get_pool(dict(self.connection_params, connect_timeout=REFRESH_TIMEOUT,
+                                 options=f"-c statement_timeout={REFRESH_TIMEOUT * 1000}")).connect()
+        except Exception as e:
+            st.error(f"Database connection failed: {str(e)}")
+            return None
+
+    def recent(self, limit=20):
+        """Latest events, newest first; Postgres is queried at most once per refresh_interval"""
+        with self._lock:
+            # Only one reader refreshes; everyone else keeps getting the previous events
+            refresh = not self._refreshing and time.monotonic() >= self._next_refresh
+            if refresh:
+                self._refreshing = True
+                self._next_refresh = time.monotonic() + self.refresh_interval
+            events = self._events
+
+        if refresh:
+            try:
+                events = self._refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+        return events[:limit]
+
+    def invalidate(self):
+        """Fetch new events on the next read, e.g. right after this process wrote one"""
+        with self._lock:
+            self._next_refresh = 0.0
+
+    def _refresh(self):
+        """Re-read the newest events, returns the events now being served"""
+        conn = self._get_connection()
+        if not conn:
+            return self._events
+
+        try:
+            cursor = conn.cursor()
+            # The whole window is re-read rather than only ids past the newest one seen:
+            # BIGSERIAL ids can commit out of order, and a late commit must still show up
+            cursor.execute("""
+                SELECT e.id, u.username, e.kind, e.item, e.created_at
+                FROM activity_events e
+                JOIN users u ON u.id = e.user_id
+                ORDER BY e.id DESC
+                LIMIT %s
+            """, (self.capacity,))
+
+            events = [
+                {
+                    'id': row[0],
+                    'username': row[1],
+                    'kind': row[2],
+                    'item': row[3],
+                    'created_at': row[4]
+                }
+                for row in cursor.fetchall()
+            ]
+            with self._lock:
+                self._events = events
+            return events
+
+        except Exception as e:
+            st.error(f"Error fetching recent activity: {str(e)}")
+            return self._events
+        finally:
+            cursor.close()
+            conn.close()
+
+
+_feed = None
+_feed_lock = threading.Lock()
+
+
+def get_feed():
+    """Get the shared feed, created on first use"""
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = ActivityFeed()
+        return _feed
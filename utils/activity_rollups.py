@@ -0,0 +1,182 @@
+import streamlit as st
+import psycopg2
+import os
+from datetime import datetime, timedelta
+from utils.db_pool import get_pool
+
+ROLLUP_NAME = 'activity'
+
+# Writes are bucketed by their transaction's start time, so an hour is only rolled
+# up once transactions that began in it have had time to commit
+ROLLUP_GRACE = '5 minutes'
+
+# granularity -> (rollup table, bucket column, bucket width)
+GRANULARITIES = {
+    'hour': ('activity_hourly', 'bucket', timedelta(hours=1)),
+    'day': ('activity_daily', 'day', timedelta(days=1)),
+}
+
+# Fold the closed hours [start, end) of every user into the global rollups
+ROLL_UP_SQL = """
+    WITH hours AS (
+        SELECT bucket, SUM(submissions) AS submissions, SUM(completions) AS completions
+        FROM user_activity_hourly
+        WHERE bucket >= %(start)s AND bucket < %(end)s
+        GROUP BY bucket
+    ),
+    hourly AS (
+        INSERT INTO activity_hourly (bucket, submissions, completions)
+        SELECT bucket, submissions, completions FROM hours
+        ON CONFLICT (bucket) DO NOTHING
+    )
+    INSERT INTO activity_daily (day, submissions, completions)
+    SELECT bucket::date, SUM(submissions), SUM(completions) FROM hours
+    GROUP BY bucket::date
+    ON CONFLICT (day) DO UPDATE
+    SET submissions = activity_daily.submissions + EXCLUDED.submissions,
+        completions = activity_daily.completions + EXCLUDED.completions
+"""
+
+
+def record_activity(cursor, user_id, submissions=0, completions=0):
+    """Count activity in the user's current hour, inside the caller's transaction"""
+    cursor.execute("""
+        INSERT INTO user_activity_hourly (user_id, bucket, submissions, completions)
+        VALUES (%s, date_trunc('hour', now()), %s, %s)
+        ON CONFLICT (user_id, bucket) DO UPDATE
+        SET submissions = user_activity_hourly.submissions + EXCLUDED.submissions,
+            completions = user_activity_hourly.completions + EXCLUDED.completions
+    """, (user_id, submissions, completions))
+
+
+def current_bucket(cursor, granularity):
+    """Start of the current hour or day by the database clock, the one that buckets every write"""
+    cursor.execute("SELECT date_trunc(%s, now())::timestamp", (granularity,))
+    return cursor.fetchone()[0]
+
+
+def truncate(moment, granularity):
+    """Start of the hour or day containing `moment`"""
+    if granularity == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return datetime(moment.year, moment.month, moment.day)
+
+
+def fill_buckets(rows, start, end, granularity):
+    """Every bucket in [start, end) with its (submissions, completions), zero where idle"""
+    width = GRANULARITIES[granularity][2]
+    counts = {bucket: (submissions, completions) for bucket, submissions, completions in rows}
+    buckets = []
+    bucket = truncate(start, granularity)
+    while bucket < end:
+        submissions, completions = counts.get(bucket, (0, 0))
+        buckets.append({'bucket': bucket, 'submissions': submissions, 'completions': completions})
+        bucket += width
+    return buckets
+
+
+class ActivityRollup:
+    """Maintain and read the hourly and daily platform activity rollups"""
+
+    def __init__(self):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+
+    def _get_connection(self):
+        """Get database connection"""
+        try:
+            return get_pool(self.connection_params).connect()
+        except Exception as e:
+            st.error(f"Database connection failed: {str(e)}")
+            return None
+
+    def roll_up(self):
+        """Fold every closed hour since the watermark into the rollups, returns the hours rolled up"""
+        conn = self._get_connection()
+        if not conn:
+            return 0
+
+        try:
+            cursor = conn.cursor()
+            hours = self._roll_up(cursor)
+            conn.commit()
+            return hours
+
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _roll_up(self, cursor):
+        # Cheap check first, so readers only take the row lock when there is work
+        cursor.execute("""
+            SELECT rolled_up_to < date_trunc('hour', now() - %s::interval)
+            FROM rollup_state WHERE name = %s
+        """, (ROLLUP_GRACE, ROLLUP_NAME))
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return 0
+
+        # Another session already rolling up skips this one
+        cursor.execute("""
+            SELECT rolled_up_to, date_trunc('hour', now() - %s::interval)::timestamp
+            FROM rollup_state WHERE name = %s
+            FOR UPDATE SKIP LOCKED
+        """, (ROLLUP_GRACE, ROLLUP_NAME))
+        row = cursor.fetchone()
+        if not row or row[1] <= row[0]:
+            return 0
+
+        start, end = row
+        cursor.execute(ROLL_UP_SQL, {'start': start, 'end': end})
+        cursor.execute("""
+            UPDATE rollup_state SET rolled_up_to = %s WHERE name = %s
+        """, (end, ROLLUP_NAME))
+        return int((end - start).total_seconds() // 3600)
+
+    def get_activity(self, periods, granularity='day'):
+        """Platform submissions and completions for the last `periods` hours or days, the current one included"""
+        table, column, width = GRANULARITIES[granularity]
+        conn = self._get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+            self._roll_up(cursor)
+            conn.commit()
+
+            # The range comes from the same clock as the buckets, whatever the app server's timezone
+            end = current_bucket(cursor, granularity) + width
+            start = end - periods * width
+
+            # Rolled up buckets plus the few hours past the watermark, in one snapshot
+            cursor.execute(f"""
+                SELECT bucket, SUM(submissions), SUM(completions) FROM (
+                    SELECT {column}::timestamp AS bucket, submissions, completions
+                    FROM {table}
+                    WHERE {column} >= %(start)s AND {column} < %(end)s
+                    UNION ALL
+                    SELECT date_trunc(%(granularity)s, bucket), submissions, completions
+                    FROM user_activity_hourly
+                    WHERE bucket >= (SELECT rolled_up_to FROM rollup_state WHERE name = %(name)s)
+                      AND bucket >= %(start)s AND bucket < %(end)s
+                ) buckets
+                GROUP BY bucket
+            """, {'start': start, 'end': end, 'granularity': granularity, 'name': ROLLUP_NAME})
+
+            return fill_buckets(cursor.fetchall(), start, end, granularity)
+
+        except Exception as e:
+            st.error(f"Error fetching activity trends: {str(e)}")
+            return []
+        finally:
+            cursor.close()
+            conn.close()
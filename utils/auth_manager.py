@@ -3,6 +3,7 @@ import psycopg2
 import hashlib
 import os
 from datetime import datetime
+from utils.db_pool import get_pool
 
 class AuthManager:
     """Handle user authentication and registration"""
@@ -19,7 +20,7 @@ class AuthManager:
     def _get_connection(self):
         """Get database connection"""
         try:
-            return psycopg2.connect(**self.connection_params)
+            return get_pool(self.connection_params).connect()
         except Exception as e:
             st.error(f"Database connection failed: {str(e)}")
             return None
@@ -2,54 +2,53 @@ import io
 import sys
 import contextlib
 import traceback
-import ast
-import re
+import hashlib
+import zlib
+from functools import lru_cache
+from utils.safety_policy import DEFAULT_POLICY
+from utils.execution_profiles import get_profile
+from utils.solution_cache import SHARED_SOLUTION_CACHE, fingerprint, is_deterministic
+
+def normalize_code(code):
+    """Normalize line endings and trailing whitespace so equivalent edits compare equal"""
+    lines = code.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.rstrip() for line in lines).strip('\n')
+
+
+def code_hash(code):
+    """SHA-256 hex digest of the normalized code"""
+    return hashlib.sha256(normalize_code(code).encode('utf-8')).hexdigest()
+
+
+def pack_code(code):
+    """Normalized code as (body, compression); zlib is only used when it makes the body smaller"""
+    raw = normalize_code(code).encode('utf-8')
+    packed = zlib.compress(raw, 9)
+    return (packed, 'zlib') if len(packed) < len(raw) else (raw, 'none')
+
+
+def unpack_code(body, compression):
+    """Inverse of pack_code()"""
+    body = bytes(body)
+    return (zlib.decompress(body) if compression == 'zlib' else body).decode('utf-8')
+
 
 class CodeExecutor:
     """Safe Python code executor for educational purposes"""
     
-    def __init__(self):
-        self.allowed_builtins = {
-            'print', 'len', 'range', 'str', 'int', 'float', 'bool', 'list', 'dict', 
-            'tuple', 'set', 'abs', 'max', 'min', 'sum', 'sorted', 'reversed', 
-            'enumerate', 'zip', 'round', 'type', 'isinstance', 'hasattr', 'getattr',
-            'ord', 'chr', 'bin', 'hex', 'oct'
-        }
-        
-        self.forbidden_patterns = [
-            r'import\s+os', r'import\s+sys', r'import\s+subprocess',
-            r'__import__', r'eval\s*\(', r'exec\s*\(',
-            r'open\s*\(', r'file\s*\(', r'input\s*\(',
-            r'raw_input\s*\(', r'compile\s*\('
-        ]
+    def __init__(self, policy=None, profile=None):
+        self.policy = policy or DEFAULT_POLICY
+        self.profile = get_profile(profile)
     
-    def is_safe_code(self, code):
+    def is_safe_code(self, code, policy=None):
         """Check if code is safe to execute"""
-        # Check for forbidden patterns
-        for pattern in self.forbidden_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                return False, f"Forbidden operation detected: {pattern}"
-        
-        # Parse AST to check for dangerous operations
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name not in ['math', 'random']:
-                            return False, f"Import not allowed: {alias.name}"
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module not in ['math', 'random']:
-                        return False, f"Import not allowed: {node.module}"
-        except SyntaxError as e:
-            return False, f"Syntax error: {str(e)}"
-        
-        return True, "Code is safe"
+        # A single AST pass enforces imports, forbidden names and size limits
+        return (policy or self.policy).check(code)
     
-    def execute_code(self, code, timeout=5):
+    def execute_code(self, code, timeout=5, policy=None, profile=None, seed=None):
         """Execute Python code safely and return output"""
         # Check if code is safe
-        is_safe, message = self.is_safe_code(code)
+        is_safe, message = self.is_safe_code(code, policy)
         if not is_safe:
             return False, f"Security Error: {message}", ""
         
@@ -65,22 +64,11 @@ class CodeExecutor:
             sys.stdout = stdout_capture
             sys.stderr = stderr_capture
             
-            # Create restricted environment
-            restricted_globals = {
-                '__builtins__': {name: __builtins__[name] for name in self.allowed_builtins if name in __builtins__}
-            }
-            
-            # Add math and random if imported
-            if 'import math' in code or 'from math import' in code:
-                import math
-                restricted_globals['math'] = math
-            
-            if 'import random' in code or 'from random import' in code:
-                import random
-                restricted_globals['random'] = random
+            # Start from the profile's prebuilt namespace
+            restricted_globals = (get_profile(profile) if profile else self.profile).namespace(seed)
             
             # Execute the code
-            exec(code, restricted_globals, {})
+            exec(code, restricted_globals)
             
             # Get output
             stdout_value = stdout_capture.getvalue()
@@ -101,9 +89,28 @@ class CodeExecutor:
             sys.stdout = old_stdout
             sys.stderr = old_stderr
     
-    def validate_exercise_solution(self, code, expected_output=None, test_cases=None):
+    def validate_exercise_solution(self, code, expected_output=None, test_cases=None, policy=None, profile=None, seed=None,
+                                   exercise_id=None):
         """Validate exercise solution"""
-        success, message, output = self.execute_code(code)
+        # Verdicts for an exercise are shared across sessions by AST fingerprint.
+        # Unseeded code that imports random is nondeterministic, so it is never cached.
+        cache_key = None
+        if exercise_id and (seed is not None or is_deterministic(code)):
+            code_fingerprint = fingerprint(code)
+            if code_fingerprint:
+                cache_key = (exercise_id, seed, code_fingerprint)
+                verdict = SHARED_SOLUTION_CACHE.get(cache_key)
+                if verdict:
+                    return verdict
+        
+        verdict = self._validate(code, expected_output, test_cases, policy, profile, seed)
+        if cache_key:
+            SHARED_SOLUTION_CACHE.put(cache_key, verdict)
+        return verdict
+    
+    def _validate(self, code, expected_output, test_cases, policy, profile, seed):
+        """Run the solution and compare it against the expected output or test cases"""
+        success, message, output = self.execute_code(code, policy=policy, profile=profile, seed=seed)
         
         if not success:
             return False, message, output
@@ -119,7 +126,7 @@ class CodeExecutor:
         if test_cases:
             for test_case in test_cases:
                 test_code = code + "\n" + test_case['test']
-                test_success, test_message, test_output = self.execute_code(test_code)
+                test_success, test_message, test_output = self.execute_code(test_code, policy=policy, profile=profile, seed=seed)
                 
                 if not test_success:
                     return False, f"Test failed: {test_message}", test_output
@@ -128,3 +135,14 @@ class CodeExecutor:
                     return False, f"Test case failed: {test_case.get('description', 'Unknown test')}", test_output
         
         return True, "All tests passed!", output
+    
+    def replay_expected_output(self, solution, seed, profile=None):
+        """Expected output of a random-based solution for one replay seed"""
+        return _replay_output(solution, seed, get_profile(profile).name)
+
+
+@lru_cache(maxsize=1024)
+def _replay_output(solution, seed, profile_name):
+    """Run the reference solution once per (solution, seed, profile)"""
+    success, message, output = CodeExecutor(profile=profile_name).execute_code(solution, seed=seed)
+    return output if success else None
@@ -1,8 +1,26 @@
 import streamlit as st
 import psycopg2
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import json
+import uuid
+from utils.code_executor import code_hash, pack_code, unpack_code
+from utils.achievements import CATEGORIES, category_percent, overall_percent, changed_counters, earned_rules
+from utils.stats_manager import error_kind
+from utils.activity_feed import record_event, get_feed, EXERCISE_COMPLETED, ACHIEVEMENT_EARNED
+from utils.activity_rollups import record_activity, fill_buckets, truncate, current_bucket
+from utils.session_tracker import get_session_tracker
+from utils.db_pool import get_pool
+
+# Advisory lock namespace for serializing submissions of identical code
+SUBMISSION_LOCK_SPACE = 1
+# Advisory lock namespace keeping the blob collector off code that is being submitted
+BLOB_LOCK_SPACE = 2
+# Advisory lock namespace letting one session at a time fold score histogram deltas
+HISTOGRAM_LOCK_SPACE = 3
+
+# Submission stats cover this many recent days, so only the latest partitions are read
+STATS_WINDOW_DAYS = 30
 
 class DatabaseAdapter:
     """Simple database adapter for progress tracking"""
@@ -15,57 +33,88 @@ class DatabaseAdapter:
             'user': os.getenv('PGUSER'),
             'password': os.getenv('PGPASSWORD')
         }
-        self.current_user_id = self._get_or_create_user()
+        if not self.connection_params['host'] and not self.connection_params['database']:
+            raise RuntimeError("PostgreSQL is not configured (set PGHOST/PGDATABASE)")
+        # Guests get an in-memory identity; the users row is created on first write
+        if 'guest_username' not in st.session_state:
+            st.session_state.guest_username = f"guest_{uuid.uuid4().hex}"
+        # Identifies this browser session to the in-memory session tracker
+        if 'browser_session_id' not in st.session_state:
+            st.session_state.browser_session_id = uuid.uuid4().hex
+    
+    @property
+    def current_user_id(self):
+        """Authenticated user id, the persisted guest id, or None before the first write"""
+        if st.session_state.get('is_logged_in', False) and st.session_state.get('user_id'):
+            return st.session_state.user_id
+        return st.session_state.get('db_user_id')
+    
+    @property
+    def owner_id(self):
+        """Logged-in user id, or this session's guest name, which is fixed before the guest row exists"""
+        if st.session_state.get('is_logged_in', False) and st.session_state.get('user_id'):
+            return f"user:{st.session_state.user_id}"
+        return f"guest:{st.session_state.guest_username}"
     
     def _get_connection(self):
-        """Get database connection"""
+        """Get a pooled database connection; close() hands it back to the pool"""
         try:
-            return psycopg2.connect(**self.connection_params)
+            return get_pool(self.connection_params).connect()
         except Exception as e:
             st.error(f"Database connection failed: {str(e)}")
             return None
     
-    def _get_or_create_user(self):
-        """Get current authenticated user or create guest user"""
-        # Check if user is logged in
-        if st.session_state.get('is_logged_in', False) and st.session_state.get('user_id'):
-            return st.session_state.user_id
+    def _get_read_connection(self):
+        """Get a connection for reads, or None if the user has nothing stored yet"""
+        if self.current_user_id is None:
+            return None
+        return self._get_connection()
+    
+    def touch(self):
+        """Count a page view in the current learning session, in memory until the next heartbeat"""
+        self._record_session()
+    
+    def _record_session(self, kind=None):
+        get_session_tracker().record(st.session_state.browser_session_id, self.current_user_id, kind)
+    
+    def _ensure_user(self):
+        """Make sure the current user has a users row, creating the guest one if needed"""
+        if self.current_user_id is not None:
+            return True
         
-        # Create guest user for demo purposes
-        if 'db_user_id' not in st.session_state:
-            conn = self._get_connection()
-            if conn:
-                try:
-                    cursor = conn.cursor()
-                    
-                    # Create guest user
-                    username = f"guest_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    email = f"{username}@guest.demo"
-                    
-                    cursor.execute("""
-                        INSERT INTO users (username, email, full_name, created_at, last_active)
-                        VALUES (%s, %s, %s, %s, %s) RETURNING id
-                    """, (username, email, "Guest User", datetime.now(), datetime.now()))
-                    
-                    user_id = cursor.fetchone()[0]
-                    conn.commit()
-                    
-                    st.session_state.db_user_id = user_id
-                    st.session_state.db_username = username
-                    
-                except Exception as e:
-                    conn.rollback()
-                    st.session_state.db_user_id = 1  # Fallback
-                finally:
-                    cursor.close()
-                    conn.close()
-            else:
-                st.session_state.db_user_id = 1
+        conn = self._get_connection()
+        if not conn:
+            return False
         
-        return st.session_state.db_user_id
+        try:
+            cursor = conn.cursor()
+            
+            # Guests have no password, so they can never log in as this row
+            username = st.session_state.guest_username
+            cursor.execute("""
+                INSERT INTO users (username, email, password_hash, full_name, created_at, last_active)
+                VALUES (%s, %s, '', %s, %s, %s) RETURNING id
+            """, (username, f"{username}@guest.demo", "Guest User", datetime.now(), datetime.now()))
+            
+            user_id = cursor.fetchone()[0]
+            conn.commit()
+            
+            st.session_state.db_user_id = user_id
+            st.session_state.db_username = username
+            return True
+            
+        except Exception as e:
+            conn.rollback()
+            st.error(f"Error creating guest user: {str(e)}")
+            return False
+        finally:
+            cursor.close()
+            conn.close()
     
     def complete_tutorial(self, tutorial_id, category=None):
         """Mark tutorial as completed"""
+        if not self._ensure_user():
+            return
         conn = self._get_connection()
         if not conn:
             return
@@ -73,22 +122,15 @@ class DatabaseAdapter:
         try:
             cursor = conn.cursor()
             
-            # Check if already completed
-            cursor.execute("""
-                SELECT id FROM user_progress 
-                WHERE user_id = %s AND item_id = %s AND item_type = 'tutorial'
-            """, (self.current_user_id, tutorial_id))
+            # Only a newly inserted row can unlock achievements
+            completed = self._insert_progress(cursor, tutorial_id, 'tutorial', category)
+            if completed:
+                self._record_score(cursor, 'tutorial')
+                record_activity(cursor, self.current_user_id, completions=1)
+                self._check_achievements(cursor, 'tutorial', category)
+            conn.commit()
+            self._record_session('tutorial' if completed else 'activity')
             
-            if not cursor.fetchone():
-                cursor.execute("""
-                    INSERT INTO user_progress (user_id, item_id, item_type, category, completed_at)
-                    VALUES (%s, %s, 'tutorial', %s, %s)
-                """, (self.current_user_id, tutorial_id, category or 'Unknown', datetime.now()))
-                
-                conn.commit()
-                self._check_achievements(cursor)
-                conn.commit()
-                
         except Exception as e:
             conn.rollback()
             st.error(f"Error saving tutorial progress: {str(e)}")
@@ -98,6 +140,8 @@ class DatabaseAdapter:
     
     def complete_exercise(self, exercise_id, category=None, code=None, is_correct=True):
         """Mark exercise as completed"""
+        if not self._ensure_user():
+            return
         conn = self._get_connection()
         if not conn:
             return
@@ -107,28 +151,22 @@ class DatabaseAdapter:
             
             # Record code submission
             if code:
-                cursor.execute("""
-                    INSERT INTO code_submissions (user_id, exercise_id, code, is_correct, submitted_at)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (self.current_user_id, exercise_id, code, is_correct, datetime.now()))
+                self._record_submission(cursor, exercise_id, code, is_correct)
+            
+            # Only a newly inserted row can unlock achievements
+            completed = is_correct and self._insert_progress(cursor, exercise_id, 'exercise', category)
+            if completed:
+                self._record_completion_stats(cursor, exercise_id)
+                self._record_score(cursor, 'exercise')
+                record_activity(cursor, self.current_user_id, completions=1)
+                self._record_activity(cursor, EXERCISE_COMPLETED, exercise_id)
+                self._check_achievements(cursor, 'exercise', category)
+            elif is_correct:
+                self._count_attempt(cursor, exercise_id)
+            conn.commit()
+            get_feed().invalidate()
+            self._record_session('exercise' if completed else 'activity')
             
-            # Check if already completed
-            if is_correct:
-                cursor.execute("""
-                    SELECT id FROM user_progress 
-                    WHERE user_id = %s AND item_id = %s AND item_type = 'exercise'
-                """, (self.current_user_id, exercise_id))
-                
-                if not cursor.fetchone():
-                    cursor.execute("""
-                        INSERT INTO user_progress (user_id, item_id, item_type, category, completed_at)
-                        VALUES (%s, %s, 'exercise', %s, %s)
-                    """, (self.current_user_id, exercise_id, category or 'Unknown', datetime.now()))
-                    
-                    conn.commit()
-                    self._check_achievements(cursor)
-                    conn.commit()
-                    
         except Exception as e:
             conn.rollback()
             st.error(f"Error saving exercise progress: {str(e)}")
@@ -136,9 +174,164 @@ class DatabaseAdapter:
             cursor.close()
             conn.close()
     
+    def _insert_progress(self, cursor, item_id, item_type, category):
+        """Insert a completion row, returns False if it was already completed"""
+        cursor.execute("""
+            INSERT INTO user_progress (user_id, item_id, item_type, category, completed_at)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (user_id, item_type, item_id) DO NOTHING
+            RETURNING id
+        """, (self.current_user_id, item_id, item_type, category or 'Unknown', datetime.now()))
+        return cursor.fetchone() is not None
+    
+    def _count_attempt(self, cursor, exercise_id):
+        """Count a repeat solve of an already completed exercise (the first one inserts attempts = 1)"""
+        cursor.execute("""
+            UPDATE user_progress SET attempts = attempts + 1
+            WHERE user_id = %s AND item_type = 'exercise' AND item_id = %s
+        """, (self.current_user_id, exercise_id))
+    
+    def _record_score(self, cursor, item_type):
+        """Add a completion to the user's leaderboard score (registered users only)"""
+        if not st.session_state.get('is_logged_in', False):
+            return
+        
+        is_exercise = item_type == 'exercise'
+        cursor.execute("""
+            INSERT INTO user_scores (user_id, exercises, tutorials, updated_at)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (user_id) DO UPDATE
+            SET exercises = user_scores.exercises + EXCLUDED.exercises,
+                tutorials = user_scores.tutorials + EXCLUDED.tutorials,
+                updated_at = EXCLUDED.updated_at
+        """, (self.current_user_id, int(is_exercise), int(not is_exercise), datetime.now()))
+    
+    def _record_activity(self, cursor, kind, item):
+        """Append to the community activity feed (registered users only)"""
+        if st.session_state.get('is_logged_in', False):
+            record_event(cursor, self.current_user_id, kind, item)
+    
+    def record_submission(self, exercise_id, code, is_correct, error_message=None):
+        """Record a checked submission, counting repeats of the same code as attempts"""
+        if not self._ensure_user():
+            return
+        conn = self._get_connection()
+        if not conn:
+            return
+        
+        try:
+            cursor = conn.cursor()
+            self._record_submission(cursor, exercise_id, code, is_correct, error_message)
+            conn.commit()
+            self._record_session('activity')
+            
+        except Exception as e:
+            conn.rollback()
+            st.error(f"Error saving submission: {str(e)}")
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def _record_submission(self, cursor, exercise_id, code, is_correct, error_message=None):
+        """Insert a submission or bump the attempt count of an identical one from this month"""
+        # code_submissions is partitioned by month, so identical code is folded within the
+        # current partition. The transaction lock serializes concurrent checks of the same code.
+        # The body itself is stored once in code_blobs, shared by every identical submission;
+        # the shared blob lock stops the maintenance job deleting it before this commits.
+        body, compression = pack_code(code)
+        cursor.execute("""
+            SELECT pg_advisory_xact_lock(%(lock_space)s, hashtext(%(user_id)s || ':' || %(exercise_id)s || ':' || %(code_hash)s)),
+                   pg_advisory_xact_lock_shared(%(blob_lock_space)s, hashtext(%(code_hash)s));
+            WITH bumped AS (
+                UPDATE code_submissions
+                SET attempts = attempts + 1,
+                    is_correct = %(is_correct)s,
+                    submitted_at = %(now)s,
+                    error_message = %(error_message)s
+                WHERE user_id = %(user_id)s AND exercise_id = %(exercise_id)s AND code_hash = %(code_hash)s
+                  AND submitted_at >= date_trunc('month', %(now)s)
+                RETURNING id
+            ),
+            blob AS (
+                INSERT INTO code_blobs (code_hash, body, compression)
+                SELECT %(code_hash)s, %(body)s, %(compression)s
+                WHERE NOT EXISTS (SELECT 1 FROM bumped)
+                ON CONFLICT (code_hash) DO NOTHING
+            )
+            INSERT INTO code_submissions (user_id, exercise_id, code_hash, is_correct, submitted_at, error_message)
+            SELECT %(user_id)s, %(exercise_id)s, %(code_hash)s, %(is_correct)s, %(now)s, %(error_message)s
+            WHERE NOT EXISTS (SELECT 1 FROM bumped)
+        """, {
+            'lock_space': SUBMISSION_LOCK_SPACE,
+            'blob_lock_space': BLOB_LOCK_SPACE,
+            'user_id': self.current_user_id,
+            'exercise_id': exercise_id,
+            'code_hash': code_hash(code),
+            'body': psycopg2.Binary(body),
+            'compression': compression,
+            'is_correct': is_correct,
+            'now': datetime.now(),
+            'error_message': error_message
+        })
+        self._record_exercise_stats(cursor, exercise_id, is_correct, error_message)
+        record_activity(cursor, self.current_user_id, submissions=1)
+    
+    def _record_exercise_stats(self, cursor, exercise_id, is_correct, error_message=None):
+        """Fold one checked submission into the exercise's running aggregates"""
+        cursor.execute("""
+            INSERT INTO exercise_stats (exercise_id, total_attempts, correct_attempts, common_errors, last_updated)
+            VALUES (%(exercise_id)s, 1, %(correct)s,
+                    CASE WHEN %(error)s::text IS NULL THEN NULL ELSE jsonb_build_object(%(error)s::text, 1) END,
+                    %(now)s)
+            ON CONFLICT (exercise_id) DO UPDATE
+            SET total_attempts = exercise_stats.total_attempts + 1,
+                correct_attempts = exercise_stats.correct_attempts + EXCLUDED.correct_attempts,
+                common_errors = CASE WHEN %(error)s::text IS NULL THEN exercise_stats.common_errors
+                    ELSE jsonb_set(COALESCE(exercise_stats.common_errors, '{}'), ARRAY[%(error)s::text],
+                                   to_jsonb(COALESCE((exercise_stats.common_errors ->> %(error)s::text)::int, 0) + 1))
+                    END,
+                last_updated = EXCLUDED.last_updated
+        """, {
+            'exercise_id': exercise_id,
+            'correct': 1 if is_correct else 0,
+            'error': None if is_correct else error_kind(error_message),
+            'now': datetime.now()
+        })
+    
+    def _record_completion_stats(self, cursor, exercise_id):
+        """Count a user's first completion of an exercise"""
+        cursor.execute("""
+            INSERT INTO exercise_stats (exercise_id, successful_completions, last_updated)
+            VALUES (%s, 1, %s)
+            ON CONFLICT (exercise_id) DO UPDATE
+            SET successful_completions = exercise_stats.successful_completions + 1,
+                last_updated = EXCLUDED.last_updated
+        """, (exercise_id, datetime.now()))
+    
+    def get_submission_code(self, submission_hash):
+        """Source text of a stored submission, looked up by its code hash"""
+        conn = self._get_connection()
+        if not conn:
+            return None
+        
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT body, compression FROM code_blobs WHERE code_hash = %s
+            """, (submission_hash,))
+            
+            row = cursor.fetchone()
+            return unpack_code(*row) if row else None
+            
+        except Exception as e:
+            return None
+        finally:
+            cursor.close()
+            conn.close()
+    
     def get_category_progress(self, category):
         """Get progress for specific category"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return 0
         
@@ -150,15 +343,7 @@ class DatabaseAdapter:
             """, (self.current_user_id, category))
             
             completed_count = cursor.fetchone()[0]
-            
-            # Category totals
-            category_totals = {
-                'Variables': 8, 'Conditionals': 6, 'Loops': 8, 
-                'Functions': 8, 'Lists': 7
-            }
-            
-            total = category_totals.get(category, 10)
-            return min(100, (completed_count / total) * 100)
+            return category_percent(completed_count, category)
             
         except Exception as e:
             return 0
@@ -168,7 +353,7 @@ class DatabaseAdapter:
     
     def get_overall_progress(self):
         """Calculate overall progress percentage"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return 0
         
@@ -179,9 +364,7 @@ class DatabaseAdapter:
             """, (self.current_user_id,))
             
             total_completed = cursor.fetchone()[0]
-            total_available = 45  # 5 tutorials + 40 exercises
-            
-            return min(100, (total_completed / total_available) * 100)
+            return overall_percent(total_completed)
             
         except Exception as e:
             return 0
@@ -191,7 +374,7 @@ class DatabaseAdapter:
     
     def get_completed_tutorials_count(self):
         """Get completed tutorials count"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return 0
         
@@ -212,7 +395,7 @@ class DatabaseAdapter:
     
     def get_completed_exercises_count(self):
         """Get completed exercises count"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return 0
         
@@ -233,7 +416,7 @@ class DatabaseAdapter:
     
     def is_tutorial_completed(self, tutorial_id):
         """Check if tutorial is completed"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return False
         
@@ -252,9 +435,31 @@ class DatabaseAdapter:
             cursor.close()
             conn.close()
     
+    def get_exercise_attempt(self, exercise_id):
+        """Number of times the exercise was solved"""
+        conn = self._get_read_connection()
+        if not conn:
+            return 0
+        
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT attempts FROM user_progress
+                WHERE user_id = %s AND item_id = %s AND item_type = 'exercise'
+            """, (self.current_user_id, exercise_id))
+            
+            row = cursor.fetchone()
+            return (row[0] or 0) if row else 0
+            
+        except Exception as e:
+            return 0
+        finally:
+            cursor.close()
+            conn.close()
+    
     def is_exercise_completed(self, exercise_id):
         """Check if exercise is completed"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return False
         
@@ -275,6 +480,8 @@ class DatabaseAdapter:
     
     def add_achievement(self, achievement_title):
         """Add new achievement"""
+        if not self._ensure_user():
+            return False
         conn = self._get_connection()
         if not conn:
             return False
@@ -294,8 +501,10 @@ class DatabaseAdapter:
                     INSERT INTO user_achievements (user_id, achievement_id, achievement_title, earned_at)
                     VALUES (%s, %s, %s, %s)
                 """, (self.current_user_id, achievement_id, achievement_title, datetime.now()))
+                self._record_activity(cursor, ACHIEVEMENT_EARNED, achievement_title)
                 
                 conn.commit()
+                get_feed().invalidate()
                 return True
             
             return False
@@ -309,7 +518,7 @@ class DatabaseAdapter:
     
     def get_achievements(self):
         """Get all achievements"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return []
         
@@ -330,7 +539,7 @@ class DatabaseAdapter:
     
     def get_recent_achievements(self, limit=5):
         """Get recent achievements"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return []
         
@@ -349,70 +558,69 @@ class DatabaseAdapter:
             cursor.close()
             conn.close()
     
-    def _check_achievements(self, cursor):
-        """Check and award achievements"""
+    def _check_achievements(self, cursor, item_type, category=None):
+        """Award achievements for the counters changed by one completion"""
+        # A failure here must not roll back the completion that triggered it
+        cursor.execute("SAVEPOINT check_achievements")
         try:
-            # Get current counts
+            # All counters in a single pass over the user's progress rows
             cursor.execute("""
-                SELECT COUNT(*) FROM user_progress 
-                WHERE user_id = %s AND item_type = 'tutorial'
-            """, (self.current_user_id,))
-            completed_tutorials = cursor.fetchone()[0]
+                SELECT COUNT(*) FILTER (WHERE item_type = 'tutorial'),
+                       COUNT(*) FILTER (WHERE item_type = 'exercise'),
+                       COUNT(*) FILTER (WHERE category = %s),
+                       COUNT(*)
+                FROM user_progress 
+                WHERE user_id = %s
+            """, (category, self.current_user_id))
+            tutorials, exercises, category_count, total = cursor.fetchone()
+            
+            values = {
+                'tutorials': tutorials,
+                'exercises': exercises,
+                'overall': overall_percent(total),
+                category: category_percent(category_count, category)
+            }
+            counter_values = {counter: values[counter] for counter in changed_counters(item_type, category)}
+            rules = earned_rules(counter_values)
+            if not rules:
+                return
             
+            # Insert every newly reached achievement in one statement
             cursor.execute("""
-                SELECT COUNT(*) FROM user_progress 
-                WHERE user_id = %s AND item_type = 'exercise'
-            """, (self.current_user_id,))
-            completed_exercises = cursor.fetchone()[0]
-            
-            # Define achievements
-            achievements = [
-                (1, 'tutorial', "🎓 First Steps - Completed your first tutorial!"),
-                (3, 'tutorial', "📚 Bookworm - Completed 3 tutorials!"),
-                (5, 'tutorial', "🧠 Knowledge Seeker - Completed all tutorials!"),
-                (1, 'exercise', "💪 Problem Solver - Completed your first exercise!"),
-                (5, 'exercise', "🏃 Code Runner - Completed 5 exercises!"),
-                (10, 'exercise', "⚡ Speed Coder - Completed 10 exercises!"),
-                (20, 'exercise', "🔥 Exercise Master - Completed 20 exercises!"),
-                (40, 'exercise', "👑 Python Champion - Completed all exercises!")
-            ]
-            
-            for count_needed, item_type, achievement_title in achievements:
-                current_count = completed_tutorials if item_type == 'tutorial' else completed_exercises
-                
-                if current_count >= count_needed:
-                    # Check if achievement already exists
-                    cursor.execute("""
-                        SELECT id FROM user_achievements 
-                        WHERE user_id = %s AND achievement_title = %s
-                    """, (self.current_user_id, achievement_title))
-                    
-                    if not cursor.fetchone():
-                        achievement_id = achievement_title.lower().replace(' ', '_')
-                        cursor.execute("""
-                            INSERT INTO user_achievements (user_id, achievement_id, achievement_title, earned_at)
-                            VALUES (%s, %s, %s, %s)
-                        """, (self.current_user_id, achievement_id, achievement_title, datetime.now()))
+                INSERT INTO user_achievements (user_id, achievement_id, achievement_title, earned_at)
+                SELECT %s, r.achievement_id, r.title, %s
+                FROM unnest(%s::text[], %s::text[]) AS r(achievement_id, title)
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM user_achievements a 
+                    WHERE a.user_id = %s AND a.achievement_title = r.title
+                )
+                RETURNING achievement_title
+            """, (self.current_user_id, datetime.now(),
+                  [rule[0] for rule in rules], [rule[3] for rule in rules],
+                  self.current_user_id))
+            for (title,) in cursor.fetchall():
+                self._record_activity(cursor, ACHIEVEMENT_EARNED, title)
             
         except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT check_achievements")
             st.error(f"Error checking achievements: {str(e)}")
     
     def get_user_stats(self):
         """Get comprehensive user statistics"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         if not conn:
             return {}
         
         try:
             cursor = conn.cursor()
             
-            # Get submission stats
+            # Get submission stats; a constant lower bound lets the planner prune older partitions
             cursor.execute("""
-                SELECT COUNT(*), 
-                       SUM(CASE WHEN is_correct THEN 1 ELSE 0 END) as correct_count
+                SELECT SUM(attempts), 
+                       SUM(CASE WHEN is_correct THEN attempts ELSE 0 END) as correct_count
                 FROM code_submissions 
-                WHERE user_id = %s
-            """, (self.current_user_id,))
+                WHERE user_id = %s AND submitted_at >= %s
+            """, (self.current_user_id, datetime.now() - timedelta(days=STATS_WINDOW_DAYS)))
             
             result = cursor.fetchone()
             total_submissions = result[0] or 0
@@ -446,17 +654,105 @@ class DatabaseAdapter:
             cursor.close()
             conn.close()
     
+    def get_daily_activity(self, days=7):
+        """The user's submissions and completions per day, oldest first"""
+        end = truncate(datetime.now(), 'day') + timedelta(days=1)
+        start = end - timedelta(days=days)
+        conn = self._get_read_connection()
+        if not conn:
+            return fill_buckets([], start, end, 'day')
+        
+        try:
+            cursor = conn.cursor()
+            # Days as the database, which buckets the writes, counts them
+            end = current_bucket(cursor, 'day') + timedelta(days=1)
+            start = end - timedelta(days=days)
+            # At most 24 hourly rows per day, read off the primary key
+            cursor.execute("""
+                SELECT date_trunc('day', bucket), SUM(submissions), SUM(completions)
+                FROM user_activity_hourly
+                WHERE user_id = %s AND bucket >= %s AND bucket < %s
+                GROUP BY date_trunc('day', bucket)
+            """, (self.current_user_id, start, end))
+            
+            return fill_buckets(cursor.fetchall(), start, end, 'day')
+            
+        except Exception as e:
+            return fill_buckets([], start, end, 'day')
+        finally:
+            cursor.close()
+            conn.close()
+    
     def get_progress_data(self):
-        """Get all progress data for visualization (compatibility method)"""
-        return {
+        """Get all progress data for visualization, shaped like ProgressTracker's"""
+        data = {
             'completed_tutorials': set(),
-            'completed_exercises': set(), 
-            'achievements': self.get_achievements(),
-            'category_progress': {
-                'Variables': self.get_category_progress('Variables'),
-                'Loops': self.get_category_progress('Loops'),
-                'Functions': self.get_category_progress('Functions'),
-                'Lists': self.get_category_progress('Lists'),
-                'Conditionals': self.get_category_progress('Conditionals')
-            }
+            'completed_exercises': set(),
+            'achievements': [],
+            'category_progress': {category: 0 for category in CATEGORIES},
+            'start_date': None,
+            'last_activity': None
         }
+        conn = self._get_read_connection()
+        if not conn:
+            return data
+        
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT item_type, item_id, category, completed_at FROM user_progress WHERE user_id = %s
+            """, (self.current_user_id,))
+            
+            rows = cursor.fetchall()
+            category_counts = {}
+            for item_type, item_id, category, _ in rows:
+                data['completed_tutorials' if item_type == 'tutorial' else 'completed_exercises'].add(item_id)
+                category_counts[category] = category_counts.get(category, 0) + 1
+            last_completed = max((row[3] for row in rows if row[3]), default=None)
+            if last_completed:
+                data['last_activity'] = last_completed.isoformat()
+            for category in CATEGORIES:
+                data['category_progress'][category] = category_percent(category_counts.get(category, 0), category)
+            
+            cursor.execute("""
+                SELECT achievement_title, earned_at FROM user_achievements
+                WHERE user_id = %s ORDER BY earned_at
+            """, (self.current_user_id,))
+            data['achievements'] = [
+                {'title': title, 'date': earned_at.isoformat()} for title, earned_at in cursor.fetchall()
+            ]
+            
+            cursor.execute("SELECT created_at FROM users WHERE id = %s", (self.current_user_id,))
+            row = cursor.fetchone()
+            if row and row[0]:
+                data['start_date'] = row[0].isoformat()
+            
+            return data
+            
+        except Exception as e:
+            return data
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def reset_progress(self):
+        """Delete the user's completions and achievements (for testing purposes)"""
+        conn = self._get_read_connection()
+        if not conn:
+            return
+        
+        try:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM user_progress WHERE user_id = %s", (self.current_user_id,))
+            cursor.execute("DELETE FROM user_achievements WHERE user_id = %s", (self.current_user_id,))
+            cursor.execute("""
+                UPDATE user_scores SET exercises = 0, tutorials = 0, updated_at = %s WHERE user_id = %s
+            """, (datetime.now(), self.current_user_id))
+            conn.commit()
+            
+        except Exception as e:
+            conn.rollback()
+            st.error(f"Error resetting progress: {str(e)}")
+        finally:
+            cursor.close()
+            conn.close()
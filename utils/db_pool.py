@@ -0,0 +1,111 @@
+import psycopg2
+import psycopg2.extensions
+import threading
+import time
+
+# Idle connections kept per set of connection parameters
+POOL_SIZE = 10
+
+# Seconds a connection may sit idle before it is checked with a round trip on checkout
+VALIDATE_AFTER = 30
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """Connection whose close() hands it back to its pool instead of disconnecting"""
+
+    def close(self):
+        pool = getattr(self, 'pool', None)
+        if pool is None or not pool.release(self):
+            super().close()
+
+    def rollback(self):
+        try:
+            super().rollback()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # The server dropped the connection, and its transaction with it; callers
+            # roll back in their error handlers and must not fail there a second time
+            if not self.closed:
+                raise
+
+
+class ConnectionPool:
+    """Reuse connections across calls, so each query does not pay for a new backend process"""
+
+    def __init__(self, connection_params, size=POOL_SIZE, validate_after=VALIDATE_AFTER):
+        self.connection_params = connection_params
+        self.size = size
+        self.validate_after = validate_after
+        self._lock = threading.Lock()
+        self._idle = []
+
+    def connect(self):
+        """A live idle connection if there is one, otherwise a new one"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            # Recently used connections are handed out as they are; a broken one fails its
+            # query, and release() then drops every idle connection with it
+            if time.monotonic() - conn.idle_since < self.validate_after or self._is_alive(conn):
+                return conn
+            conn.pool = None
+            conn.close()
+
+        conn = psycopg2.connect(connection_factory=PooledConnection, **self.connection_params)
+        conn.pool = self
+        return conn
+
+    def _is_alive(self, conn):
+        """Round-trip to the server, so connections broken by e.g. a Postgres restart are dropped"""
+        if conn.closed:
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            conn.rollback()
+            return not conn.closed
+        except psycopg2.Error:
+            return False
+
+    def release(self, conn):
+        """Take a connection back, returns False if the caller should really close it"""
+        if conn.closed:
+            # Lost to e.g. a Postgres restart, which the idle connections did not survive either
+            self.close_all()
+            return True
+        try:
+            # Whatever the caller left open is discarded, as a real close would
+            conn.rollback()
+            conn.autocommit = False
+        except psycopg2.Error:
+            return False
+
+        with self._lock:
+            if len(self._idle) >= self.size:
+                return False
+            conn.idle_since = time.monotonic()
+            self._idle.append(conn)
+            return True
+
+    def close_all(self):
+        """Disconnect every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.pool = None
+            conn.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(connection_params):
+    """The shared pool for these connection parameters, created on first use"""
+    key = tuple(sorted(connection_params.items()))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(connection_params)
+        return _pools[key]
@@ -0,0 +1,94 @@
+import builtins
+import hashlib
+import math
+import random
+from types import MappingProxyType
+
+SAFE_BUILTINS = (
+    'print', 'len', 'range', 'str', 'int', 'float', 'bool', 'list', 'dict',
+    'tuple', 'set', 'abs', 'max', 'min', 'sum', 'sorted', 'reversed',
+    'enumerate', 'zip', 'round', 'type', 'isinstance', 'hasattr', 'getattr',
+    'ord', 'chr', 'bin', 'hex', 'oct'
+)
+
+
+class ModuleView:
+    """Read-only view of a module's public names, handed to learner code instead of the module"""
+
+    def __init__(self, module):
+        # Private names such as random._os would lead straight to the real os module
+        for name, value in vars(module).items():
+            if not name.startswith('_'):
+                object.__setattr__(self, name, value)
+        object.__setattr__(self, '__name__', module.__name__)
+
+    def __setattr__(self, name, value):
+        # Without this, math.pi = 3 would change math for every later run in the process
+        raise AttributeError(f"module '{self.__name__}' is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"module '{self.__name__}' is read-only")
+
+
+class ExecutionProfile:
+    """Prebuilt builtins and importable modules shared by every run of a profile"""
+
+    def __init__(self, name, builtin_names=SAFE_BUILTINS, modules=()):
+        self.name = name
+        self.modules = MappingProxyType({module.__name__: ModuleView(module) for module in modules})
+
+        restricted_builtins = {
+            builtin_name: getattr(builtins, builtin_name)
+            for builtin_name in builtin_names if hasattr(builtins, builtin_name)
+        }
+        # 'import x' resolves against the preloaded modules, never the real import system
+        restricted_builtins['__import__'] = _restricted_import(self.modules)
+
+        self._namespace = MappingProxyType({
+            '__builtins__': restricted_builtins,
+            '__name__': '__main__'
+        })
+
+    def namespace(self, seed=None):
+        """Fresh globals for one run, with its own copy of the prebuilt builtins"""
+        # Learner code can reach its builtins dict (e.g. through a function's globals),
+        # so a shared dict would let one run rewrite len() for every later run
+        restricted_builtins = dict(self._namespace['__builtins__'])
+        if seed is not None and 'random' in self.modules:
+            # Replay mode: this run imports its own seeded generator instead of the shared module
+            seeded_modules = dict(self.modules, random=random.Random(seed))
+            restricted_builtins['__import__'] = _restricted_import(seeded_modules)
+        return dict(self._namespace, __builtins__=restricted_builtins)
+
+
+def _restricted_import(modules):
+    """Build an __import__ that only hands out the given preloaded modules"""
+    def restricted_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and name in modules:
+            return modules[name]
+        raise ImportError(f"Import not allowed: {name}")
+    return restricted_import
+
+
+PROFILES = MappingProxyType({
+    'basic': ExecutionProfile('basic'),
+    'standard': ExecutionProfile('standard', modules=(math, random))
+})
+
+DEFAULT_PROFILE = 'standard'
+
+
+def get_profile(name=None):
+    """Get an execution profile by name"""
+    if isinstance(name, ExecutionProfile):
+        return name
+    try:
+        return PROFILES[name or DEFAULT_PROFILE]
+    except KeyError:
+        raise ValueError(f"Unknown execution profile: {name}")
+
+
+def replay_seed(user_id, exercise_id, attempt=0):
+    """Deterministic random seed for one (user, exercise, attempt)"""
+    digest = hashlib.sha256(f"{user_id}:{exercise_id}:{attempt}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
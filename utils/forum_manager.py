@@ -2,6 +2,8 @@ import streamlit as st
 import psycopg2
 from datetime import datetime
 import os
+from utils.activity_feed import record_event, get_feed, FORUM_REPLY
+from utils.db_pool import get_pool
 
 class ForumManager:
     """Handle forum operations and discussions"""
@@ -18,7 +20,7 @@ class ForumManager:
     def _get_connection(self):
         """Get database connection"""
         try:
-            return psycopg2.connect(**self.connection_params)
+            return get_pool(self.connection_params).connect()
         except Exception as e:
             st.error(f"Database connection failed: {str(e)}")
             return None
@@ -93,13 +95,11 @@ class ForumManager:
                 cursor.execute("""
                     SELECT p.id, p.title, p.content, p.post_type, p.is_solved, p.views, p.likes,
                            p.created_at, u.username, u.full_name, c.name as category_name, c.icon,
-                           COUNT(r.id) as reply_count
+                           (SELECT COUNT(*) FROM forum_replies r WHERE r.post_id = p.id) as reply_count
                     FROM forum_posts p
                     JOIN users u ON p.user_id = u.id
                     LEFT JOIN forum_categories c ON p.category_id = c.id
-                    LEFT JOIN forum_replies r ON p.id = r.post_id
                     WHERE p.category_id = %s
-                    GROUP BY p.id, u.username, u.full_name, c.name, c.icon
                     ORDER BY p.created_at DESC
                     LIMIT %s
                 """, (category_id, limit))
@@ -107,12 +107,10 @@ class ForumManager:
                 cursor.execute("""
                     SELECT p.id, p.title, p.content, p.post_type, p.is_solved, p.views, p.likes,
                            p.created_at, u.username, u.full_name, c.name as category_name, c.icon,
-                           COUNT(r.id) as reply_count
+                           (SELECT COUNT(*) FROM forum_replies r WHERE r.post_id = p.id) as reply_count
                     FROM forum_posts p
                     JOIN users u ON p.user_id = u.id
                     LEFT JOIN forum_categories c ON p.category_id = c.id
-                    LEFT JOIN forum_replies r ON p.id = r.post_id
-                    GROUP BY p.id, u.username, u.full_name, c.name, c.icon
                     ORDER BY p.created_at DESC
                     LIMIT %s
                 """, (limit,))
@@ -243,7 +241,11 @@ class ForumManager:
                     UPDATE forum_posts SET is_solved = TRUE WHERE id = %s
                 """, (post_id,))
             
+            cursor.execute("SELECT title FROM forum_posts WHERE id = %s", (post_id,))
+            record_event(cursor, user_id, FORUM_REPLY, cursor.fetchone()[0])
+            
             conn.commit()
+            get_feed().invalidate()
             return True, f"Reply added successfully with ID: {reply_id}"
             
         except Exception as e:
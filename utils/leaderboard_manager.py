@@ -0,0 +1,149 @@
+import streamlit as st
+import psycopg2
+import os
+from utils.db_pool import get_pool
+from utils.db_adapter import HISTOGRAM_LOCK_SPACE
+
+# Moves every appended delta into the histogram in one transaction, so a reader
+# summing both tables counts each score change exactly once
+FOLD_HISTOGRAM_SQL = """
+    WITH moved AS (
+        DELETE FROM score_histogram_deltas RETURNING points, users
+    )
+    INSERT INTO score_histogram (points, users)
+    SELECT points, SUM(users) FROM moved
+    GROUP BY points
+    HAVING SUM(users) <> 0
+    ON CONFLICT (points) DO UPDATE SET users = score_histogram.users + EXCLUDED.users
+"""
+
+# Users per score: the folded histogram plus the deltas not folded yet
+SCORE_COUNTS = """
+    (SELECT points, users FROM score_histogram
+     UNION ALL
+     SELECT points, users FROM score_histogram_deltas)
+"""
+
+
+class LeaderboardManager:
+    """Read the precomputed user_scores ranking"""
+
+    def __init__(self):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+
+    def _get_connection(self):
+        """Get database connection"""
+        try:
+            return get_pool(self.connection_params).connect()
+        except Exception as e:
+            st.error(f"Database connection failed: {str(e)}")
+            return None
+
+    def fold_histogram(self):
+        """Fold pending score deltas into the histogram, returns the scores changed"""
+        conn = self._get_connection()
+        if not conn:
+            return 0
+
+        try:
+            cursor = conn.cursor()
+            folded = self._fold_histogram(cursor)
+            conn.commit()
+            return folded
+
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _fold_histogram(self, cursor):
+        # Cheap check first, and a session already folding makes this one skip
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM score_histogram_deltas)")
+        if not cursor.fetchone()[0]:
+            return 0
+        cursor.execute("SELECT pg_try_advisory_xact_lock(%s, 0)", (HISTOGRAM_LOCK_SPACE,))
+        if not cursor.fetchone()[0]:
+            return 0
+        cursor.execute(FOLD_HISTOGRAM_SQL)
+        return cursor.rowcount
+
+    def get_top(self, limit=10):
+        """Top users by points, read straight off the rank index"""
+        conn = self._get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+            self._fold_histogram(cursor)
+            conn.commit()
+
+            cursor.execute(f"""
+                SELECT s.user_id, u.username, s.exercises, s.tutorials, s.solution_likes, s.points,
+                       1 + COALESCE((SELECT SUM(h.users) FROM {SCORE_COUNTS} h WHERE h.points > s.points), 0)
+                FROM (
+                    SELECT * FROM user_scores ORDER BY points DESC, user_id LIMIT %s
+                ) s
+                JOIN users u ON u.id = s.user_id
+                ORDER BY s.points DESC, s.user_id
+            """, (limit,))
+
+            leaders = []
+            for row in cursor.fetchall():
+                leaders.append({
+                    'user_id': row[0],
+                    'username': row[1],
+                    'exercises': row[2],
+                    'tutorials': row[3],
+                    'solution_likes': row[4],
+                    'points': row[5],
+                    'rank': row[6]
+                })
+
+            return leaders
+
+        except Exception as e:
+            st.error(f"Error fetching leaderboard: {str(e)}")
+            return []
+        finally:
+            cursor.close()
+            conn.close()
+
+    def get_rank(self, user_id):
+        """A user's points and rank (1 + users with more points), or None if unranked"""
+        conn = self._get_connection()
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            self._fold_histogram(cursor)
+            conn.commit()
+
+            cursor.execute(f"""
+                SELECT s.points,
+                       1 + COALESCE((SELECT SUM(h.users) FROM {SCORE_COUNTS} h WHERE h.points > s.points), 0),
+                       (SELECT COALESCE(SUM(h.users), 0) FROM {SCORE_COUNTS} h)
+                FROM user_scores s
+                WHERE s.user_id = %s
+            """, (user_id,))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {'points': row[0], 'rank': row[1], 'ranked_users': row[2]}
+
+        except Exception as e:
+            st.error(f"Error fetching rank: {str(e)}")
+            return None
+        finally:
+            cursor.close()
+            conn.close()
@@ -0,0 +1,552 @@
+import argparse
+import os
+import re
+import time
+from datetime import date
+import psycopg2
+from psycopg2 import errors
+from utils.activity_rollups import ActivityRollup, ROLLUP_NAME
+from utils.db_adapter import BLOB_LOCK_SPACE
+from utils.leaderboard_manager import LeaderboardManager
+from utils.solutions_manager import recount_likes
+
+# One batch: lock a few inactive guests (skipping rows other sessions hold),
+# delete their data and report how many rows each table gave back.
+REAP_BATCH_SQL = """
+    WITH doomed AS (
+        SELECT u.id FROM users u
+        WHERE u.password_hash = '' AND u.username LIKE 'guest\\_%%'
+          AND u.last_active < %(cutoff)s
+          AND NOT EXISTS (
+              SELECT 1 FROM user_progress p
+              WHERE p.user_id = u.id AND p.completed_at >= %(cutoff)s
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM code_submissions s
+              WHERE s.user_id = u.id AND s.submitted_at >= %(cutoff)s
+          )
+        ORDER BY u.id
+        LIMIT %(batch_size)s
+        FOR UPDATE SKIP LOCKED
+    ),
+    progress AS (
+        DELETE FROM user_progress p USING doomed d WHERE p.user_id = d.id RETURNING 1
+    ),
+    achievements AS (
+        DELETE FROM user_achievements a USING doomed d WHERE a.user_id = d.id RETURNING 1
+    ),
+    submissions AS (
+        DELETE FROM code_submissions s USING doomed d WHERE s.user_id = d.id RETURNING 1
+    ),
+    deleted_users AS (
+        DELETE FROM users u USING doomed d WHERE u.id = d.id RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM deleted_users),
+           (SELECT COUNT(*) FROM progress),
+           (SELECT COUNT(*) FROM achievements),
+           (SELECT COUNT(*) FROM submissions)
+"""
+
+REAPED_TABLES = ('users', 'user_progress', 'user_achievements', 'code_submissions')
+
+
+PARTITIONED_TABLE = 'code_submissions'
+ARCHIVE_SCHEMA = 'archive'
+_PARTITION_NAME = re.compile(r'^code_submissions_(\d{4})_(\d{2})$')
+
+
+class GuestReaper:
+    """Delete guest users (and their data) that have been inactive past a TTL"""
+
+    def __init__(self, ttl_days=30, batch_size=500, lock_timeout_ms=2000, pause=0.1, max_lock_retries=5):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.ttl_days = ttl_days
+        self.batch_size = batch_size
+        self.lock_timeout_ms = lock_timeout_ms
+        self.pause = pause
+        self.max_lock_retries = max_lock_retries
+
+    def _get_connection(self):
+        """Get database connection"""
+        return psycopg2.connect(**self.connection_params)
+
+    def reap(self, max_batches=None):
+        """Delete inactive guests batch by batch, returns reclaimed row counts per table"""
+        reclaimed = dict.fromkeys(REAPED_TABLES, 0)
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT now() - make_interval(days => %s)", (self.ttl_days,))
+            cutoff = cursor.fetchone()[0]
+
+            batches = 0
+            lock_failures = 0
+            while max_batches is None or batches < max_batches:
+                try:
+                    # Each batch is its own short transaction, so locks are held briefly
+                    cursor.execute("SET LOCAL lock_timeout = %s", (f"{self.lock_timeout_ms}ms",))
+                    cursor.execute(REAP_BATCH_SQL, {'cutoff': cutoff, 'batch_size': self.batch_size})
+                    counts = cursor.fetchone()
+                    conn.commit()
+                except errors.LockNotAvailable:
+                    conn.rollback()
+                    # A lock held for long is left alone until the next run
+                    lock_failures += 1
+                    if lock_failures > self.max_lock_retries:
+                        break
+                    time.sleep(self.pause * 2 ** lock_failures)
+                    continue
+
+                lock_failures = 0
+                batches += 1
+                for table, count in zip(REAPED_TABLES, counts):
+                    reclaimed[table] += count
+                if counts[0] < self.batch_size:
+                    break
+                time.sleep(self.pause)
+
+            return reclaimed
+
+        finally:
+            conn.close()
+
+    def compact(self):
+        """VACUUM (ANALYZE) the reaped tables; plain VACUUM never blocks reads or writes"""
+        conn = self._get_connection()
+        try:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            for table in REAPED_TABLES + ('code_blobs',):
+                cursor.execute(f"VACUUM (ANALYZE) {table}")
+        finally:
+            conn.close()
+
+
+
+
+class BlobCollector:
+    """Delete code_blobs that no submission refers to any more (after reaping or deletes)"""
+
+    def __init__(self, batch_size=1000, pause=0.1):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def _get_connection(self):
+        """Get database connection"""
+        return psycopg2.connect(**self.connection_params)
+
+    def _unreferenced(self, cursor):
+        """Condition on blob b: no attached or archived submission uses it"""
+        cursor.execute("SELECT tablename FROM pg_tables WHERE schemaname = %s", (ARCHIVE_SCHEMA,))
+        tables = [PARTITIONED_TABLE]
+        tables += [f"{ARCHIVE_SCHEMA}.{name}" for (name,) in cursor.fetchall() if _PARTITION_NAME.match(name)]
+        return " AND ".join(
+            f"NOT EXISTS (SELECT 1 FROM {table} s WHERE s.code_hash = b.code_hash)" for table in tables
+        )
+
+    def collect(self, max_batches=None):
+        """Delete unreferenced blobs batch by batch, returns how many were deleted"""
+        deleted = 0
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor()
+            unreferenced = self._unreferenced(cursor)
+            conn.commit()
+
+            after = ''
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                cursor.execute(f"""
+                    SELECT b.code_hash FROM code_blobs b
+                    WHERE b.code_hash > %s AND {unreferenced}
+                    ORDER BY b.code_hash
+                    LIMIT %s
+                """, (after, self.batch_size))
+                candidates = [code_hash for (code_hash,) in cursor.fetchall()]
+                if not candidates:
+                    conn.commit()
+                    break
+                after = candidates[-1]
+
+                # Code being submitted right now holds the shared lock on its blob, so skip it
+                cursor.execute("""
+                    SELECT code_hash FROM unnest(%s::text[]) AS c(code_hash)
+                    WHERE pg_try_advisory_xact_lock(%s, hashtext(code_hash))
+                """, (candidates, BLOB_LOCK_SPACE))
+                locked = [code_hash for (code_hash,) in cursor.fetchall()]
+
+                # A new statement sees every submission that committed before the locks were taken
+                cursor.execute(f"""
+                    DELETE FROM code_blobs b WHERE b.code_hash = ANY(%s) AND {unreferenced}
+                """, (locked,))
+                deleted += cursor.rowcount
+                conn.commit()
+
+                batches += 1
+                if len(candidates) < self.batch_size:
+                    break
+                time.sleep(self.pause)
+
+            return deleted
+
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+# Authors' scores set to the sum of their solutions' counters. The caller holds their
+# solutions locked, so no flush moves a counter between the sum and the write.
+RESCORE_AUTHORS_SQL = """
+    WITH totals AS (
+        SELECT a.user_id, COALESCE(SUM(s.likes), 0) AS likes
+        FROM unnest(%(user_ids)s::int[]) AS a(user_id)
+        LEFT JOIN shared_solutions s ON s.user_id = a.user_id
+        GROUP BY a.user_id
+    ),
+    rescored AS (
+        UPDATE user_scores sc
+        SET solution_likes = t.likes, updated_at = now()
+        FROM totals t
+        WHERE sc.user_id = t.user_id AND sc.solution_likes <> t.likes
+        RETURNING sc.user_id
+    ),
+    missing AS (
+        INSERT INTO user_scores (user_id, solution_likes, updated_at)
+        SELECT t.user_id, t.likes, now()
+        FROM totals t
+        JOIN users u ON u.id = t.user_id AND u.password_hash <> ''
+        WHERE t.likes > 0 AND NOT EXISTS (SELECT 1 FROM user_scores sc WHERE sc.user_id = t.user_id)
+        ORDER BY t.user_id
+        ON CONFLICT (user_id) DO NOTHING
+        RETURNING user_id
+    )
+    SELECT (SELECT COUNT(*) FROM rescored) + (SELECT COUNT(*) FROM missing)
+"""
+
+
+class LikeReconciler:
+    """Recompute like counters and author scores that drifted from solution_likes"""
+
+    def __init__(self, batch_size=500, pause=0.05):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def _get_connection(self):
+        """Get database connection"""
+        return psycopg2.connect(**self.connection_params)
+
+    def reconcile(self):
+        """Correct counters, then scores, a batch at a time; returns (solutions, scores) corrected"""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            solutions = 0
+            # Counters in id-ordered batches; only the batch's rows are locked at a time
+            after = 0
+            while True:
+                cursor.execute("""
+                    SELECT id FROM shared_solutions WHERE id > %s ORDER BY id LIMIT %s
+                """, (after, self.batch_size))
+                ids = [solution_id for (solution_id,) in cursor.fetchall()]
+                if not ids:
+                    break
+                after = ids[-1]
+                solutions += recount_likes(cursor, ids)
+                conn.commit()
+                if len(ids) < self.batch_size:
+                    break
+                time.sleep(self.pause)
+
+            scores = 0
+            # Scores of authors, and of anyone else still credited with likes, in user id order
+            after = 0
+            while True:
+                cursor.execute("""
+                    SELECT user_id FROM (
+                        (SELECT user_id FROM user_scores WHERE user_id > %(after)s AND solution_likes <> 0
+                         ORDER BY user_id LIMIT %(limit)s)
+                        UNION
+                        (SELECT user_id FROM shared_solutions WHERE user_id > %(after)s
+                         ORDER BY user_id LIMIT %(limit)s)
+                    ) candidates
+                    ORDER BY user_id LIMIT %(limit)s
+                """, {'after': after, 'limit': self.batch_size})
+                user_ids = [user_id for (user_id,) in cursor.fetchall()]
+                if not user_ids:
+                    break
+                after = user_ids[-1]
+                cursor.execute("""
+                    SELECT id FROM shared_solutions WHERE user_id = ANY(%s::int[]) ORDER BY id FOR NO KEY UPDATE
+                """, (user_ids,))
+                cursor.execute(RESCORE_AUTHORS_SQL, {'user_ids': user_ids})
+                scores += cursor.fetchone()[0]
+                conn.commit()
+                if len(user_ids) < self.batch_size:
+                    break
+                time.sleep(self.pause)
+
+            return solutions, scores
+        except psycopg2.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+# One batch of per-user activity hours that are past retention and already rolled up
+PRUNE_ACTIVITY_SQL = """
+    DELETE FROM user_activity_hourly
+    WHERE ctid = ANY(ARRAY(
+        SELECT ctid FROM user_activity_hourly
+        WHERE bucket < %(cutoff)s
+          AND bucket < (SELECT rolled_up_to FROM rollup_state WHERE name = %(name)s)
+        LIMIT %(batch_size)s
+    ))
+"""
+
+
+class ActivityPruner:
+    """Delete per-user activity hours older than the retention; the global rollups keep their totals"""
+
+    def __init__(self, retain_days=90, batch_size=5000, pause=0.1):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.retain_days = retain_days
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def _get_connection(self):
+        """Get database connection"""
+        return psycopg2.connect(**self.connection_params)
+
+    def prune(self):
+        """Delete expired hours batch by batch, returns how many rows were deleted"""
+        deleted = 0
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor()
+            # Buckets are written on the database clock, so the cutoff is taken from it too
+            cursor.execute("SELECT date_trunc('day', now())::timestamp - make_interval(days => %s)",
+                           (self.retain_days,))
+            cutoff = cursor.fetchone()[0]
+
+            while True:
+                cursor.execute(PRUNE_ACTIVITY_SQL, {'cutoff': cutoff, 'name': ROLLUP_NAME,
+                                                    'batch_size': self.batch_size})
+                count = cursor.rowcount
+                conn.commit()
+                deleted += count
+                if count < self.batch_size:
+                    break
+                time.sleep(self.pause)
+
+            return deleted
+        except psycopg2.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+def _add_months(month, count):
+    """First day of the month `count` months after `month`"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionManager:
+    """Create upcoming monthly code_submissions partitions and archive expired ones"""
+
+    def __init__(self, months_ahead=3, retain_months=12, lock_timeout_ms=2000):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.months_ahead = months_ahead
+        self.retain_months = retain_months
+        self.lock_timeout_ms = lock_timeout_ms
+
+    def _get_connection(self):
+        """Get database connection"""
+        return psycopg2.connect(**self.connection_params)
+
+    def _partition_months(self, cursor):
+        """Months that currently have an attached partition"""
+        cursor.execute("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+        """, (PARTITIONED_TABLE,))
+        months = set()
+        for (name,) in cursor.fetchall():
+            match = _PARTITION_NAME.match(name)
+            if match:
+                months.add(date(int(match.group(1)), int(match.group(2)), 1))
+        return months
+
+    def ensure_partitions(self, today=None):
+        """Create partitions from the current month to months_ahead, returns their names"""
+        today = today or date.today()
+        current = date(today.year, today.month, 1)
+        created = []
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor()
+            existing = self._partition_months(cursor)
+            for offset in range(self.months_ahead + 1):
+                start = _add_months(current, offset)
+                if start not in existing:
+                    self._create_partition(cursor, start)
+                    conn.commit()
+                    created.append(f"{PARTITIONED_TABLE}_{start:%Y_%m}")
+            return created
+
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _create_partition(self, cursor, start):
+        """Create one month's partition, moving any rows the default partition caught for it"""
+        name = f"{PARTITIONED_TABLE}_{start:%Y_%m}"
+        end = _add_months(start, 1)
+        cursor.execute("SET LOCAL lock_timeout = %s", (f"{self.lock_timeout_ms}ms",))
+        cursor.execute(f"""
+            SELECT EXISTS (SELECT 1 FROM {PARTITIONED_TABLE}_default WHERE submitted_at >= %s AND submitted_at < %s)
+        """, (start, end))
+
+        if not cursor.fetchone()[0]:
+            cursor.execute(f"""
+                CREATE TABLE {name} PARTITION OF {PARTITIONED_TABLE} FOR VALUES FROM (%s) TO (%s)
+            """, (start, end))
+            return
+
+        # The new range may not overlap rows in the default partition, so move them across
+        cursor.execute(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {PARTITIONED_TABLE}_default")
+        cursor.execute(f"""
+            CREATE TABLE {name} PARTITION OF {PARTITIONED_TABLE} FOR VALUES FROM (%s) TO (%s)
+        """, (start, end))
+        cursor.execute(f"""
+            WITH moved AS (
+                DELETE FROM {PARTITIONED_TABLE}_default
+                WHERE submitted_at >= %s AND submitted_at < %s
+                RETURNING *
+            )
+            INSERT INTO {PARTITIONED_TABLE} SELECT * FROM moved
+        """, (start, end))
+        cursor.execute(f"ALTER TABLE {PARTITIONED_TABLE} ATTACH PARTITION {PARTITIONED_TABLE}_default DEFAULT")
+
+    def archive_partitions(self, today=None):
+        """Detach partitions older than retain_months into the archive schema, returns their names"""
+        today = today or date.today()
+        cutoff = _add_months(date(today.year, today.month, 1), -self.retain_months)
+        archived = []
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}")
+            conn.commit()
+
+            for start in sorted(self._partition_months(cursor)):
+                if start >= cutoff:
+                    break
+                # Detaching only touches catalog entries, so the parent is locked briefly
+                name = f"{PARTITIONED_TABLE}_{start:%Y_%m}"
+                cursor.execute("SET LOCAL lock_timeout = %s", (f"{self.lock_timeout_ms}ms",))
+                cursor.execute(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}")
+                cursor.execute(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}")
+                conn.commit()
+                archived.append(f"{ARCHIVE_SCHEMA}.{name}")
+            return archived
+
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reap inactive guest users and rotate submission partitions")
+    parser.add_argument('--ttl-days', type=int, default=int(os.getenv('GUEST_TTL_DAYS', 30)))
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--max-batches', type=int, default=None)
+    parser.add_argument('--vacuum', action='store_true', help="VACUUM (ANALYZE) the tables afterwards")
+    parser.add_argument('--retain-months', type=int, default=int(os.getenv('SUBMISSION_RETAIN_MONTHS', 12)),
+                        help="months of code submissions to keep attached")
+    parser.add_argument('--activity-retain-days', type=int, default=int(os.getenv('ACTIVITY_RETAIN_DAYS', 90)),
+                        help="days of per-user activity hours to keep")
+    args = parser.parse_args(argv)
+
+    partitions = PartitionManager(retain_months=args.retain_months)
+    for name in partitions.ensure_partitions():
+        print(f"Created partition {name}")
+    for name in partitions.archive_partitions():
+        print(f"Archived partition {name}")
+
+    # Readers roll up lazily too; this keeps the rollups current through quiet periods
+    hours = ActivityRollup().roll_up()
+    print(f"Rolled up {hours} hour(s) of activity")
+    pruned = ActivityPruner(retain_days=args.activity_retain_days).prune()
+    print(f"user_activity_hourly: {pruned} rows reclaimed")
+
+    reaper = GuestReaper(ttl_days=args.ttl_days, batch_size=args.batch_size)
+    reclaimed = reaper.reap(max_batches=args.max_batches)
+    for table, count in reclaimed.items():
+        print(f"{table}: {count} rows reclaimed")
+
+    # Bodies of the submissions reaped above (or deleted otherwise) are now unreferenced
+    blobs = BlobCollector().collect()
+    print(f"code_blobs: {blobs} rows reclaimed")
+
+    # Likes still queued in a worker that crashed never reached their counters
+    solutions, scores = LikeReconciler().reconcile()
+    print(f"Reconciled likes: {solutions} solution(s), {scores} score(s) corrected")
+
+    # Readers fold lazily too; this keeps the delta table short through quiet periods
+    folded = LeaderboardManager().fold_histogram()
+    print(f"Folded score histogram deltas into {folded} score(s)")
+
+    if args.vacuum:
+        reaper.compact()
+        print("Vacuumed: " + ", ".join(REAPED_TABLES + ('code_blobs',)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import os
+import re
+import sys
+import time
+import psycopg2
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+# Only one runner migrates at a time, however many containers start together
+ADVISORY_LOCK_KEY = 4_242_001
+
+NO_TRANSACTION_MARKER = '-- migrate: no-transaction'
+# Runs the statement below it once per partition, with {partition} replaced by its name
+_EACH_PARTITION = re.compile(r'^--\s*migrate:\s*each partition of (\w+)\s*$', re.MULTILINE)
+_CONCURRENT_INDEX = re.compile(r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)', re.IGNORECASE)
+_FILENAME = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+
+class Migration:
+    """One numbered .sql file from the migrations directory"""
+
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+
+    def read(self):
+        with open(self.path, encoding='utf-8') as f:
+            return f.read()
+
+    def statements(self):
+        """Individual statements, for migrations that run outside a transaction"""
+        statements = []
+        lines = []
+        in_body = False
+        for line in self.read().splitlines():
+            if not line.strip() or (not in_body and line.strip().startswith('--')
+                                    and not _EACH_PARTITION.match(line.strip())):
+                continue
+            lines.append(line)
+            # A ; ends the statement, except inside a $$-quoted DO or function body
+            if line.count('$$') % 2:
+                in_body = not in_body
+            if not in_body and line.rstrip().endswith(';'):
+                statements.append('\n'.join(lines))
+                lines = []
+        if lines:
+            statements.append('\n'.join(lines))
+        return statements
+
+    @property
+    def transactional(self):
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        return NO_TRANSACTION_MARKER not in self.read()
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """Migrations found in the directory, ordered by version"""
+    migrations = []
+    for filename in os.listdir(directory):
+        match = _FILENAME.match(filename)
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort(key=lambda migration: migration.version)
+
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+class MigrationRunner:
+    """Apply pending migrations and record them in schema_migrations"""
+
+    def __init__(self, directory=MIGRATIONS_DIR, lock_timeout='5s'):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.directory = directory
+        self.lock_timeout = lock_timeout
+
+    def _get_connection(self, wait=0):
+        """Connect, retrying for up to `wait` seconds while the database starts"""
+        deadline = time.monotonic() + wait
+        while True:
+            try:
+                conn = psycopg2.connect(**self.connection_params)
+                conn.autocommit = True
+                return conn
+            except psycopg2.OperationalError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(1)
+
+    def _ensure_version_table(self, cursor):
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR(200) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def applied_versions(self, cursor):
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+
+    def pending(self, cursor):
+        applied = self.applied_versions(cursor)
+        return [migration for migration in load_migrations(self.directory) if migration.version not in applied]
+
+    def migrate(self, wait=0):
+        """Apply every pending migration in order, returns the applied ones"""
+        conn = self._get_connection(wait)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT pg_advisory_lock(%s)", (ADVISORY_LOCK_KEY,))
+            try:
+                self._ensure_version_table(cursor)
+                # Never queue behind long-running queries while holding locks that block traffic
+                cursor.execute("SET lock_timeout = %s", (self.lock_timeout,))
+
+                applied = []
+                for migration in self.pending(cursor):
+                    if migration.transactional:
+                        self._apply_in_transaction(cursor, migration)
+                    else:
+                        self._apply_statements(cursor, migration)
+                    applied.append(migration)
+                return applied
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", (ADVISORY_LOCK_KEY,))
+        finally:
+            conn.close()
+
+    def _apply_in_transaction(self, cursor, migration):
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute(migration.read())
+            self._record(cursor, migration)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def _apply_statements(self, cursor, migration):
+        """Run each statement on its own; statements must be safe to re-run after a failure"""
+        for statement in migration.statements():
+            each_partition = _EACH_PARTITION.search(statement)
+            if not each_partition:
+                self._apply_statement(cursor, statement)
+                continue
+            for partition in self._partitions(cursor, each_partition.group(1)):
+                self._apply_statement(cursor, statement.replace('{partition}', partition))
+        self._record(cursor, migration)
+
+    def _apply_statement(self, cursor, statement):
+        index_name = _CONCURRENT_INDEX.search(statement)
+        if index_name:
+            self._drop_invalid_index(cursor, index_name.group(1))
+        cursor.execute(statement)
+
+    def _partitions(self, cursor, table):
+        """Names of the table's partitions, e.g. for building their indexes one at a time"""
+        cursor.execute("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            ORDER BY c.relname
+        """, (table,))
+        return [name for (name,) in cursor.fetchall()]
+
+    def _drop_invalid_index(self, cursor, index_name):
+        """A failed CREATE INDEX CONCURRENTLY leaves an invalid index that IF NOT EXISTS would skip"""
+        cursor.execute("""
+            SELECT 1 FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = %s AND NOT i.indisvalid
+        """, (index_name,))
+        if cursor.fetchone():
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+    def _record(self, cursor, migration):
+        cursor.execute("""
+            INSERT INTO schema_migrations (version, name) VALUES (%s, %s)
+        """, (migration.version, migration.name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply pending database migrations")
+    parser.add_argument('--wait', type=int, default=30, help="seconds to wait for the database to accept connections")
+    parser.add_argument('--status', action='store_true', help="list pending migrations without applying them")
+    args = parser.parse_args(argv)
+
+    runner = MigrationRunner()
+    if args.status:
+        conn = runner._get_connection(args.wait)
+        try:
+            cursor = conn.cursor()
+            runner._ensure_version_table(cursor)
+            pending = runner.pending(cursor)
+        finally:
+            conn.close()
+        for migration in pending:
+            print(f"pending: {migration.version:04d}_{migration.name}")
+        print(f"{len(pending)} pending migration(s)")
+        return 0
+
+    applied = runner.migrate(wait=args.wait)
+    for migration in applied:
+        print(f"applied: {migration.version:04d}_{migration.name}")
+    print(f"{len(applied)} migration(s) applied")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+import struct
+import time
+from array import array
+from data.tutorials import TUTORIALS
+from data.exercises import EXERCISES
+from utils.achievements import ACHIEVEMENT_TITLES, CATEGORIES
+
+# Catalog ids map to bit positions by definition order; new ids must be
+# appended so previously serialized states keep their meaning.
+TUTORIAL_IDS = tuple(TUTORIALS)
+EXERCISE_IDS = tuple(EXERCISES)
+
+_TUTORIAL_INDEX = {item_id: i for i, item_id in enumerate(TUTORIAL_IDS)}
+_EXERCISE_INDEX = {item_id: i for i, item_id in enumerate(EXERCISE_IDS)}
+_CATEGORY_INDEX = {category: i for i, category in enumerate(CATEGORIES)}
+_ACHIEVEMENT_INDEX = {title: i for i, title in enumerate(ACHIEVEMENT_TITLES)}
+
+_FORMAT_VERSION = 2
+# Version 1 had no exercise attempt counts
+_SUPPORTED_VERSIONS = (1, 2)
+_HEADER = struct.Struct('<BII')
+_ATTEMPT = struct.Struct('<HH')
+
+
+def _bit_ids(bits, ids):
+    """Catalog ids whose bit is set"""
+    return [item_id for i, item_id in enumerate(ids) if bits >> i & 1]
+
+
+def _pack_bits(bits):
+    size = (bits.bit_length() + 7) // 8
+    return bytes([size]) + bits.to_bytes(size, 'little')
+
+
+def _unpack_bits(data, offset):
+    size = data[offset]
+    start = offset + 1
+    return int.from_bytes(data[start:start + size], 'little'), start + size
+
+
+class ProgressState:
+    """Compact per-session progress: completion bitsets plus an achievement bitmap"""
+
+    __slots__ = ('tutorials', 'exercises', 'categories', 'achievements',
+                 'achievement_times', 'extra_achievements', 'exercise_attempts', 'start_time', 'last_activity')
+
+    def __init__(self):
+        now = int(time.time())
+        self.tutorials = 0
+        self.exercises = 0
+        self.categories = bytearray(len(CATEGORIES))
+        self.achievements = 0
+        # Earn times for set achievement bits, ordered by bit position
+        self.achievement_times = array('I')
+        # Achievements outside the catalog are rare, so the dict is created lazily
+        self.extra_achievements = None
+        # Times each exercise was solved, by bit position; picks its next replay seed
+        self.exercise_attempts = None
+        self.start_time = now
+        self.last_activity = now
+
+    def complete_tutorial(self, tutorial_id):
+        """Set the tutorial's bit, returns False if it was already set or is not in the catalog"""
+        index = _TUTORIAL_INDEX.get(tutorial_id)
+        if index is None:
+            return False
+        bit = 1 << index
+        self.last_activity = int(time.time())
+        if self.tutorials & bit:
+            return False
+        self.tutorials |= bit
+        return True
+
+    def complete_exercise(self, exercise_id):
+        """Set the exercise's bit, returns False if it was already set or is not in the catalog"""
+        index = _EXERCISE_INDEX.get(exercise_id)
+        if index is None:
+            return False
+        bit = 1 << index
+        self.last_activity = int(time.time())
+        if self.exercises & bit:
+            return False
+        self.exercises |= bit
+        return True
+
+    def add_exercise_attempt(self, exercise_id):
+        """Count one more solve of the exercise, which moves it to its next replay seed"""
+        index = _EXERCISE_INDEX.get(exercise_id)
+        if index is None:
+            return
+        if self.exercise_attempts is None:
+            self.exercise_attempts = {}
+        self.exercise_attempts[index] = min(self.exercise_attempts.get(index, 0) + 1, 0xFFFF)
+
+    def exercise_attempt(self, exercise_id):
+        index = _EXERCISE_INDEX.get(exercise_id)
+        if index is None or not self.exercise_attempts:
+            return 0
+        return self.exercise_attempts.get(index, 0)
+
+    def is_tutorial_completed(self, tutorial_id):
+        index = _TUTORIAL_INDEX.get(tutorial_id)
+        return index is not None and bool(self.tutorials >> index & 1)
+
+    def is_exercise_completed(self, exercise_id):
+        index = _EXERCISE_INDEX.get(exercise_id)
+        return index is not None and bool(self.exercises >> index & 1)
+
+    def tutorial_count(self):
+        return bin(self.tutorials).count('1')
+
+    def exercise_count(self):
+        return bin(self.exercises).count('1')
+
+    def add_category_item(self, category):
+        """Count one more completed item in a category"""
+        index = _CATEGORY_INDEX.get(category)
+        if index is not None and self.categories[index] < 255:
+            self.categories[index] += 1
+
+    def category_count(self, category):
+        index = _CATEGORY_INDEX.get(category)
+        return self.categories[index] if index is not None else 0
+
+    def has_achievement(self, title):
+        index = _ACHIEVEMENT_INDEX.get(title)
+        if index is None:
+            return bool(self.extra_achievements) and title in self.extra_achievements
+        return bool(self.achievements >> index & 1)
+
+    def add_achievement(self, title, earned_at=None):
+        """Record an achievement, returns False if it was already earned"""
+        if self.has_achievement(title):
+            return False
+
+        earned_at = int(time.time()) if earned_at is None else int(earned_at)
+        index = _ACHIEVEMENT_INDEX.get(title)
+        if index is None:
+            if self.extra_achievements is None:
+                self.extra_achievements = {}
+            self.extra_achievements[title] = earned_at
+            return True
+
+        # Keep times aligned with set bits: position = number of set bits below this one
+        position = bin(self.achievements & ((1 << index) - 1)).count('1')
+        self.achievement_times.insert(position, earned_at)
+        self.achievements |= 1 << index
+        return True
+
+    def achievement_items(self):
+        """(title, earned_at) pairs for every earned achievement"""
+        titles = _bit_ids(self.achievements, ACHIEVEMENT_TITLES)
+        items = list(zip(titles, self.achievement_times))
+        if self.extra_achievements:
+            items.extend(self.extra_achievements.items())
+        return items
+
+    def completed_tutorials(self):
+        return set(_bit_ids(self.tutorials, TUTORIAL_IDS))
+
+    def completed_exercises(self):
+        return set(_bit_ids(self.exercises, EXERCISE_IDS))
+
+    def to_bytes(self):
+        """Serialize to a compact binary form"""
+        parts = [
+            _HEADER.pack(_FORMAT_VERSION, self.start_time, self.last_activity),
+            _pack_bits(self.tutorials),
+            _pack_bits(self.exercises),
+            _pack_bits(self.achievements),
+            bytes([len(self.categories)]) + bytes(self.categories),
+            bytes([len(self.achievement_times)]) + self.achievement_times.tobytes(),
+        ]
+        attempts = self.exercise_attempts or {}
+        parts.append(struct.pack('<H', len(attempts)))
+        parts.extend(_ATTEMPT.pack(index, count) for index, count in sorted(attempts.items()))
+        for title, earned_at in (self.extra_achievements or {}).items():
+            encoded = title.encode('utf-8')
+            parts.append(struct.pack('<HI', len(encoded), earned_at) + encoded)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a state produced by to_bytes()"""
+        state = cls()
+        version, state.start_time, state.last_activity = _HEADER.unpack_from(data, 0)
+        if version not in _SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported progress state version: {version}")
+
+        offset = _HEADER.size
+        state.tutorials, offset = _unpack_bits(data, offset)
+        state.exercises, offset = _unpack_bits(data, offset)
+        state.achievements, offset = _unpack_bits(data, offset)
+
+        count = data[offset]
+        state.categories[:count] = data[offset + 1:offset + 1 + count]
+        offset += 1 + count
+
+        count = data[offset]
+        state.achievement_times = array('I')
+        state.achievement_times.frombytes(data[offset + 1:offset + 1 + count * state.achievement_times.itemsize])
+        offset += 1 + count * state.achievement_times.itemsize
+
+        if version >= 2:
+            (count,) = struct.unpack_from('<H', data, offset)
+            offset += 2
+            if count:
+                state.exercise_attempts = dict(_ATTEMPT.iter_unpack(data[offset:offset + count * _ATTEMPT.size]))
+            offset += count * _ATTEMPT.size
+
+        while offset < len(data):
+            size, earned_at = struct.unpack_from('<HI', data, offset)
+            offset += 6
+            if state.extra_achievements is None:
+                state.extra_achievements = {}
+            state.extra_achievements[data[offset:offset + size].decode('utf-8')] = earned_at
+            offset += size
+        return state
@@ -1,170 +1,132 @@
 import streamlit as st
+import uuid
 from datetime import datetime
-import json
+from utils.progress_state import ProgressState
+from utils.achievements import (
+    CATEGORIES, category_percent, overall_percent, changed_counters, earned_rules
+)
 
 class ProgressTracker:
     """Track user progress through tutorials and exercises"""
     
     def __init__(self):
-        if 'progress_data' not in st.session_state:
-            st.session_state.progress_data = {
-                'completed_tutorials': set(),
-                'completed_exercises': set(),
-                'achievements': [],
-                'category_progress': {
-                    'Variables': 0,
-                    'Loops': 0,
-                    'Functions': 0,
-                    'Lists': 0,
-                    'Conditionals': 0
-                },
-                'start_date': datetime.now().isoformat(),
-                'last_activity': datetime.now().isoformat()
-            }
+        if 'progress_state' not in st.session_state:
+            st.session_state.progress_state = ProgressState()
+    
+    @property
+    def state(self):
+        """Compact progress state stored in the session"""
+        return st.session_state.progress_state
+    
+    @property
+    def owner_id(self):
+        """Logged-in user id, or an id kept for this session's guest"""
+        if st.session_state.get('is_logged_in', False) and st.session_state.get('user_id'):
+            return f"user:{st.session_state.user_id}"
+        if 'guest_token' not in st.session_state:
+            st.session_state.guest_token = uuid.uuid4().hex
+        return f"guest:{st.session_state.guest_token}"
+    
+    def touch(self):
+        """Note a page view; only the database tracker records learning sessions"""
     
     def complete_tutorial(self, tutorial_id, category=None):
         """Mark a tutorial as completed"""
-        st.session_state.progress_data['completed_tutorials'].add(tutorial_id)
-        st.session_state.progress_data['last_activity'] = datetime.now().isoformat()
-        
-        if category:
-            self._update_category_progress(category, 10)
-        
-        self._check_achievements()
+        if self.state.complete_tutorial(tutorial_id):
+            if category:
+                self.state.add_category_item(category)
+            self._check_achievements(changed_counters('tutorial', category))
+            self._save()
     
     def complete_exercise(self, exercise_id, category=None):
-        """Mark an exercise as completed"""
-        st.session_state.progress_data['completed_exercises'].add(exercise_id)
-        st.session_state.progress_data['last_activity'] = datetime.now().isoformat()
-        
-        if category:
-            self._update_category_progress(category, 20)
-        
-        self._check_achievements()
-    
-    def _update_category_progress(self, category, points):
-        """Update progress for a specific category"""
-        if category in st.session_state.progress_data['category_progress']:
-            current = st.session_state.progress_data['category_progress'][category]
-            st.session_state.progress_data['category_progress'][category] = min(100, current + points)
+        """Mark an exercise as completed; every call counts one more solve"""
+        if self.state.complete_exercise(exercise_id):
+            if category:
+                self.state.add_category_item(category)
+            self._check_achievements(changed_counters('exercise', category))
+        self.state.add_exercise_attempt(exercise_id)
+        self._save()
     
     def get_category_progress(self, category):
         """Get progress for a specific category"""
-        return st.session_state.progress_data['category_progress'].get(category, 0)
+        return category_percent(self.state.category_count(category), category)
     
     def get_overall_progress(self):
         """Calculate overall progress percentage"""
-        total_tutorials = 15  # Approximate number of tutorials
-        total_exercises = 20  # Approximate number of exercises
-        
-        completed_tutorials = len(st.session_state.progress_data['completed_tutorials'])
-        completed_exercises = len(st.session_state.progress_data['completed_exercises'])
-        
-        total_completed = completed_tutorials + completed_exercises
-        total_available = total_tutorials + total_exercises
-        
-        return (total_completed / total_available) * 100 if total_available > 0 else 0
+        return overall_percent(self.state.tutorial_count() + self.state.exercise_count())
     
     def get_completed_tutorials_count(self):
         """Get number of completed tutorials"""
-        return len(st.session_state.progress_data['completed_tutorials'])
+        return self.state.tutorial_count()
     
     def get_completed_exercises_count(self):
         """Get number of completed exercises"""
-        return len(st.session_state.progress_data['completed_exercises'])
+        return self.state.exercise_count()
     
     def is_tutorial_completed(self, tutorial_id):
         """Check if a tutorial is completed"""
-        return tutorial_id in st.session_state.progress_data['completed_tutorials']
+        return self.state.is_tutorial_completed(tutorial_id)
     
     def is_exercise_completed(self, exercise_id):
         """Check if an exercise is completed"""
-        return exercise_id in st.session_state.progress_data['completed_exercises']
+        return self.state.is_exercise_completed(exercise_id)
+    
+    def get_exercise_attempt(self, exercise_id):
+        """Number of times the exercise was solved"""
+        return self.state.exercise_attempt(exercise_id)
     
     def add_achievement(self, achievement):
         """Add a new achievement"""
-        achievement_data = {
-            'title': achievement,
-            'date': datetime.now().isoformat()
-        }
-        
-        # Check if achievement already exists
-        existing_titles = [a['title'] for a in st.session_state.progress_data['achievements']]
-        if achievement not in existing_titles:
-            st.session_state.progress_data['achievements'].append(achievement_data)
+        if self.state.add_achievement(achievement):
+            self._save()
             return True
         return False
     
+    def _save(self):
+        """Persist the state after a change (session state needs nothing extra)"""
+    
     def get_achievements(self):
         """Get all achievements"""
-        return [a['title'] for a in st.session_state.progress_data['achievements']]
+        return [title for title, _ in self.state.achievement_items()]
     
     def get_recent_achievements(self, limit=5):
         """Get recent achievements"""
-        achievements = st.session_state.progress_data['achievements']
-        recent = sorted(achievements, key=lambda x: x['date'], reverse=True)[:limit]
-        return [a['title'] for a in recent]
-    
-    def _check_achievements(self):
-        """Check and award achievements based on progress"""
-        completed_tutorials = len(st.session_state.progress_data['completed_tutorials'])
-        completed_exercises = len(st.session_state.progress_data['completed_exercises'])
-        
-        # Tutorial achievements
-        if completed_tutorials >= 1:
-            self.add_achievement("🎓 First Steps - Completed your first tutorial!")
-        if completed_tutorials >= 5:
-            self.add_achievement("📚 Bookworm - Completed 5 tutorials!")
-        if completed_tutorials >= 10:
-            self.add_achievement("🧠 Knowledge Seeker - Completed 10 tutorials!")
-        
-        # Exercise achievements
-        if completed_exercises >= 1:
-            self.add_achievement("💪 Problem Solver - Completed your first exercise!")
-        if completed_exercises >= 5:
-            self.add_achievement("🏃 Code Runner - Completed 5 exercises!")
-        if completed_exercises >= 10:
-            self.add_achievement("⚡ Speed Coder - Completed 10 exercises!")
-        
-        # Category achievements
-        for category, progress in st.session_state.progress_data['category_progress'].items():
-            if progress >= 50:
-                self.add_achievement(f"🎯 {category} Apprentice - 50% progress in {category}!")
-            if progress >= 100:
-                self.add_achievement(f"🏆 {category} Master - Mastered {category}!")
-        
-        # Overall progress achievements
-        overall = self.get_overall_progress()
-        if overall >= 25:
-            self.add_achievement("🌟 Quarter Way - 25% overall progress!")
-        if overall >= 50:
-            self.add_achievement("🚀 Halfway Hero - 50% overall progress!")
-        if overall >= 75:
-            self.add_achievement("🔥 Almost There - 75% overall progress!")
-        if overall >= 100:
-            self.add_achievement("👑 Python Champion - 100% completion!")
+        achievements = self.state.achievement_items()
+        recent = sorted(achievements, key=lambda x: x[1], reverse=True)[:limit]
+        return [title for title, _ in recent]
+    
+    def _check_achievements(self, changed):
+        """Award achievements, re-checking only rules whose counter changed"""
+        counter_values = {counter: self._counter_value(counter) for counter in changed}
+        for _, _, _, title in earned_rules(counter_values):
+            self.add_achievement(title)
+    
+    def _counter_value(self, counter):
+        """Current value of a progress counter used by the achievement rules"""
+        if counter == 'tutorials':
+            return self.state.tutorial_count()
+        if counter == 'exercises':
+            return self.state.exercise_count()
+        if counter == 'overall':
+            return self.get_overall_progress()
+        return self.get_category_progress(counter)
     
     def get_progress_data(self):
         """Get all progress data for visualization"""
-        return st.session_state.progress_data
+        state = self.state
+        return {
+            'completed_tutorials': state.completed_tutorials(),
+            'completed_exercises': state.completed_exercises(),
+            'achievements': [
+                {'title': title, 'date': datetime.fromtimestamp(earned_at).isoformat()}
+                for title, earned_at in state.achievement_items()
+            ],
+            'category_progress': {category: self.get_category_progress(category) for category in CATEGORIES},
+            'start_date': datetime.fromtimestamp(state.start_time).isoformat(),
+            'last_activity': datetime.fromtimestamp(state.last_activity).isoformat()
+        }
     
     def reset_progress(self):
         """Reset all progress (for testing purposes)"""
-        if st.button("⚠️ Reset All Progress", type="secondary"):
-            if st.button("🔴 Confirm Reset", type="primary"):
-                st.session_state.progress_data = {
-                    'completed_tutorials': set(),
-                    'completed_exercises': set(),
-                    'achievements': [],
-                    'category_progress': {
-                        'Variables': 0,
-                        'Loops': 0,
-                        'Functions': 0,
-                        'Lists': 0,
-                        'Conditionals': 0
-                    },
-                    'start_date': datetime.now().isoformat(),
-                    'last_activity': datetime.now().isoformat()
-                }
-                st.success("Progress reset successfully!")
-                st.rerun()
+        st.session_state.progress_state = ProgressState()
+        self._save()
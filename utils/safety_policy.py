@@ -0,0 +1,281 @@
+import ast
+from functools import lru_cache
+
+
+class PolicyViolation(Exception):
+    """Raised while walking the AST when code breaks the safety policy"""
+
+
+class SafetyPolicy:
+    """Declarative safety rules checked in a single AST traversal"""
+
+    DEFAULT_ALLOWED_IMPORTS = frozenset({'math', 'random'})
+    DEFAULT_FORBIDDEN_NAMES = frozenset({
+        'eval', 'exec', 'open', 'compile', '__import__', 'file', 'input',
+        'raw_input', 'globals', 'locals', 'vars', 'breakpoint', 'setattr',
+        'delattr', '__builtins__'
+    })
+    # Dunder attributes that exercises legitimately rely on (e.g. type(x).__name__, super().__init__)
+    DEFAULT_ALLOWED_DUNDERS = frozenset({'__name__', '__init__'})
+    # Frame and generator internals lead back to the executor's real globals
+    FORBIDDEN_ATTRIBUTES = frozenset({
+        'gi_frame', 'gi_code', 'cr_frame', 'cr_code', 'ag_frame', 'ag_code',
+        'f_back', 'f_globals', 'f_locals', 'f_builtins', 'f_code', 'tb_frame', 'tb_next'
+    })
+    # Builtins that look attributes up by name; only a literal, non-dunder name is allowed
+    DYNAMIC_LOOKUPS = frozenset({'getattr', 'hasattr'})
+
+    def __init__(self, allowed_imports=None, forbidden_names=None, allowed_dunders=None,
+                 max_nodes=5000, max_depth=100):
+        self.allowed_imports = frozenset(
+            self.DEFAULT_ALLOWED_IMPORTS if allowed_imports is None else allowed_imports
+        )
+        self.forbidden_names = self.DEFAULT_FORBIDDEN_NAMES | frozenset(forbidden_names or ())
+        self.allowed_dunders = frozenset(
+            self.DEFAULT_ALLOWED_DUNDERS if allowed_dunders is None else allowed_dunders
+        )
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_config(cls, config=None):
+        """Build a policy from an exercise's ``safety`` settings"""
+        return cls(**(config or {}))
+
+    def check(self, code):
+        """Check code against the policy, returns (is_safe, message)"""
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            return False, f"Syntax error: {str(e)}"
+        except (RecursionError, MemoryError):
+            return False, "Code is too deeply nested"
+
+        try:
+            _PolicyVisitor(self, tree).visit(tree)
+        except PolicyViolation as e:
+            return False, str(e)
+
+        return True, "Code is safe"
+
+
+# Nodes that open a new scope for the names inside them
+_FUNCTION_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+_COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)
+
+
+def _scope_bindings(nodes):
+    """Names a scope binds itself, and names it declares global; nested scopes are not entered"""
+    bound, declared_global = set(), set()
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            bound.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+            continue
+        elif isinstance(node, (ast.Lambda,) + _COMPREHENSIONS):
+            continue
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            bound.update(alias.asname or alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, ast.Global):
+            declared_global.update(node.names)
+        elif isinstance(node, ast.Nonlocal):
+            # An enclosing function's local: a closure cell, never a builtin
+            bound.update(node.names)
+        stack.extend(ast.iter_child_nodes(node))
+    return bound - declared_global, declared_global
+
+
+def _module_bindings(tree):
+    """Name -> index of the first module-level statement that always binds it"""
+    first = {}
+    for index, statement in enumerate(tree.body):
+        if isinstance(statement, ast.Assign):
+            names = [node.id for target in statement.targets for node in ast.walk(target)
+                     if isinstance(node, ast.Name)]
+        elif isinstance(statement, ast.AnnAssign) and statement.value and isinstance(statement.target, ast.Name):
+            names = [statement.target.id]
+        elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names = [statement.name]
+        elif isinstance(statement, (ast.Import, ast.ImportFrom)):
+            names = [alias.asname or alias.name.split('.')[0] for alias in statement.names]
+        else:
+            continue
+        for name in names:
+            first.setdefault(name, index)
+    return first
+
+
+class _PolicyVisitor(ast.NodeVisitor):
+    """Walks the tree once, enforcing every rule of a SafetyPolicy"""
+
+    def __init__(self, policy, tree):
+        self.policy = policy
+        self.node_count = 0
+        self.depth = 0
+        # Functions of the calls seen so far, so check_Name can tell a call from a reference
+        self._called = set()
+        # Enclosing scopes, innermost last: (bound, declared global) per function, None per class
+        self._scopes = []
+        self._module_bound = _module_bindings(tree)
+        # Index of the module-level statement being walked
+        self._statement = 0
+        # Names bound by imports; attributes of these are module attributes
+        self._imported = {
+            alias.asname or alias.name.split('.')[0]
+            for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+            for alias in node.names
+        }
+
+    def visit(self, node):
+        self.node_count += 1
+        if self.node_count > self.policy.max_nodes:
+            raise PolicyViolation(f"Code is too large (more than {self.policy.max_nodes} syntax nodes)")
+
+        self.depth += 1
+        if self.depth > self.policy.max_depth:
+            raise PolicyViolation(f"Code is too deeply nested (more than {self.policy.max_depth} levels)")
+
+        try:
+            check = getattr(self, 'check_' + node.__class__.__name__, None)
+            if check:
+                check(node)
+            if isinstance(node, ast.Module):
+                for self._statement, statement in enumerate(node.body):
+                    self.visit(statement)
+            elif isinstance(node, _FUNCTION_SCOPES + (ast.ClassDef,) + _COMPREHENSIONS):
+                self._visit_scope(node)
+            else:
+                self.generic_visit(node)
+        finally:
+            self.depth -= 1
+
+    def _visit_all(self, nodes):
+        for node in nodes:
+            if node is not None:
+                self.visit(node)
+
+    def _visit_scope(self, node):
+        """Visit what runs in the enclosing scope (defaults, decorators, bases, the first
+        iterable), then the rest with the new scope pushed"""
+        if isinstance(node, ast.ClassDef):
+            self._visit_all(node.decorator_list + node.bases + node.keywords)
+            self._scopes.append(None)
+            inner = node.body
+        elif isinstance(node, _FUNCTION_SCOPES):
+            args = node.args
+            parameters = args.posonlyargs + args.args + args.kwonlyargs + [args.vararg, args.kwarg]
+            self._visit_all(getattr(node, 'decorator_list', []) + args.defaults + args.kw_defaults)
+            self._visit_all([arg.annotation for arg in parameters if arg] + [getattr(node, 'returns', None)])
+            body = node.body if isinstance(node.body, list) else [node.body]
+            bound, declared_global = _scope_bindings(body)
+            bound |= {arg.arg for arg in parameters if arg}
+            self._scopes.append((bound - declared_global, declared_global))
+            inner = body
+        else:
+            first, *rest = node.generators
+            self.visit(first.iter)
+            bound = {name.id for generator in node.generators for name in ast.walk(generator.target)
+                     if isinstance(name, ast.Name)}
+            self._scopes.append((bound, set()))
+            inner = [first.target] + first.ifs
+            for generator in rest:
+                inner += [generator.target, generator.iter] + generator.ifs
+            inner += [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+        try:
+            self._visit_all(inner)
+        finally:
+            self._scopes.pop()
+
+    def _is_rebound(self, name):
+        """Whether name here refers to the learner's own binding rather than the builtin"""
+        for scope in reversed(self._scopes):
+            # Class bodies do not enclose their methods, and are not trusted themselves
+            if scope is None:
+                continue
+            bound, declared_global = scope
+            if name in declared_global:
+                break
+            if name in bound:
+                return True
+        # A module-level name falls back to the builtin until it is first bound
+        first = self._module_bound.get(name)
+        return first is not None and first < self._statement
+
+    def _is_dunder(self, name):
+        return name.startswith('__') and name.endswith('__') and name not in self.policy.allowed_dunders
+
+    def _is_forbidden_attribute(self, name, owner):
+        """Dunders and frame internals anywhere; forbidden names (math.open) on modules only"""
+        if self._is_dunder(name) or name in self.policy.FORBIDDEN_ATTRIBUTES:
+            return True
+        return (name in self.policy.forbidden_names
+                and isinstance(owner, ast.Name) and owner.id in self._imported)
+
+    def check_Import(self, node):
+        for alias in node.names:
+            if alias.name not in self.policy.allowed_imports:
+                raise PolicyViolation(f"Import not allowed: {alias.name}")
+
+    def check_ImportFrom(self, node):
+        if node.level or node.module not in self.policy.allowed_imports:
+            raise PolicyViolation(f"Import not allowed: {node.module}")
+
+    def check_Name(self, node):
+        if self._is_dunder(node.id):
+            raise PolicyViolation(f"Forbidden operation detected: {node.id}")
+        # Any reference counts, not only a call (f = open); binding the name yourself
+        # (file = 'notes.txt') is fine, but deleting it would uncover the builtin again
+        if node.id in self.policy.forbidden_names:
+            if isinstance(node.ctx, ast.Del) or (isinstance(node.ctx, ast.Load) and not self._is_rebound(node.id)):
+                raise PolicyViolation(f"Forbidden operation detected: {node.id}")
+        # getattr = ...; g = getattr would hide the lookup from check_Call
+        if (node.id in self.policy.DYNAMIC_LOOKUPS and isinstance(node.ctx, ast.Load)
+                and id(node) not in self._called):
+            raise PolicyViolation(f"Forbidden operation detected: {node.id}")
+
+    def check_Attribute(self, node):
+        # Reading math.open is as dangerous as open; self.input is the learner's own attribute
+        if self._is_forbidden_attribute(node.attr, node.value):
+            raise PolicyViolation(f"Forbidden attribute access: {node.attr}")
+
+    def check_Call(self, node):
+        self._called.add(id(node.func))
+
+        # getattr(obj, '__class__') would sidestep the attribute check above, and a
+        # computed name (getattr(obj, d + 'class' + d)) cannot be checked at all
+        if isinstance(node.func, ast.Name) and node.func.id in self.policy.DYNAMIC_LOOKUPS:
+            name = node.args[1] if len(node.args) > 1 else None
+            if any(isinstance(arg, ast.Starred) for arg in node.args) or not (
+                    isinstance(name, ast.Constant) and isinstance(name.value, str)):
+                raise PolicyViolation(f"Forbidden attribute access: {node.func.id}() needs a literal attribute name")
+            if self._is_forbidden_attribute(name.value, node.args[0]):
+                raise PolicyViolation(f"Forbidden attribute access: {name.value}")
+
+
+def _freeze(value):
+    """Turn a config value into something hashable for the policy cache"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted(value))
+    return value
+
+
+@lru_cache(maxsize=128)
+def _cached_policy(frozen_config):
+    return SafetyPolicy.from_config(dict(frozen_config))
+
+
+def get_policy(config=None):
+    """Get the compiled policy for a config dict, building it only once"""
+    if isinstance(config, SafetyPolicy):
+        return config
+    return _cached_policy(_freeze(config or {}))
+
+
+DEFAULT_POLICY = get_policy()
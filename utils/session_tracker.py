@@ -0,0 +1,157 @@
+import psycopg2
+import threading
+import atexit
+import time
+import uuid
+import os
+from datetime import datetime, timedelta
+from utils.db_pool import get_pool
+
+# Write the sessions' current totals; re-sent or late heartbeats never move a session back.
+# Users' last_active follows their latest heartbeat, so the guest reaper sees browsing too;
+# their rows are locked in id order so concurrent flushes cannot deadlock. NO KEY UPDATE
+# (last_active is not a key) leaves the KEY SHARE locks of learners' own FK writes free.
+HEARTBEAT_SQL = """
+    WITH h AS (
+        SELECT * FROM unnest(%s::uuid[], %s::int[], %s::timestamp[], %s::timestamp[], %s::int[], %s::int[], %s::int[])
+             AS h(session_key, user_id, session_start, session_end, activities, exercises, tutorials)
+    ),
+    seen AS (
+        SELECT user_id, MAX(session_end) AS last_seen FROM h WHERE user_id IS NOT NULL GROUP BY user_id
+    ),
+    locked AS (
+        SELECT u.id FROM users u
+        WHERE u.id IN (SELECT user_id FROM seen)
+        ORDER BY u.id
+        FOR NO KEY UPDATE
+    ),
+    active AS (
+        UPDATE users u
+        SET last_active = s.last_seen
+        FROM seen s
+        WHERE u.id = s.user_id AND u.id IN (SELECT id FROM locked)
+          AND (u.last_active IS NULL OR u.last_active < s.last_seen)
+    )
+    INSERT INTO learning_sessions (session_key, user_id, session_start, session_end,
+                                   activities_count, exercises_completed, tutorials_completed)
+    SELECT h.session_key, u.id, h.session_start, h.session_end, h.activities, h.exercises, h.tutorials
+    FROM h
+    -- A user deleted meanwhile (e.g. a reaped guest) must not fail the whole batch
+    LEFT JOIN users u ON u.id = h.user_id
+    ON CONFLICT (session_key) DO UPDATE
+    SET user_id = COALESCE(EXCLUDED.user_id, learning_sessions.user_id),
+        session_end = EXCLUDED.session_end,
+        activities_count = EXCLUDED.activities_count,
+        exercises_completed = EXCLUDED.exercises_completed,
+        tutorials_completed = EXCLUDED.tutorials_completed
+    WHERE learning_sessions.session_end <= EXCLUDED.session_end
+"""
+
+
+class LearningSession:
+    """In-memory counters of one learning session"""
+
+    __slots__ = ('key', 'user_id', 'start', 'last_seen', 'activities', 'exercises', 'tutorials', 'dirty')
+
+    def __init__(self, user_id, now):
+        self.key = uuid.uuid4().hex
+        self.user_id = user_id
+        self.start = now
+        self.last_seen = now
+        self.activities = 0
+        self.exercises = 0
+        self.tutorials = 0
+        self.dirty = True
+
+
+class SessionTracker:
+    """Process-wide learning session counters, flushed to learning_sessions as batched heartbeats"""
+
+    def __init__(self, flush_interval=30.0, idle_timeout=timedelta(minutes=30)):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.flush_interval = flush_interval
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # Browser session id -> its current LearningSession
+        self._sessions = {}
+
+        flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        flusher.start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except psycopg2.Error:
+                pass  # Sessions stay dirty and are sent with the next heartbeat
+
+    def record(self, browser_session, user_id=None, kind=None):
+        """Count a page view (kind None) or an 'activity', 'exercise' or 'tutorial' in memory"""
+        now = datetime.now()
+        with self._lock:
+            session = self._sessions.get(browser_session)
+            # Coming back after the idle timeout starts a new learning session
+            if session is None or now - session.last_seen > self.idle_timeout:
+                session = self._sessions[browser_session] = LearningSession(user_id, now)
+
+            session.last_seen = now
+            session.dirty = True
+            if user_id is not None:
+                session.user_id = user_id
+            if kind is not None:
+                session.activities += 1
+            if kind == 'exercise':
+                session.exercises += 1
+            elif kind == 'tutorial':
+                session.tutorials += 1
+
+    def flush(self):
+        """Send one heartbeat for every session changed since the last one, drop idle sessions"""
+        now = datetime.now()
+        with self._lock:
+            dirty = [session for session in self._sessions.values() if session.dirty]
+            for browser_session, session in list(self._sessions.items()):
+                if not session.dirty and now - session.last_seen > self.idle_timeout:
+                    del self._sessions[browser_session]
+            if not dirty:
+                return
+            rows = [(session.key, session.user_id, session.start, session.last_seen,
+                     session.activities, session.exercises, session.tutorials) for session in dirty]
+            for session in dirty:
+                session.dirty = False
+
+        try:
+            conn = get_pool(self.connection_params).connect()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(HEARTBEAT_SQL, [list(column) for column in zip(*rows)])
+                conn.commit()
+            finally:
+                conn.close()
+        except psycopg2.Error:
+            # Send these sessions again with the next heartbeat
+            with self._lock:
+                for session in dirty:
+                    session.dirty = True
+            raise
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_session_tracker():
+    """Get the shared session tracker, created on first use"""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = SessionTracker()
+            atexit.register(_tracker.flush)
+        return _tracker
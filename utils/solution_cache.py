@@ -0,0 +1,82 @@
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Modules whose results change from run to run unless the run is seeded
+NONDETERMINISTIC_MODULES = frozenset({'random'})
+
+
+def fingerprint(code):
+    """Hash of the code's AST, so formatting and comments don't matter"""
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return None
+    return hashlib.sha256(ast.dump(tree).encode('utf-8')).hexdigest()
+
+
+def imported_modules(code):
+    """Top-level names of the modules the code imports, or None if it can't tell"""
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return None
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split('.')[0])
+        elif (isinstance(node, ast.Name) and node.id == '__import__') or \
+                (isinstance(node, ast.Attribute) and node.attr == '__import__'):
+            # Any reference to __import__ (including an alias of it) can load any module
+            return None
+    return modules
+
+
+def is_deterministic(code):
+    """Whether every run of the code gives the same result, judged from what it imports"""
+    modules = imported_modules(code)
+    return modules is not None and not modules & NONDETERMINISTIC_MODULES
+
+
+class SolutionCache:
+    """Bounded LRU of validation verdicts shared by every session in the process"""
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Get a cached verdict and mark it as recently used"""
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return verdict
+
+    def put(self, key, verdict):
+        """Store a verdict, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached verdict (e.g. after an exercise definition changes)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+SHARED_SOLUTION_CACHE = SolutionCache()
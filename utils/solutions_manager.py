@@ -0,0 +1,282 @@
+import streamlit as st
+import psycopg2
+import threading
+import atexit
+import time
+import os
+import logging
+from utils.activity_feed import record_event, get_feed, SOLUTION_SHARED
+from utils.db_pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+# Set the given solutions' counters from solution_likes, and move their authors'
+# leaderboard scores by the same amount, so a score always equals the sum of its
+# author's counters. Counters are recomputed rather than incremented: likes lost with
+# a crashed process are picked up again and running twice never counts twice.
+RECOUNT_LIKES_SQL = """
+    WITH counted AS (
+        SELECT s.id, s.user_id, s.likes AS old_likes,
+               (SELECT COUNT(*) FROM solution_likes l WHERE l.solution_id = s.id) AS likes
+        FROM shared_solutions s
+        WHERE s.id = ANY(%(ids)s::int[])
+    ),
+    bumped AS (
+        UPDATE shared_solutions s
+        SET likes = c.likes
+        FROM counted c
+        WHERE s.id = c.id AND s.likes <> c.likes
+        RETURNING c.user_id, c.likes - c.old_likes AS delta
+    ),
+    scored AS (
+        INSERT INTO user_scores (user_id, solution_likes, updated_at)
+        SELECT b.user_id, SUM(b.delta), now()
+        FROM bumped b
+        JOIN users u ON u.id = b.user_id AND u.password_hash <> ''
+        GROUP BY b.user_id
+        ORDER BY b.user_id
+        ON CONFLICT (user_id) DO UPDATE
+        SET solution_likes = user_scores.solution_likes + EXCLUDED.solution_likes,
+            updated_at = EXCLUDED.updated_at
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM bumped
+"""
+
+
+def recount_likes(cursor, ids):
+    """Recompute the counters of these solutions inside the caller's transaction, returns how many changed"""
+    # NO KEY UPDATE, in id order: concurrent recounts cannot deadlock, and likes being
+    # inserted meanwhile only need KEY SHARE on the solution, which it does not block
+    cursor.execute("""
+        SELECT id FROM shared_solutions WHERE id = ANY(%s::int[]) ORDER BY id FOR NO KEY UPDATE
+    """, (ids,))
+    # A new statement, so the recount sees every like committed before the locks were taken
+    cursor.execute(RECOUNT_LIKES_SQL, {'ids': ids})
+    return cursor.fetchone()[0]
+
+
+class LikeCounter:
+    """Process-wide set of liked solutions whose counters are refreshed in batches"""
+
+    def __init__(self, batch_size=50, flush_interval=2.0):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = {}
+        # Likes of the flush in progress, still shown as pending until it commits
+        self._flushing = {}
+        self._last_flush = time.monotonic()
+
+        # Quiet periods still get flushed by a background thread
+        flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        flusher.start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except psycopg2.Error:
+                pass  # Pending likes are kept and retried on the next flush
+
+    def add(self, solution_id):
+        """Queue one like; likes of one solution share a single counter refresh"""
+        with self._lock:
+            self._pending[solution_id] = self._pending.get(solution_id, 0) + 1
+            due = (sum(self._pending.values()) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            try:
+                self.flush()
+            except psycopg2.Error as e:
+                # The like itself is committed; its counter catches up on a later flush
+                logger.warning("Flushing likes failed, their solutions are kept pending: %s", e)
+
+    def pending(self, solution_id):
+        """Likes queued for a solution but not yet in its counter"""
+        with self._lock:
+            return self._pending.get(solution_id, 0) + self._flushing.get(solution_id, 0)
+
+    def flush(self):
+        """Refresh the counters of every liked solution in a single transaction"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            # One flush at a time; likes arriving meanwhile wait for the next one
+            if self._flushing or not self._pending:
+                return
+            flushing, self._pending = self._pending, {}
+            self._flushing = flushing
+
+        # Postgres is written outside the lock, so pending() never waits on it
+        try:
+            conn = get_pool(self.connection_params).connect()
+            try:
+                recount_likes(conn.cursor(), sorted(flushing))
+                conn.commit()
+            except psycopg2.Error:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+        except psycopg2.Error:
+            with self._lock:
+                for solution_id, count in flushing.items():
+                    self._pending[solution_id] = self._pending.get(solution_id, 0) + count
+            raise
+        finally:
+            with self._lock:
+                self._flushing = {}
+
+
+_counter = None
+_counter_lock = threading.Lock()
+
+
+def get_like_counter():
+    """Get the shared like counter, created on first use"""
+    global _counter
+    with _counter_lock:
+        if _counter is None:
+            _counter = LikeCounter()
+            atexit.register(_counter.flush)
+        return _counter
+
+
+class SolutionsManager:
+    """Store shared solutions and list them per exercise"""
+
+    def __init__(self):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+
+    def _get_connection(self):
+        """Get database connection"""
+        try:
+            return get_pool(self.connection_params).connect()
+        except Exception as e:
+            st.error(f"Database connection failed: {str(e)}")
+            return None
+
+    def share_solution(self, user_id, exercise_id, title, code, description=None):
+        """Store a public solution, returns (success, message)"""
+        conn = self._get_connection()
+        if not conn:
+            return False, "Database connection failed"
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO shared_solutions (user_id, exercise_id, title, code, description)
+                VALUES (%s, %s, %s, %s, %s) RETURNING id
+            """, (user_id, exercise_id, title, code, description))
+            solution_id = cursor.fetchone()[0]
+
+            record_event(cursor, user_id, SOLUTION_SHARED, exercise_id)
+            conn.commit()
+            get_feed().invalidate()
+            return True, f"Solution shared successfully with ID: {solution_id}"
+
+        except Exception as e:
+            conn.rollback()
+            return False, f"Error sharing solution: {str(e)}"
+        finally:
+            cursor.close()
+            conn.close()
+
+    def get_solutions(self, exercise_id, user_id=None, after=None, limit=10):
+        """One page of an exercise's public solutions, most liked first.
+
+        `after` is the (likes, id) cursor of the last solution on the previous page.
+        Returns (solutions, next cursor or None on the last page).
+        """
+        conn = self._get_connection()
+        if not conn:
+            return [], None
+
+        try:
+            cursor = conn.cursor()
+            likes, last_id = after or (None, None)
+            # Row comparison on the index columns, so each page is a short index range scan
+            cursor.execute("""
+                SELECT s.id, s.title, u.username, s.code, s.description, s.likes, s.created_at,
+                       EXISTS (
+                           SELECT 1 FROM solution_likes l
+                           WHERE l.solution_id = s.id AND l.user_id = %(user_id)s
+                       )
+                FROM shared_solutions s
+                JOIN users u ON u.id = s.user_id
+                WHERE s.exercise_id = %(exercise_id)s AND s.is_public
+                  AND (%(likes)s::int IS NULL OR (s.likes, s.id) < (%(likes)s, %(last_id)s))
+                ORDER BY s.likes DESC, s.id DESC
+                LIMIT %(limit)s
+            """, {'exercise_id': exercise_id, 'user_id': user_id, 'likes': likes,
+                  'last_id': last_id, 'limit': limit + 1})
+
+            rows = cursor.fetchall()
+            solutions = []
+            for row in rows[:limit]:
+                solutions.append({
+                    'id': row[0],
+                    'title': row[1],
+                    'author': row[2],
+                    'code': row[3],
+                    'description': row[4],
+                    'likes': row[5],
+                    'created_at': row[6],
+                    'liked': row[7]
+                })
+
+            next_cursor = None
+            if len(rows) > limit:
+                next_cursor = (solutions[-1]['likes'], solutions[-1]['id'])
+            return solutions, next_cursor
+
+        except Exception as e:
+            st.error(f"Error fetching shared solutions: {str(e)}")
+            return [], None
+        finally:
+            cursor.close()
+            conn.close()
+
+    def like_solution(self, solution_id, user_id):
+        """Record a user's like, returns False if they already liked it"""
+        conn = self._get_connection()
+        if not conn:
+            return False
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO solution_likes (solution_id, user_id, created_at)
+                VALUES (%s, %s, now())
+                ON CONFLICT (solution_id, user_id) DO NOTHING
+                RETURNING solution_id
+            """, (solution_id, user_id))
+            liked = cursor.fetchone() is not None
+            conn.commit()
+
+            # The hot counter row is only written by the batched flush
+            if liked:
+                get_like_counter().add(solution_id)
+            return liked
+
+        except Exception as e:
+            conn.rollback()
+            st.error(f"Error liking solution: {str(e)}")
+            return False
+        finally:
+            cursor.close()
+            conn.close()
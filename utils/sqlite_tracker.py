@@ -0,0 +1,178 @@
+import streamlit as st
+import sqlite3
+import threading
+import atexit
+import time
+import uuid
+import os
+import re
+import streamlit.components.v1 as components
+from utils.progress_tracker import ProgressTracker
+from utils.progress_state import ProgressState
+
+
+class SQLiteProgressStore:
+    """Process-wide SQLite (WAL) store of serialized progress states with batched writes"""
+
+    def __init__(self, path, batch_size=50, flush_interval=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flush = time.monotonic()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS progress_states (
+                owner_id TEXT PRIMARY KEY,
+                state BLOB NOT NULL,
+                updated_at INTEGER NOT NULL
+            )
+        """)
+
+        # Quiet periods still get flushed by a background thread
+        flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        flusher.start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass  # Pending states are kept and retried on the next flush
+
+    def load(self, owner_id):
+        """Load a progress state, preferring a write that is still pending"""
+        with self._lock:
+            data = self._pending.get(owner_id)
+            if data is None:
+                row = self._conn.execute(
+                    "SELECT state FROM progress_states WHERE owner_id = ?", (owner_id,)
+                ).fetchone()
+                data = row[0] if row else None
+        try:
+            return ProgressState.from_bytes(data) if data else None
+        except ValueError:
+            return None  # Written by an incompatible version, start fresh
+
+    def save(self, owner_id, state):
+        """Queue a state write; repeated saves of one owner coalesce into one row write"""
+        with self._lock:
+            self._pending[owner_id] = state.to_bytes()
+            due = (len(self._pending) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+            if due:
+                self._flush_locked()
+
+    def flush(self):
+        """Write every pending state in a single transaction"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        now = int(time.time())
+        rows = [(owner_id, data, now) for owner_id, data in self._pending.items()]
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany("""
+                INSERT INTO progress_states (owner_id, state, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(owner_id) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at
+            """, rows)
+            self._conn.execute("COMMIT")
+            self._pending.clear()
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Get the shared store, opening it on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SQLiteProgressStore(os.getenv('PROGRESS_DB_PATH', 'progress.sqlite3'))
+            atexit.register(_store.flush)
+        return _store
+
+
+# Guests are recognised across browser sessions by this cookie
+GUEST_COOKIE = 'learn_guest'
+GUEST_COOKIE_MAX_AGE = 365 * 24 * 3600
+_GUEST_TOKEN = re.compile(r'[0-9a-f]{32}')
+
+
+def _remember_guest(token):
+    """Store the guest token in a browser cookie, so a new session finds the same progress"""
+    components.html(
+        f"<script>window.parent.document.cookie = "
+        f"'{GUEST_COOKIE}={token}; max-age={GUEST_COOKIE_MAX_AGE}; path=/; SameSite=Strict';</script>",
+        height=0
+    )
+
+
+class SQLiteProgressTracker(ProgressTracker):
+    """Progress tracker persisted to a local SQLite file, for running without Postgres"""
+
+    def __init__(self):
+        self.store = get_store()
+        # Loads the owner's stored progress into the session
+        self.state
+
+    @property
+    def owner_id(self):
+        """Logged-in user id, or this browser's guest token; re-read on every access so login takes effect"""
+        if st.session_state.get('is_logged_in', False) and st.session_state.get('user_id'):
+            return f"user:{st.session_state.user_id}"
+        return f"guest:{self._guest_token()}"
+
+    def _guest_token(self):
+        """The guest token from this session, the browser's cookie, or a new one"""
+        token = st.session_state.get('guest_token')
+        if token:
+            return token
+
+        token = st.context.cookies.get(GUEST_COOKIE)
+        if not (token and _GUEST_TOKEN.fullmatch(token)):
+            # Earlier versions kept the token in ?guest=; adopt it once and take it out of the URL
+            legacy_token = st.query_params.get('guest')
+            token = legacy_token if legacy_token and _GUEST_TOKEN.fullmatch(legacy_token) else uuid.uuid4().hex
+            if 'guest' in st.query_params:
+                del st.query_params['guest']
+            _remember_guest(token)
+
+        st.session_state.guest_token = token
+        return token
+
+    @property
+    def state(self):
+        """The session's progress state, reloaded when the owner changes (e.g. on login or logout)"""
+        owner_id = self.owner_id
+        if st.session_state.get('progress_owner') != owner_id:
+            stored = self.store.load(owner_id)
+            previous_owner = st.session_state.get('progress_owner') or ''
+            if stored is None and previous_owner.startswith('guest:') and owner_id.startswith('user:'):
+                # A first login keeps what was done as a guest
+                stored = st.session_state.progress_state
+                self.store.save(owner_id, stored)
+            st.session_state.progress_state = stored or ProgressState()
+            st.session_state.progress_owner = owner_id
+        return st.session_state.progress_state
+
+    def _save(self):
+        """Queue the current state for the next batched write"""
+        try:
+            self.store.save(self.owner_id, self.state)
+        except sqlite3.Error as e:
+            st.error(f"Error saving progress: {str(e)}")
@@ -0,0 +1,220 @@
+import streamlit as st
+import psycopg2
+import threading
+import time
+import os
+from utils.db_pool import get_pool
+
+# Below this many rows an exact COUNT(*) is cheap, and reltuples may not be set yet
+EXACT_COUNT_THRESHOLD = 10000
+
+# Seconds each snapshot query may take before the previous snapshot is served instead
+REFRESH_TIMEOUT = 5
+
+
+def error_kind(message):
+    """Short error label for common_errors, e.g. 'NameError' or 'Expected output'"""
+    if not message:
+        return None
+    return message.split('\n', 1)[0].split(':', 1)[0].strip()[:50] or None
+
+
+class StatsManager:
+    """Read the incrementally maintained exercise_stats aggregates"""
+
+    def __init__(self):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+
+    def _get_connection(self):
+        """Get database connection"""
+        try:
+            return get_pool(self.connection_params).connect()
+        except Exception as e:
+            st.error(f"Database connection failed: {str(e)}")
+            return None
+
+    def get_exercise_stats(self, limit=None):
+        """Per-exercise attempts, success rate and completions, most completed first"""
+        conn = self._get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT exercise_id, total_attempts, correct_attempts, successful_completions, common_errors
+                FROM exercise_stats
+                ORDER BY successful_completions DESC, total_attempts DESC
+                LIMIT %s
+            """, (limit,))
+
+            stats = []
+            for row in cursor.fetchall():
+                errors = row[4] or {}
+                stats.append({
+                    'exercise_id': row[0],
+                    'total_attempts': row[1],
+                    'correct_attempts': row[2],
+                    'success_rate': round(row[2] / row[1] * 100, 1) if row[1] else 0,
+                    'completions': row[3],
+                    'common_errors': sorted(errors.items(), key=lambda item: item[1], reverse=True)
+                })
+
+            return stats
+
+        except Exception as e:
+            st.error(f"Error fetching exercise statistics: {str(e)}")
+            return []
+        finally:
+            cursor.close()
+            conn.close()
+
+
+def estimated_count(cursor, table):
+    """Planner row estimate for a large table, exact count for a small one"""
+    cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", (table,))
+    estimate = cursor.fetchone()[0]
+    # reltuples is -1 until the table is first vacuumed or analyzed
+    if estimate < EXACT_COUNT_THRESHOLD:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+    return int(estimate)
+
+
+class PlatformStats:
+    """Process-wide snapshot of the global platform metrics, refreshed periodically"""
+
+    def __init__(self, refresh_interval=60.0):
+        self.connection_params = {
+            'host': os.getenv('PGHOST'),
+            'port': os.getenv('PGPORT'),
+            'database': os.getenv('PGDATABASE'),
+            'user': os.getenv('PGUSER'),
+            'password': os.getenv('PGPASSWORD')
+        }
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        # Replaced whole by each refresh, never modified in place
+        self._snapshot = {}
+        self._refreshing = False
+        self._next_refresh = 0.0
+
+    def snapshot(self):
+        """The cached metrics; only one visitor per refresh_interval queries Postgres"""
+        with self._lock:
+            # Only one visitor refreshes, outside the lock; everyone else gets the previous snapshot
+            refresh = not self._refreshing and time.monotonic() >= self._next_refresh
+            if refresh:
+                self._refreshing = True
+                self._next_refresh = time.monotonic() + self.refresh_interval
+            snapshot = self._snapshot
+
+        if refresh:
+            try:
+                # A failed refresh keeps serving the previous snapshot
+                computed = self._compute()
+                if computed:
+                    with self._lock:
+                        self._snapshot = snapshot = computed
+            finally:
+                with self._lock:
+                    self._refreshing = False
+        return dict(snapshot)
+
+    def _compute(self):
+        """Every metric from counters, rollups or estimates, never a scan of a large table"""
+        try:
+            conn = get_pool(dict(self.connection_params, connect_timeout=REFRESH_TIMEOUT,
+                                 options=f"-c statement_timeout={REFRESH_TIMEOUT * 1000}")).connect()
+        except Exception:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COALESCE(SUM(total_attempts), 0),
+                       COALESCE(SUM(correct_attempts), 0),
+                       COALESCE(SUM(successful_completions), 0)
+                FROM exercise_stats
+            """)
+            attempts, correct, completions = cursor.fetchone()
+
+            # Registered learners, whether or not they have scored yet. Guests are few (the
+            # reaper removes them after a TTL) and counted exactly from their partial index.
+            cursor.execute("SELECT COUNT(*) FROM users WHERE password_hash = ''")
+            guests = cursor.fetchone()[0]
+            learners = max(estimated_count(cursor, 'users') - guests, 0)
+
+            cursor.execute("""
+                SELECT COUNT(DISTINCT user_id) FROM user_activity_hourly
+                WHERE bucket >= date_trunc('day', now())
+            """)
+            active_today = cursor.fetchone()[0]
+
+            cursor.execute("""
+                SELECT COUNT(*) FROM forum_posts WHERE created_at >= now() - interval '7 days'
+            """)
+            posts_this_week = cursor.fetchone()[0]
+
+            # Session analytics over the last week's heartbeats (range scans on session_start)
+            cursor.execute("""
+                SELECT AVG(EXTRACT(EPOCH FROM session_end - session_start)) / 60
+                FROM learning_sessions
+                WHERE session_start >= now() - interval '7 days' AND session_end IS NOT NULL
+            """)
+            average_session = cursor.fetchone()[0]
+
+            # Share of last week's learners who came back this week
+            cursor.execute("""
+                WITH previous AS (
+                    SELECT DISTINCT user_id FROM learning_sessions
+                    WHERE session_start >= now() - interval '14 days'
+                      AND session_start < now() - interval '7 days'
+                      AND user_id IS NOT NULL
+                )
+                SELECT COUNT(*),
+                       COUNT(*) FILTER (WHERE EXISTS (
+                           SELECT 1 FROM learning_sessions s
+                           WHERE s.user_id = p.user_id AND s.session_start >= now() - interval '7 days'
+                       ))
+                FROM previous p
+            """)
+            previous_learners, returned = cursor.fetchone()
+
+            return {
+                'learners': learners,
+                'active_today': active_today,
+                'submissions': attempts,
+                'success_rate': round(correct / attempts * 100, 1) if attempts else 0,
+                'exercises_completed': completions,
+                'solutions_shared': estimated_count(cursor, 'shared_solutions'),
+                'posts': estimated_count(cursor, 'forum_posts'),
+                'posts_this_week': posts_this_week,
+                'average_session_minutes': round(float(average_session or 0)),
+                'return_rate': round(returned / previous_learners * 100) if previous_learners else 0
+            }
+
+        except Exception:
+            return None
+        finally:
+            cursor.close()
+            conn.close()
+
+
+_platform_stats = None
+_platform_stats_lock = threading.Lock()
+
+
+def get_platform_stats():
+    """Get the shared platform statistics, created on first use"""
+    global _platform_stats
+    with _platform_stats_lock:
+        if _platform_stats is None:
+            _platform_stats = PlatformStats()
+        return _platform_stats
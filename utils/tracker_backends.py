@@ -0,0 +1,146 @@
+import streamlit as st
+import logging
+import os
+from typing import Protocol, runtime_checkable
+
+# Tried in order until one starts; PROGRESS_BACKENDS overrides it, e.g. "sqlite,memory"
+DEFAULT_BACKENDS = ('postgres', 'sqlite', 'memory')
+
+logger = logging.getLogger(__name__)
+
+
+class BackendUnavailable(Exception):
+    """Raised by a backend factory when its store cannot be reached"""
+
+
+@runtime_checkable
+class ProgressTrackerBackend(Protocol):
+    """Methods every progress tracker implements (checked by test_tracker_conformance.py)"""
+
+    def complete_tutorial(self, tutorial_id, category=None):
+        """Mark a tutorial as completed; completing it again changes nothing"""
+
+    @property
+    def owner_id(self):
+        """Stable id of the user or guest whose progress this is, e.g. to seed replays"""
+
+    def complete_exercise(self, exercise_id, category=None):
+        """Mark an exercise as completed; completing it again only counts another solve"""
+
+    def is_tutorial_completed(self, tutorial_id):
+        """Whether the tutorial is completed"""
+
+    def is_exercise_completed(self, exercise_id):
+        """Whether the exercise is completed"""
+
+    def get_exercise_attempt(self, exercise_id):
+        """Number of times the exercise was solved, which picks its replay seed"""
+
+    def get_completed_tutorials_count(self):
+        """Number of completed tutorials"""
+
+    def get_completed_exercises_count(self):
+        """Number of completed exercises"""
+
+    def get_category_progress(self, category):
+        """Percent of a category's tutorials and exercises completed"""
+
+    def get_overall_progress(self):
+        """Percent of all tutorials and exercises completed"""
+
+    def add_achievement(self, achievement):
+        """Award an achievement, returns False if it was already earned"""
+
+    def get_achievements(self):
+        """Titles of every earned achievement"""
+
+    def get_recent_achievements(self, limit=5):
+        """Titles of the latest earned achievements, newest first"""
+
+    def get_progress_data(self):
+        """Completed items, achievements, category progress and activity dates"""
+
+    def reset_progress(self):
+        """Forget all completions and achievements"""
+
+    def touch(self):
+        """Note a page view"""
+
+
+def _memory_backend():
+    from utils.progress_tracker import ProgressTracker
+    return ProgressTracker()
+
+
+def _sqlite_backend():
+    import sqlite3
+    from utils.sqlite_tracker import SQLiteProgressTracker
+    try:
+        return SQLiteProgressTracker()
+    except (sqlite3.Error, OSError) as e:
+        raise BackendUnavailable(f"SQLite progress store cannot be opened: {e}") from e
+
+
+def _postgres_backend():
+    import psycopg2
+    from utils.db_adapter import DatabaseAdapter
+    from utils.db_pool import get_pool
+    if not os.getenv('PGHOST') and not os.getenv('PGDATABASE'):
+        raise BackendUnavailable("PostgreSQL is not configured (set PGHOST/PGDATABASE)")
+    adapter = DatabaseAdapter()
+    # The adapter connects lazily, so check the database is up before choosing it
+    try:
+        get_pool(adapter.connection_params).connect().close()
+    except psycopg2.Error as e:
+        raise BackendUnavailable(f"PostgreSQL is not reachable: {e}") from e
+    return adapter
+
+
+# name -> factory, and whether the backend stores progress in Postgres
+BACKENDS = {}
+
+
+def register_backend(name, factory, uses_database=False):
+    """Make a tracker backend available under a name"""
+    BACKENDS[name] = (factory, uses_database)
+
+
+register_backend('memory', _memory_backend)
+register_backend('sqlite', _sqlite_backend)
+register_backend('postgres', _postgres_backend, uses_database=True)
+
+
+def backend_order():
+    """Backend names to try, from PROGRESS_BACKENDS or the default order"""
+    configured = os.getenv('PROGRESS_BACKENDS')
+    if not configured:
+        return list(DEFAULT_BACKENDS)
+    return [name.strip() for name in configured.split(',') if name.strip()]
+
+
+def create_tracker(names=None):
+    """Start the first backend that works, returns (name, tracker)"""
+    for name in names or backend_order():
+        if name not in BACKENDS:
+            logger.warning("Unknown progress backend %r, skipping it", name)
+            continue
+        factory, _ = BACKENDS[name]
+        try:
+            return name, factory()
+        except (BackendUnavailable, ImportError) as e:
+            logger.warning("Progress backend %s unavailable, trying the next one: %s", name, e)
+    # Session state always works
+    return 'memory', _memory_backend()
+
+
+def init_progress_tracker():
+    """Create the session's tracker on first run and count this page view"""
+    if 'progress_tracker' not in st.session_state:
+        name, tracker = create_tracker()
+        st.session_state.progress_tracker = tracker
+        st.session_state.progress_backend = name
+        st.session_state.using_database = BACKENDS[name][1]
+
+    # Each rerun counts toward the learning session (in memory, flushed in batches)
+    st.session_state.progress_tracker.touch()
+    return st.session_state.progress_tracker